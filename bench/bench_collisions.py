@@ -0,0 +1,134 @@
+"""Benchmark laser-asteroid collision detection at 10 to 5000 entities.
+
+Compares the per-object reference (every laser against every asteroid via
+Laser.collides_with_asteroid) with the batched path Game.check_collisions
+uses (spatial-hash candidates, box_overlaps, then the mask stage), and
+times a full Game.check_collisions pass including its side effects.
+
+Run from the repository root:
+
+    python bench/bench_collisions.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import main  # noqa: E402
+
+SCENES = ((10, 10), (100, 50), (300, 150), (1000, 300), (5000, 500))
+REPEATS = 3
+
+
+def build_scene(n_asteroids, n_lasers, seed=2, make_asteroid=main.Asteroid, make_laser=main.Laser):
+    """Return (asteroids, lasers) spread over the play field.
+
+    Args:
+        n_asteroids: Number of asteroids
+        n_lasers: Number of lasers
+        seed: Seed for the scene layout
+        make_asteroid: Constructor or pool acquire taking (x, y, radius)
+        make_laser: Constructor or pool acquire taking (x, y)
+    """
+    random.seed(seed)
+    asteroids = [
+        make_asteroid(random.uniform(100, main.WIDTH), random.uniform(0, main.HEIGHT), random.randint(20, 50))
+        for _ in range(n_asteroids)
+    ]
+    lasers = [
+        make_laser(random.uniform(100, main.WIDTH), random.uniform(0, main.HEIGHT))
+        for _ in range(n_lasers)
+    ]
+    return asteroids, lasers
+
+
+def reference_hits(asteroids, lasers):
+    """Return (laser, asteroid) index pairs found by the per-object checks."""
+    return [
+        (i, j)
+        for i, laser in enumerate(lasers)
+        for j, asteroid in enumerate(asteroids)
+        if laser.collides_with_asteroid(asteroid)
+    ]
+
+
+def batched_hits(asteroids, lasers, grid):
+    """Return (laser, asteroid) index pairs found the way check_collisions does."""
+    reach = [asteroid.bounding_radius for asteroid in asteroids]
+    lefts = [asteroid.x - r for asteroid, r in zip(asteroids, reach)]
+    rights = [asteroid.x + r for asteroid, r in zip(asteroids, reach)]
+    tops = [asteroid.y - r for asteroid, r in zip(asteroids, reach)]
+    bottoms = [asteroid.y + r for asteroid, r in zip(asteroids, reach)]
+    grid.clear()
+    for j in range(len(asteroids)):
+        grid.insert(j, lefts[j], tops[j], rights[j], bottoms[j])
+    hits = []
+    for i, laser in enumerate(lasers):
+        left, top, right, bottom = laser.get_rect()
+        candidates = grid.query(left, top, right, bottom)
+        for j in main.box_overlaps(lefts, tops, rights, bottoms, left, top, right, bottom, candidates):
+            if asteroids[j].mask_overlaps(main.LASER_MASK, left, top):
+                hits.append((i, j))
+    return hits
+
+
+def best_time(function, *args):
+    """Return (result, best wall time in ms over REPEATS runs)."""
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def main_benchmark():
+    """Print detection and full-pass timings for each scene size."""
+    game = main.Game()
+    game.asteroid_pool.release_all(game.asteroids)
+    # Keep the ship clear of the scene so only laser hits are timed
+    game.ship.x, game.ship.y = -400, -400
+    grid = main.SpatialHash(main.WIDTH, main.HEIGHT, main.SPATIAL_HASH_CELL_SIZE)
+    print(f"{'asteroids':>9} {'lasers':>6} {'hits':>5} {'reference ms':>13} {'batched ms':>11} {'full pass ms':>13}")
+    for n_asteroids, n_lasers in SCENES:
+        asteroids, lasers = build_scene(n_asteroids, n_lasers)
+        # Warm the rotation frame and mask caches so both paths pay the same
+        expected, _ = best_time(reference_hits, asteroids, lasers)
+        expected, reference_ms = best_time(reference_hits, asteroids, lasers)
+        hits, batched_ms = best_time(batched_hits, asteroids, lasers, grid)
+        assert sorted(hits) == expected, "batched path disagrees with the reference"
+
+        full_ms = None
+        for _ in range(REPEATS):
+            # check_collisions releases what it removes, so the scene comes
+            # from the game's pools and everything left goes back after the pass
+            pooled_asteroids, pooled_lasers = build_scene(
+                n_asteroids, n_lasers,
+                make_asteroid=game.asteroid_pool.acquire, make_laser=game.laser_pool.acquire
+            )
+            game.asteroids.extend(pooled_asteroids)
+            game.lasers.extend(pooled_lasers)
+            random.seed(1)
+            start = time.perf_counter()
+            game.check_collisions()
+            elapsed = (time.perf_counter() - start) * 1000
+            full_ms = elapsed if full_ms is None else min(full_ms, elapsed)
+            game.asteroid_pool.release_all(game.asteroids)
+            game.laser_pool.release_all(game.lasers)
+            game.explosion_pool.release_all(game.explosions)
+            game.powerup_pool.release_all(game.powerups)
+            game.score_popup_pool.release_all(game.score_popups)
+        print(
+            f"{n_asteroids:>9} {n_lasers:>6} {len(hits):>5} "
+            f"{reference_ms:>13.2f} {batched_ms:>11.2f} {full_ms:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,123 @@
+"""Measure per-entity memory and Python heap for the slotted entity classes.
+
+Reports the shallow size of one instance of each entity class (including
+its __dict__, if it has one), the size of one explosion with its spark
+columns and of a nebula's layer tuples, and the traced Python heap for
+1000 asteroids, 10k particles and 1000 explosions. Surface pixel memory is
+allocated by SDL and not included in the heap figures.
+
+Run from the repository root:
+
+    python bench/bench_memory.py
+
+The script also runs against the pre-slots src/main.py (dict-based
+explosion sparks), so before/after numbers can be compared directly.
+"""
+
+import gc
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import main  # noqa: E402
+
+
+def shallow_size(obj):
+    """Return sys.getsizeof(obj) plus its instance dict, if any."""
+    size = sys.getsizeof(obj)
+    instance_dict = getattr(obj, "__dict__", None)
+    if instance_dict is not None:
+        size += sys.getsizeof(instance_dict)
+    return size
+
+
+def traced_heap_kb(build):
+    """Return (result, KB of Python heap allocated by build())."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    allocated = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return result, allocated / 1024
+
+
+def main_benchmark():
+    """Print per-entity sizes, heap totals and a GC pass timing."""
+    game = main.Game()
+    random.seed(1)
+    entities = {
+        "Ship": game.ship,
+        "Asteroid": main.Asteroid(100, 100, 40),
+        "Boss": main.Boss(),
+        "Laser": main.Laser(1, 2),
+        "PowerUp": main.PowerUp(1, 2, "shield"),
+        "Explosion": main.Explosion(1, 2),
+        "ScorePopup": main.ScorePopup(1, 2, 50),
+        "NebulaCloud": main.NebulaCloud(10),
+        "DistortionWave": main.DistortionWave(1, 2),
+    }
+    print("Bytes per entity (object + __dict__):")
+    for name, entity in entities.items():
+        print(f"  {name:<15} {shallow_size(entity):>5}")
+
+    explosion = entities["Explosion"]
+    if hasattr(explosion, "particles"):
+        # Pre-slots layout: one dict per spark
+        spark_containers = [explosion.particles, *explosion.particles]
+    else:
+        spark_containers = [
+            getattr(explosion, name) for name in explosion.__slots__ if name.startswith("particle_")
+        ]
+    explosion_bytes = shallow_size(explosion) + sum(sys.getsizeof(item) for item in spark_containers)
+    layers = entities["NebulaCloud"].layers
+    layer_bytes = sys.getsizeof(layers) + sum(sys.getsizeof(layer) for layer in layers)
+    print(f"  Explosion with its sparks: {explosion_bytes} bytes")
+    print(f"  NebulaCloud layers:        {layer_bytes} bytes")
+
+    random.seed(2)
+    _, asteroid_kb = traced_heap_kb(lambda: [
+        main.Asteroid(random.uniform(0, main.WIDTH), random.uniform(0, main.HEIGHT), random.randint(20, 50))
+        for _ in range(1000)
+    ])
+
+    def emit_particles():
+        particles = main.ParticleSystem()
+        for _ in range(10000):
+            particles.emit(
+                random.uniform(0, main.WIDTH), random.uniform(0, main.HEIGHT),
+                (255, 200, 100), 1.0, 0.5, size=2, lifetime=40
+            )
+        return particles
+
+    _, particle_kb = traced_heap_kb(emit_particles)
+    explosions, explosion_kb = traced_heap_kb(lambda: [
+        main.Explosion(random.uniform(0, main.WIDTH), random.uniform(0, main.HEIGHT))
+        for _ in range(1000)
+    ])
+    print("Python heap (tracemalloc):")
+    print(f"  1000 asteroids   {asteroid_kb:>8.0f} KB")
+    print(f"  10k particles    {particle_kb:>8.0f} KB")
+    print(f"  1000 explosions  {explosion_kb:>8.0f} KB")
+
+    start = time.perf_counter()
+    for _ in range(200):
+        for explosion in explosions:
+            explosion.update()
+    update_us = (time.perf_counter() - start) / 200 / len(explosions) * 1e6
+    start = time.perf_counter()
+    for _ in range(100):
+        gc.collect()
+    gc_ms = (time.perf_counter() - start) / 100 * 1000
+    print(f"Explosion.update: {update_us:.2f} us per explosion")
+    print(f"Full gc.collect(): {gc_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -0,0 +1,64 @@
+"""Benchmark Starfield update and draw cost from 200 to 10000 stars.
+
+Fills the starfield through Game.create_stars with NUM_STARS raised to each
+size and times Starfield.update and Starfield.draw onto a full-screen
+surface. Cost grows linearly with the star count: every star keeps its own
+scroll speed, twinkle phase and wrap-around y, so each frame visits every
+star once. The per-star column shows the constant that multiplies it.
+
+Run from the repository root:
+
+    python bench/bench_starfield.py
+"""
+
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import pygame  # noqa: E402
+
+import main  # noqa: E402
+
+STAR_COUNTS = (200, 1000, 2000, 5000, 10000)
+FRAMES = 200
+
+
+def main_benchmark():
+    """Print update, draw and per-star timings for each starfield size."""
+    game = main.Game()
+    screen = pygame.Surface((main.WIDTH, main.HEIGHT))
+    print(f"{'stars':>6} {'update ms':>10} {'draw ms':>8} {'total ms':>9} {'us/star':>8}")
+    for count in STAR_COUNTS:
+        random.seed(1)
+        main.NUM_STARS = count
+        game.stars = main.Starfield()
+        game.create_stars()
+        # Warm the star dot sprites so only steady-state frames are timed
+        for _ in range(20):
+            game.stars.update()
+            game.stars.draw(screen)
+
+        update_s = draw_s = 0.0
+        for _ in range(FRAMES):
+            start = time.perf_counter()
+            game.stars.update()
+            middle = time.perf_counter()
+            game.stars.draw(screen)
+            update_s += middle - start
+            draw_s += time.perf_counter() - middle
+        update_ms = update_s / FRAMES * 1000
+        draw_ms = draw_s / FRAMES * 1000
+        total_ms = update_ms + draw_ms
+        print(
+            f"{count:>6} {update_ms:>10.2f} {draw_ms:>8.2f} "
+            f"{total_ms:>9.2f} {total_ms / count * 1000:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main_benchmark()
@@ -3,6 +3,9 @@ import random
 import sys
 import os
 import math
+import time
+import itertools
+from collections import OrderedDict, deque
 
 # Initialize pygame
 pygame.init()
@@ -98,6 +101,8 @@ POWERUP_SIZE = 20
 POWERUP_SPEED = 3
 POWERUP_SPAWN_CHANCE = 0.1  # 10% chance per asteroid destroyed
 POWERUP_DURATION = 420  # 7 seconds at 60 FPS (increased for better value)
+POWERUP_PULSE_LEVELS = 16  # Cached glow halo intensities per power-up type
+POWERUP_ROTATION_FRAMES = 30  # Cached diamond frames per 90 degree turn (3 degree steps)
 SHIELD_DURATION = 600  # 10 seconds
 TIME_SLOW_MULTIPLIER = 0.5  # Asteroids move at 50% speed when time slow is active
 MAGNET_PULL_SPEED = 3  # Speed at which magnet pulls power-ups toward ship
@@ -111,10 +116,15 @@ STAR_MIN_SPEED = 0.1
 STAR_MAX_SPEED = 0.5
 STAR_MIN_BRIGHTNESS = 150
 STAR_MAX_BRIGHTNESS = 255
+STAR_TWINKLE_LEVELS = 8  # Pre-rendered brightness steps per star sprite
+STAR_TWINKLE_MAX_RATIO = 50 / STAR_MIN_BRIGHTNESS  # Largest twinkle brightening relative to base
 
 # Explosion settings
 EXPLOSION_MAX_SIZE = 20
 EXPLOSION_INITIAL_SIZE = 10
+EXPLOSION_GROWTH_RATE = 1.5  # Size increase per frame
+EXPLOSION_LIFETIME = EXPLOSION_MAX_SIZE - EXPLOSION_INITIAL_SIZE  # Reference duration for fade progress
+EXPLOSION_PARTICLE_LIFETIME = 20  # Reference lifetime for explosion particle fade
 BOSS_EXPLOSION_MAX_SIZE = 60
 BOSS_EXPLOSION_DURATION = 60  # frames
 
@@ -129,6 +139,9 @@ BOSS_GLOW_COLOR = (255, 100, 100)
 BOSS_HEALTHBAR_WIDTH = 400
 BOSS_HEALTHBAR_HEIGHT = 20
 BOSS_WARNING_DURATION = 180  # 3 seconds at 60 FPS
+BOSS_ROTATION_FRAMES = 45  # One-degree body frames; the 8 details repeat every 45 degrees
+BOSS_GLOW_EXTENT = 28  # Glow rings reach this far beyond the boss radius
+BOSS_VEIN_CYCLE = 60  # Frames in the looping energy-vein animation
 
 # Combo settings
 COMBO_TIMEOUT = 120  # 2 seconds to maintain combo
@@ -139,34 +152,67 @@ PARTICLE_LIFETIME = 30  # frames
 PARTICLE_MIN_SIZE = 1
 PARTICLE_MAX_SIZE = 4
 PARTICLE_FADE_RATE = 8  # alpha decrease per frame
+PARTICLE_SHAPES = ["circle", "star", "square"]
+PARTICLE_ALPHA_BUCKETS = 16  # Fade levels pre-rendered in the particle atlas
 
 # Screen shake settings
 SCREEN_SHAKE_DURATION = 10
 SCREEN_SHAKE_INTENSITY = 8
 
+# Font settings
+BUNDLED_FONT_FILE = os.path.join("fonts", "game.ttf")  # Optional; system default font if missing
+# (size, bold) pairs resolved at startup: HUD/menu fonts, power-up letters, popups
+FONT_PRELOAD_SPECS = [(20, False), (24, False), (36, False), (48, False), (72, False),
+                      (28, True), (34, True), (40, True)]
+
 # High score file
 DATA_DIR = "data"
 HIGH_SCORE_FILE = os.path.join(DATA_DIR, "high_score.txt")
 SETTINGS_FILE = os.path.join(DATA_DIR, "settings.txt")
 MAX_NAME_LENGTH = 15
 
+# Text cache settings
+TEXT_CACHE_MAX_ENTRIES = 256
+TEXT_CACHE_MAX_BYTES = 4 * 1024 * 1024  # 4 MB of rendered text surfaces
+GLYPH_ATLAS_CHARS = "0123456789"  # Pre-rendered per font/color; labels are added on first use
+
 # Score popup settings
 SCORE_POPUP_LIFETIME = 60  # 1 second
 SCORE_POPUP_RISE_SPEED = -1.5
+SCORE_POPUP_CACHE_SIZE = 128  # Max outlined text sprites kept (LRU)
 
 # Nebula settings
 NEBULA_COUNT = 5
 NEBULA_MIN_SIZE = 100
 NEBULA_MAX_SIZE = 300
 NEBULA_COLORS = [(50, 20, 80, 80), (20, 50, 80, 80), (80, 20, 50, 80)]  # RGBA with alpha
+NEBULA_DRIFT_SPEED = 0.1  # Background scroll speed in pixels per frame
+BACKGROUND_TILE_WIDTH = WIDTH * 2  # Width of the pre-composited scrolling background
 
 # Distortion wave settings
 DISTORTION_MAX_RADIUS = 400
 DISTORTION_LIFETIME = 60
+DISTORTION_BAND_HEIGHT = 16  # Rows per blitted band when drawing distortion rings
 
 # UI animation settings
 COMBO_PULSE_SPEED = 10
 SCAN_LINE_SPEED = 2
+SCAN_LINE_SPACING = 4  # Rows between holographic scan lines
+SCAN_LINE_ALPHA = 20
+
+# HUD settings
+HUD_POWERUP_BAR_WIDTH = 150
+HUD_POWERUP_BAR_HEIGHT = 8
+HUD_LIVES_PULSE_LEVELS = 8  # Quantized low-lives pulse colors (one glyph atlas each)
+# (power-up type, label, bar capacity in frames) in HUD display order
+HUD_POWERUP_BARS = [
+    ("rapid_fire", "Rapid Fire", POWERUP_DURATION * 2),
+    ("spread_shot", "Spread Shot", POWERUP_DURATION * 2),
+    ("shield", "Shield", SHIELD_DURATION * 2),
+    ("double_damage", "Double Damage", POWERUP_DURATION * 2),
+    ("magnet", "Magnet", POWERUP_DURATION * 2),
+    ("time_slow", "Time Slow", POWERUP_DURATION * 2),
+]
 
 # Color theme thresholds
 THEME_BLUE_MAX = 1000
@@ -176,12 +222,29 @@ THEME_RED_MIN = 5000
 # Hexagon shield settings
 HEXAGON_RADIUS = 15
 HEXAGON_LAYERS = 3
+SHIELD_ROTATION_PERIOD = 180  # Degrees after which the hexagon pattern repeats
+SHIELD_ROTATION_FRAMES = 60  # Cached shield frames per rotation period (3 degree steps)
+SHIELD_FADE_FRAMES = 3 * FPS  # Shield fades out over its last 3 seconds
+SHIELD_MIN_FADE = 0.3  # Opacity factor of a shield about to expire
+
+# Collision broadphase settings
+SPATIAL_HASH_CELL_SIZE = 64  # Grid cell size in pixels (roughly the largest asteroid diameter)
 
 # Laser trail settings
 LASER_TRAIL_LENGTH = 5  # Number of trail segments
 
 # Asteroid motion blur settings
 MOTION_BLUR_POSITIONS = 3  # Number of ghost images
+GHOST_CACHE_MAX_ENTRIES = 128  # Ghost discs kept across all asteroids
+GHOST_CACHE_MAX_BYTES = 4 * 1024 * 1024  # 4 MB of ghost discs
+
+# Asteroid sprite rotation cache settings
+ASTEROID_ROTATION_BUCKETS = 36  # Pre-rotated frames per asteroid (10 degree steps)
+ASTEROID_ROTATION_STEP = 360 / ASTEROID_ROTATION_BUCKETS
+ASTEROID_FRAME_CACHE_MAX_ENTRIES = 1024  # Rotated frames kept across all asteroids
+ASTEROID_FRAME_CACHE_MAX_BYTES = 16 * 1024 * 1024  # 16 MB of rotated asteroid frames
+ASTEROID_MASK_CACHE_MAX_ENTRIES = 8192  # Masks are 1 bit per pixel, so many more fit
+ASTEROID_MASK_CACHE_MAX_BYTES = 8 * 1024 * 1024  # 8 MB of asteroid collision masks
 
 # Power-up type lists
 POWERUP_TYPES_ALL = ["shield", "rapid_fire", "spread_shot", "double_damage", "magnet", "time_slow", "nuke"]
@@ -190,9 +253,15 @@ POWERUP_TYPES_DROPABLE = ["shield", "rapid_fire", "spread_shot", "double_damage"
 # Visual effect constants
 ENGINE_GLOW_LAYERS = 3
 SHIP_GRADIENT_LAYERS = 4
+SHIP_ENGINE_PULSE_LEVELS = 16  # Cached engine glow intensities
+SHIP_SPRITE_PADDING = 4  # Margin around baked ship sprites
 RIM_LIGHT_LAYERS = 3
 EXPLOSION_GRADIENT_LAYERS = 8
 COMBO_EDGE_GLOW_STEPS = 10
+COMBO_EDGE_GLOW_MAX_ALPHA = 255  # Glow rows saturate at the 8-bit alpha maximum
+# Outermost-row alphas of the pre-rendered edge-glow bands; the last level
+# saturates every row, so higher combos reuse it
+COMBO_EDGE_GLOW_LEVELS = (60, 100, 160, 255, 400, 640, 1280, 2560)
 CHROMATIC_ABERRATION_INTENSITY = 3
 BOSS_TINT_ALPHA = 30
 
@@ -200,6 +269,903 @@ BOSS_TINT_ALPHA = 30
 SCORE_MILESTONES = [0, 400, 1000, 2000, 3500, 5500, 8000, 11000, 15000, 20000,
                     26000, 33000, 41000, 50000, 60000, 71000, 83000, 90000, 95000, 98000, 100000]
 
+# =============================================================================
+# FONT REGISTRY
+# =============================================================================
+
+
+class FontRegistry:
+    """Central registry that resolves each font exactly once.
+
+    pygame.font.SysFont can fall back to a fontconfig lookup on every call, so
+    all game code asks the registry instead. If a bundled TTF is present it is
+    used for every size, which keeps font resolution predictable in PyInstaller
+    builds; otherwise the system default font is used.
+
+    Attributes:
+        bundled_path: Path of the bundled TTF, or None if it is not available
+        fonts: Dict mapping (family, size, bold) to loaded pygame Font
+        lookups: Number of get() calls
+        loads: Number of fonts actually resolved
+        load_time: Total seconds spent resolving fonts
+    """
+
+    def __init__(self, bundled_path=None):
+        """Initialize the registry.
+
+        Args:
+            bundled_path: Optional path to a TTF file to use for the default family
+        """
+        if bundled_path and not os.path.exists(bundled_path):
+            bundled_path = None
+        self.bundled_path = bundled_path
+        self.fonts = {}
+        self.keys = {}  # id(font) -> (family, size, bold); fonts are never released
+        self.lookups = 0
+        self.loads = 0
+        self.load_time = 0.0
+
+    def _load(self, family, size, bold):
+        """Resolve a font from the bundled TTF or the system fonts."""
+        if family is None and self.bundled_path:
+            font = pygame.font.Font(self.bundled_path, size)
+            font.set_bold(bold)
+            return font
+        return pygame.font.SysFont(family, size, bold=bold)
+
+    def get(self, size, bold=False, family=None):
+        """Return the font for (family, size, bold), resolving it on first use.
+
+        Args:
+            size: Font size in points
+            bold: Whether to use bold rendering (default False)
+            family: System font family name (default None = game default font)
+
+        Returns:
+            pygame.font.Font object
+        """
+        self.lookups += 1
+        key = (family, size, bold)
+        font = self.fonts.get(key)
+        if font is None:
+            start = time.perf_counter()
+            font = self._load(family, size, bold)
+            self.load_time += time.perf_counter() - start
+            self.loads += 1
+            self.fonts[key] = font
+            self.keys[id(font)] = key
+        return font
+
+    def key_for(self, font):
+        """Return the stable (family, size, bold) key of a registry font.
+
+        Args:
+            font: Font previously returned by get()
+
+        Returns:
+            Key tuple, or None if the font did not come from this registry
+        """
+        return self.keys.get(id(font))
+
+    def preload(self, specs):
+        """Resolve a list of fonts up front (e.g. during startup).
+
+        Args:
+            specs: Iterable of (size, bold) tuples
+        """
+        for size, bold in specs:
+            self.get(size, bold)
+
+    def stats(self):
+        """Return a dict of registry counters for debugging/profiling output."""
+        return {
+            "fonts": len(self.fonts),
+            "lookups": self.lookups,
+            "loads": self.loads,
+            "load_time_ms": self.load_time * 1000,
+            "bundled": self.bundled_path is not None,
+        }
+
+
+FONTS = FontRegistry(resource_path(BUNDLED_FONT_FILE))
+
+
+# =============================================================================
+# GLYPH ATLASES
+# =============================================================================
+
+
+class GlyphAtlas:
+    """Pre-rendered digit and label glyphs for one font and color.
+
+    Numeric HUD text changes almost every frame; instead of rasterizing a new
+    string each time, the text is composed from cached glyph surfaces.
+
+    Attributes:
+        font: Pygame font the glyphs are rendered with
+        color: RGB glyph color
+        glyphs: Dict mapping a digit or fixed label to its rendered surface
+        renders: Number of glyphs rasterized so far
+    """
+
+    def __init__(self, font, color):
+        """Initialize the atlas and pre-render the digit glyphs.
+
+        Args:
+            font: Pygame font to render with
+            color: RGB glyph color
+        """
+        self.font = font
+        self.color = color
+        self.glyphs = {}
+        self.renders = 0
+        for char in GLYPH_ATLAS_CHARS:
+            self.glyph(char)
+
+    def glyph(self, text):
+        """Return the cached surface for a glyph or fixed label, rendering it once."""
+        surface = self.glyphs.get(text)
+        if surface is None:
+            surface = self.font.render(text, True, self.color)
+            self.glyphs[text] = surface
+            self.renders += 1
+        return surface
+
+    def _glyph_run(self, parts):
+        """Return the glyph surfaces for parts (labels whole, numbers per character)."""
+        run = []
+        for part in parts:
+            if isinstance(part, str):
+                run.append(self.glyph(part))
+            else:
+                run.extend(self.glyph(char) for char in str(part))
+        return run
+
+    def draw(self, surface, pos, *parts):
+        """Blit composed text onto surface.
+
+        Args:
+            surface: Pygame surface to draw on
+            pos: (x, y) top-left position
+            *parts: Fixed label strings and numbers, drawn left to right
+
+        Returns:
+            Width of the drawn text in pixels
+        """
+        x, y = pos
+        sequence = []
+        for glyph in self._glyph_run(parts):
+            sequence.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.fblits(sequence)
+        return x - pos[0]
+
+    def render(self, *parts):
+        """Compose parts into a new SRCALPHA surface (for cached widgets).
+
+        Args:
+            *parts: Fixed label strings and numbers, drawn left to right
+
+        Returns:
+            Pygame surface containing the composed text
+        """
+        run = self._glyph_run(parts)
+        surface = pygame.Surface(
+            (sum(glyph.get_width() for glyph in run), max((glyph.get_height() for glyph in run), default=0)),
+            pygame.SRCALPHA
+        )
+        self.draw(surface, (0, 0), *parts)
+        return surface
+
+
+# Glyph atlases keyed by (font key, color)
+GLYPH_ATLASES = {}
+
+
+def glyph_atlas(font, color):
+    """Return the shared GlyphAtlas for a registry font and color.
+
+    Args:
+        font: Font obtained from FONTS
+        color: RGB glyph color
+
+    Returns:
+        GlyphAtlas instance
+    """
+    key = (FONTS.key_for(font), tuple(color))
+    atlas = GLYPH_ATLASES.get(key)
+    if atlas is None:
+        atlas = GlyphAtlas(font, color)
+        GLYPH_ATLASES[key] = atlas
+    return atlas
+
+
+# =============================================================================
+# SPRITE CACHES
+# =============================================================================
+
+
+class SpriteCache:
+    """Process-wide cache of pre-rendered surfaces shared by all entities.
+
+    Surfaces are built lazily by a render callback the first time a key is
+    requested and reused afterwards, so steady-state drawing allocates nothing.
+    Collision masks derived from cached sprites may be stored the same way.
+
+    Attributes:
+        name: Human-readable cache name (used in stats output)
+        surfaces: Dict mapping cache key to rendered surface
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that had to render a new surface
+    """
+
+    def __init__(self, name):
+        """Initialize an empty cache.
+
+        Args:
+            name: Human-readable cache name
+        """
+        self.name = name
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Return the cached surface for key, rendering it on first use.
+
+        Args:
+            key: Hashable cache key describing the surface
+            render: Zero-argument callable that builds the surface on a miss
+
+        Returns:
+            Pygame surface for the key
+        """
+        surface = self.surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            surface = render()
+            self.surfaces[key] = surface
+        else:
+            self.hits += 1
+        return surface
+
+    def __len__(self):
+        return len(self.surfaces)
+
+    def hit_rate(self):
+        """Return the fraction of lookups served from the cache (0.0-1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        """Return the pixel memory of a cached surface (or bit mask)."""
+        if isinstance(surface, pygame.mask.Mask):
+            width, height = surface.get_size()
+            return (width * height + 7) // 8
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def resident_bytes(self):
+        """Return the approximate pixel memory held by cached surfaces."""
+        return sum(self._surface_bytes(surface) for surface in self.surfaces.values())
+
+    def stats(self):
+        """Return a dict of cache counters for debugging/profiling output."""
+        return {
+            "name": self.name,
+            "entries": len(self.surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+            "bytes": self.resident_bytes(),
+        }
+
+
+class LRUSpriteCache(SpriteCache):
+    """SpriteCache bounded by entry count and, optionally, by pixel memory.
+
+    Entries are kept in recency order; when either bound is exceeded the least
+    recently used surfaces are evicted to make room for the new one.
+
+    Attributes:
+        max_entries: Maximum number of surfaces kept
+        max_bytes: Maximum pixel memory kept, or None for no byte bound
+        evictions: Number of surfaces evicted so far
+    """
+
+    def __init__(self, name, max_entries, max_bytes=None):
+        """Initialize an empty bounded cache.
+
+        Args:
+            name: Human-readable cache name
+            max_entries: Maximum number of surfaces kept
+            max_bytes: Optional maximum pixel memory in bytes
+        """
+        super().__init__(name)
+        self.surfaces = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._bytes = 0
+
+    def get(self, key, render):
+        """Return the cached surface for key, rendering and evicting as needed."""
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = render()
+        self.surfaces[key] = surface
+        self._bytes += self._surface_bytes(surface)
+        # Always keep the newest entry, even if it alone exceeds max_bytes
+        while len(self.surfaces) > 1 and (
+            len(self.surfaces) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, evicted = self.surfaces.popitem(last=False)
+            self._bytes -= self._surface_bytes(evicted)
+            self.evictions += 1
+        return surface
+
+    def resident_bytes(self):
+        """Return the pixel memory held by cached surfaces (tracked incrementally)."""
+        return self._bytes
+
+    def stats(self):
+        """Return cache counters including evictions."""
+        stats = super().stats()
+        stats["evictions"] = self.evictions
+        return stats
+
+
+def _render_disc(radius, color, alpha):
+    """Render a single translucent filled circle (motion blur ghosts, particles)."""
+    surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+    pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius)
+    return surface
+
+
+# Motion blur ghost discs keyed by (radius, color, alpha); discs of asteroids
+# no longer on screen age out
+GHOST_SPRITES = LRUSpriteCache("asteroid_ghosts", GHOST_CACHE_MAX_ENTRIES, GHOST_CACHE_MAX_BYTES)
+
+# Rotated asteroid bodies keyed by (shape id, radius, rotation bucket); stale
+# shapes age out instead of each asteroid holding every bucket it has shown
+ASTEROID_FRAMES = LRUSpriteCache(
+    "asteroid_frames", ASTEROID_FRAME_CACHE_MAX_ENTRIES, ASTEROID_FRAME_CACHE_MAX_BYTES
+)
+
+# Asteroid collision masks keyed like ASTEROID_FRAMES
+ASTEROID_MASKS = LRUSpriteCache(
+    "asteroid_masks", ASTEROID_MASK_CACHE_MAX_ENTRIES, ASTEROID_MASK_CACHE_MAX_BYTES
+)
+
+# Source of unique ids for procedurally-generated asteroid shapes
+ASTEROID_SHAPE_IDS = itertools.count()
+
+
+def _render_explosion_frame(lifetime):
+    """Render one flipbook frame of the explosion fireball.
+
+    The fireball's look depends only on how many frames the explosion has been
+    alive, so every explosion shares the same sequence of frames.
+
+    Args:
+        lifetime: Frames elapsed since the explosion started
+
+    Returns:
+        SRCALPHA surface with the fireball centered in it
+    """
+    size = EXPLOSION_INITIAL_SIZE + lifetime * EXPLOSION_GROWTH_RATE
+    progress = lifetime / EXPLOSION_LIFETIME
+    half_size = int(size) + 2
+    frame = pygame.Surface((half_size * 2, half_size * 2), pygame.SRCALPHA)
+
+    # Multiple layers with decreasing opacity for smooth radial gradient
+    for i in range(EXPLOSION_GRADIENT_LAYERS):
+        layer_progress = (EXPLOSION_GRADIENT_LAYERS - i) / EXPLOSION_GRADIENT_LAYERS
+        radius = int(size * layer_progress)
+
+        if radius > 0:
+            # Start bright white/yellow, transition to orange/red
+            if progress < 0.3:
+                # Early explosion: bright white/yellow core
+                color_idx = 1 if i < 3 else 0
+            elif progress < 0.6:
+                # Mid explosion: orange
+                color_idx = 0
+            else:
+                # Late explosion: dark red
+                color_idx = 2
+
+            base_color = EXPLOSION_COLORS[color_idx]
+
+            # Add brightness to inner layers
+            brightness_boost = int((1.0 - layer_progress) * 100) if i < 4 else 0
+            color = tuple(min(255, c + brightness_boost) for c in base_color)
+
+            # Calculate alpha with smooth falloff
+            alpha = int(255 * (1.0 - progress) * layer_progress * 0.8)
+
+            if alpha > 0:
+                layer = _render_disc(radius, color, alpha)
+                frame.blit(layer, (half_size - radius, half_size - radius))
+
+    # Bright flash at the center for first few frames
+    if progress < 0.2:
+        flash_alpha = int(255 * (1.0 - progress / 0.2))
+        flash_size = max(3, int(size * 0.3))
+        flash = _render_disc(flash_size, (255, 255, 255), flash_alpha)
+        frame.blit(flash, (half_size - flash_size, half_size - flash_size))
+
+    return frame
+
+
+# Explosion fireball flipbook keyed by frame index (lifetime)
+EXPLOSION_FRAMES = SpriteCache("explosion_frames")
+
+# Small translucent discs keyed by (radius, color, alpha)
+DISC_SPRITES = SpriteCache("discs")
+
+
+def _render_particle(shape, size, color, alpha):
+    """Render a particle sprite of the given shape.
+
+    Args:
+        shape: "circle", "star" or "square"
+        size: Particle radius in pixels (sprite is size * 3 on each side)
+        color: RGB color tuple
+        alpha: Opacity 0-255
+
+    Returns:
+        SRCALPHA surface with the particle centered in it
+    """
+    surface = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+    color_with_alpha = (*color, alpha)
+    center = (size * 1.5, size * 1.5)
+
+    if shape == "star":
+        # 5-pointed star = 10 points (5 outer, 5 inner), starting pointing up
+        points = []
+        for i in range(10):
+            angle = math.radians(i * 36 - 90)
+            r = size if i % 2 == 0 else size * 0.4
+            points.append((center[0] + r * math.cos(angle), center[1] + r * math.sin(angle)))
+        pygame.draw.polygon(surface, color_with_alpha, points)
+    elif shape == "square":
+        rect = pygame.Rect(center[0] - size, center[1] - size, size * 2, size * 2)
+        pygame.draw.rect(surface, color_with_alpha, rect)
+    else:  # circle
+        pygame.draw.circle(surface, color_with_alpha, (int(center[0]), int(center[1])), size)
+
+    return surface
+
+
+def particle_alpha_bucket(alpha):
+    """Quantize a 0-255 alpha into one of PARTICLE_ALPHA_BUCKETS atlas levels."""
+    return min(PARTICLE_ALPHA_BUCKETS - 1, alpha * PARTICLE_ALPHA_BUCKETS // 256)
+
+
+def _render_particle_bucket(shape, size, color, bucket):
+    """Render the atlas sprite for an alpha bucket (upper edge of the bucket)."""
+    alpha = (bucket + 1) * 255 // PARTICLE_ALPHA_BUCKETS
+    return _render_particle(shape, size, color, alpha)
+
+
+# Particle atlas keyed by (shape, size, color, alpha bucket)
+PARTICLE_ATLAS = SpriteCache("particle_atlas")
+
+
+def _render_star_dot(size, color, level):
+    """Render a star dot brightened to the given twinkle level.
+
+    Args:
+        size: Star radius in pixels
+        color: Base RGB color
+        level: Twinkle level 0 to STAR_TWINKLE_LEVELS - 1
+
+    Returns:
+        SRCALPHA surface with the dot centered at (size, size)
+    """
+    ratio = 1.0 + STAR_TWINKLE_MAX_RATIO * level / (STAR_TWINKLE_LEVELS - 1)
+    twinkle_color = tuple(min(255, int(c * ratio)) for c in color)
+    surface = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(surface, twinkle_color, (size, size), size)
+    return surface
+
+
+# Star dots keyed by (size, color, twinkle level)
+STAR_SPRITES = SpriteCache("star_dots")
+
+# Normalized twinkle curve (0-1) per whole degree of twinkle phase
+TWINKLE_TABLE = [(math.sin(math.radians(degree)) + 1) / 2 for degree in range(360)]
+
+
+def _render_outlined_text(text, font_size):
+    """Render score popup text with a dark 1px outline onto a transparent surface.
+
+    Args:
+        text: String to render
+        font_size: Font size in points
+
+    Returns:
+        SRCALPHA surface 4px larger than the text on each axis
+    """
+    font = FONTS.get(font_size, bold=True)
+    text_surface = font.render(text, True, COMBO_COLOR)
+    outline_surface = font.render(text, True, (0, 0, 0))
+    text_width, text_height = text_surface.get_size()
+
+    surface = pygame.Surface((text_width + 4, text_height + 4), pygame.SRCALPHA)
+    # Render outline (dark shadow for contrast)
+    for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (0, -1), (-1, 0), (1, 0), (0, 1)]:
+        surface.blit(outline_surface, (2 + dx, 2 + dy))
+    surface.blit(text_surface, (2, 2))
+    return surface
+
+
+# Outlined score popup text keyed by (text, font size)
+POPUP_TEXT_SPRITES = LRUSpriteCache("popup_text", SCORE_POPUP_CACHE_SIZE)
+
+
+def _render_scan_lines(color):
+    """Render a tileable strip of holographic scan lines in the theme color.
+
+    The strip is SCAN_LINE_SPACING rows taller than the screen, so scrolling it
+    by the scan line offset always covers the whole screen with one blit.
+
+    Args:
+        color: RGB theme color
+
+    Returns:
+        SRCALPHA surface WIDTH x (HEIGHT + SCAN_LINE_SPACING)
+    """
+    strip = pygame.Surface((WIDTH, HEIGHT + SCAN_LINE_SPACING), pygame.SRCALPHA)
+    for y in range(0, HEIGHT + SCAN_LINE_SPACING, SCAN_LINE_SPACING):
+        pygame.draw.line(strip, (*color, SCAN_LINE_ALPHA), (0, y), (WIDTH, y), 1)
+    return strip
+
+
+def edge_glow_level(edge_alpha):
+    """Return the highest COMBO_EDGE_GLOW_LEVELS entry not above edge_alpha.
+
+    Args:
+        edge_alpha: Unquantized alpha of the outermost glow row
+
+    Returns:
+        Outermost-row alpha of the band to draw
+    """
+    level = COMBO_EDGE_GLOW_LEVELS[0]
+    for candidate in COMBO_EDGE_GLOW_LEVELS:
+        if candidate > edge_alpha:
+            break
+        level = candidate
+    return level
+
+
+def edge_glow_row_alphas(edge_alpha):
+    """Return the alpha of each combo edge-glow row, saturated per row.
+
+    Args:
+        edge_alpha: Unclamped alpha of the outermost glow row
+
+    Returns:
+        Tuple of COMBO_EDGE_GLOW_STEPS alphas, outermost row first
+    """
+    return tuple(
+        max(0, min(COMBO_EDGE_GLOW_MAX_ALPHA, int(edge_alpha * (1.0 - i / 10.0))))
+        for i in range(COMBO_EDGE_GLOW_STEPS)
+    )
+
+
+def _render_edge_glow(edge, row_alphas):
+    """Render the top or bottom combo edge-glow band for one set of row alphas.
+
+    Args:
+        edge: "top" or "bottom"
+        row_alphas: Per-row alphas from edge_glow_row_alphas()
+
+    Returns:
+        SRCALPHA surface WIDTH x (COMBO_EDGE_GLOW_STEPS * 2)
+    """
+    band_height = COMBO_EDGE_GLOW_STEPS * 2
+    band = pygame.Surface((WIDTH, band_height), pygame.SRCALPHA)
+    for i, alpha in enumerate(row_alphas):
+        row_y = i * 2 if edge == "top" else band_height - i * 2
+        pygame.draw.rect(band, (255, 255, 100, alpha), (0, row_y, WIDTH, 2))
+    return band
+
+
+# Scan line strips keyed by theme color
+SCAN_LINE_SPRITES = SpriteCache("scan_lines")
+
+# Ship hull, engine glow and nav light sprites keyed by (part, size, state...)
+SHIP_SPRITES = SpriteCache("ship")
+
+# Boss body rotation sheet, glow rings and vein frames keyed by (part, radius, step)
+BOSS_SPRITES = SpriteCache("boss")
+
+
+def _render_laser_trail(alpha):
+    """Render one laser trail segment at the given alpha."""
+    surface = pygame.Surface((LASER_WIDTH, LASER_HEIGHT), pygame.SRCALPHA)
+    surface.fill((*LASER_COLOR, alpha))
+    return surface
+
+
+def _render_laser_body():
+    """Render the opaque laser body with its glow core."""
+    surface = pygame.Surface((LASER_WIDTH, LASER_HEIGHT))
+    surface.fill(LASER_COLOR)
+    surface.fill(LASER_GLOW_COLOR, (0, 1, LASER_WIDTH, 4))
+    return surface
+
+
+# Laser body and trail segment sprites keyed by ("body",) or ("trail", alpha)
+LASER_SPRITES = SpriteCache("lasers")
+
+# Solid collision mask of the laser body
+LASER_MASK = pygame.mask.Mask((LASER_WIDTH, LASER_HEIGHT), fill=True)
+
+# Trail segment alphas (oldest first) for each trail length; max 60% opacity
+LASER_TRAIL_ALPHAS = [
+    tuple(int(255 * (i + 1) / (count + 1) * 0.6) for i in range(count))
+    for count in range(LASER_TRAIL_LENGTH + 1)
+]
+
+# Power-up glow and rotating diamond frames keyed by (part, type, level or step)
+POWERUP_SPRITES = SpriteCache("powerups")
+
+# Ship collision masks keyed by (width, height) -> (mask, bounding radius)
+SHIP_MASKS = {}
+
+# Hexagon shield rotation frames keyed by (radius, frame index)
+SHIELD_FRAMES = SpriteCache("shield_frames")
+
+# Combo edge-glow bands keyed by (edge, saturated per-row alphas)
+EDGE_GLOW_SPRITES = SpriteCache("edge_glow")
+
+
+def prewarm_particle_atlas():
+    """Render every (shape, size, palette color, alpha bucket) particle sprite.
+
+    Called once at startup so particle drawing never renders mid-game.
+
+    Returns:
+        Number of sprites in the atlas
+    """
+    for palette in PARTICLE_COLORS.values():
+        for color in palette:
+            for shape in PARTICLE_SHAPES:
+                for size in range(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE + 1):
+                    for bucket in range(PARTICLE_ALPHA_BUCKETS):
+                        key = (shape, size, color, bucket)
+                        if key not in PARTICLE_ATLAS.surfaces:
+                            PARTICLE_ATLAS.surfaces[key] = _render_particle_bucket(*key)
+    return len(PARTICLE_ATLAS)
+
+
+# =============================================================================
+# RENDER TARGETS
+# =============================================================================
+
+
+class RenderTargets:
+    """Owns the back buffer and every full-screen effect surface.
+
+    Full-screen surfaces are allocated on first use and reused on every later
+    frame. Overlays that never change (boss tint, dimming overlays) are filled
+    once and cached by color. `frame_allocations` counts full-screen surfaces
+    created since the last begin_frame() and should be 0 in steady state.
+
+    Attributes:
+        size: (width, height) of every managed surface
+        buffers: Dict mapping buffer name to reusable surface
+        overlays: Dict mapping RGBA color to pre-filled overlay surface
+        allocations: Total full-screen surfaces allocated
+        frame_allocations: Full-screen surfaces allocated during the current frame
+    """
+
+    def __init__(self, size):
+        """Initialize an empty manager.
+
+        Args:
+            size: (width, height) of the managed surfaces
+        """
+        self.size = size
+        self.buffers = {}
+        self.overlays = {}
+        self.allocations = 0
+        self.frame_allocations = 0
+
+    def _allocate(self, alpha):
+        """Create a full-screen surface and count the allocation."""
+        self.allocations += 1
+        self.frame_allocations += 1
+        if alpha:
+            return pygame.Surface(self.size, pygame.SRCALPHA)
+        return pygame.Surface(self.size)
+
+    def begin_frame(self):
+        """Reset the per-frame allocation counter."""
+        self.frame_allocations = 0
+
+    def buffer(self, name, alpha=False):
+        """Return the persistent full-screen surface with the given name.
+
+        Contents are left over from the previous frame; callers clear or
+        overwrite them as needed.
+
+        Args:
+            name: Buffer name (e.g. "back", "aberration")
+            alpha: Whether the surface needs per-pixel alpha (default False)
+
+        Returns:
+            Pygame surface of the managed size
+        """
+        surface = self.buffers.get(name)
+        if surface is None:
+            surface = self._allocate(alpha)
+            self.buffers[name] = surface
+        return surface
+
+    def overlay(self, color):
+        """Return a cached full-screen SRCALPHA surface filled with color.
+
+        Args:
+            color: RGBA fill color
+
+        Returns:
+            Pygame surface of the managed size
+        """
+        surface = self.overlays.get(color)
+        if surface is None:
+            surface = self._allocate(True)
+            surface.fill(color)
+            self.overlays[color] = surface
+        return surface
+
+
+# =============================================================================
+# COLLISION BROADPHASE
+# =============================================================================
+
+
+class SpatialHash:
+    """Uniform grid over the play field for collision broadphase.
+
+    Items are stored by index in every cell their axis-aligned bounding box
+    touches. Boxes outside the play field are clamped to the border cells,
+    so off-screen objects are still found. The grid is rebuilt once per frame.
+
+    Attributes:
+        cell_size: Cell edge length in pixels
+        cols: Number of grid columns
+        rows: Number of grid rows
+        cells: Flat list of per-cell index lists (row-major)
+        occupied: Cells that received items since the last clear()
+        queries: Queries made since creation
+        candidates: Candidate indices returned since creation
+    """
+
+    def __init__(self, width, height, cell_size):
+        """Initialize an empty grid covering a width x height field.
+
+        Args:
+            width: Play field width in pixels
+            height: Play field height in pixels
+            cell_size: Cell edge length in pixels
+        """
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        self.cells = [[] for _ in range(self.cols * self.rows)]
+        self.occupied = []
+        self.queries = 0
+        self.candidates = 0
+
+    def _span(self, low, high, count):
+        """Return the clamped (first, last) cell indices covering [low, high]."""
+        first = min(max(int(low // self.cell_size), 0), count - 1)
+        last = min(max(int(high // self.cell_size), 0), count - 1)
+        return first, last
+
+    def clear(self):
+        """Remove all items from the grid."""
+        cells = self.cells
+        for cell_index in self.occupied:
+            cells[cell_index].clear()
+        self.occupied.clear()
+
+    def insert(self, index, left, top, right, bottom):
+        """Add an item's bounding box to the grid.
+
+        Args:
+            index: Item index (e.g. its position in the entity list)
+            left, top, right, bottom: Bounding box in pixels
+        """
+        col_first, col_last = self._span(left, right, self.cols)
+        row_first, row_last = self._span(top, bottom, self.rows)
+        cells = self.cells
+        for row in range(row_first, row_last + 1):
+            base = row * self.cols
+            for col in range(col_first, col_last + 1):
+                cell = cells[base + col]
+                if not cell:
+                    self.occupied.append(base + col)
+                cell.append(index)
+
+    def query(self, left, top, right, bottom):
+        """Return the indices of items whose cells overlap a bounding box.
+
+        Args:
+            left, top, right, bottom: Query box in pixels
+
+        Returns:
+            Sorted list of candidate indices (a superset of the true overlaps)
+        """
+        col_first, col_last = self._span(left, right, self.cols)
+        row_first, row_last = self._span(top, bottom, self.rows)
+        cells = self.cells
+        if col_first == col_last and row_first == row_last:
+            found = cells[row_first * self.cols + col_first]
+            result = sorted(set(found)) if found else []
+        else:
+            found = set()
+            for row in range(row_first, row_last + 1):
+                base = row * self.cols
+                for col in range(col_first, col_last + 1):
+                    found.update(cells[base + col])
+            result = sorted(found)
+        self.queries += 1
+        self.candidates += len(result)
+        return result
+
+
+def box_overlaps(lefts, tops, rights, bottoms, left, top, right, bottom, indices):
+    """Batched strict AABB overlap test of many boxes against one box.
+
+    Uses the same comparisons as Laser.collides_with_boss and the bounding
+    stage of Laser.collides_with_asteroid, so results match them exactly.
+
+    Args:
+        lefts, tops, rights, bottoms: Column lists of box edges
+        left, top, right, bottom: Edges of the query box
+        indices: Ordered candidate indices into the columns
+
+    Returns:
+        List of overlapping indices, in the order given
+    """
+    return [
+        j for j in indices
+        if lefts[j] < right and rights[j] > left and tops[j] < bottom and bottoms[j] > top
+    ]
+
+
+def circle_overlaps(xs, ys, radii, x, y, radius, indices):
+    """Batched circle-vs-circle test of many circles against one circle.
+
+    Uses the same arithmetic as PowerUp.collides_with_ship and the bounding
+    stage of Asteroid.collides_with_ship, so results match them exactly.
+
+    Args:
+        xs, ys, radii: Column lists of circle centers and radii
+        x, y: Center of the query circle
+        radius: Radius of the query circle
+        indices: Ordered candidate indices into the columns
+
+    Returns:
+        List of overlapping indices, in the order given
+    """
+    return [
+        j for j in indices
+        if (x - xs[j]) ** 2 + (y - ys[j]) ** 2 < (radii[j] + radius) ** 2
+    ]
+
+
 # =============================================================================
 # CLASSES
 # =============================================================================
@@ -225,6 +1191,11 @@ class Ship:
         shield_timer: Frames remaining of shield protection
     """
 
+    __slots__ = (
+        "x", "y", "width", "height", "speed", "lives", "invulnerable", "invulnerability_timer",
+        "damage_flash_timer", "has_shield", "shield_timer",
+    )
+
     def __init__(self, x, y):
         """Initialize the ship at the given position.
 
@@ -304,21 +1275,24 @@ class Ship:
             if self.shield_timer == 0:
                 self.has_shield = False
 
-    def draw(self, screen, current_time):
-        """Draw the ship with enhanced graphics and details.
+    def _sprite_origin(self):
+        """Return the ship's (x, y) anchor inside its hull sprites."""
+        return (self.width // 2 + SHIP_SPRITE_PADDING, self.height + SHIP_SPRITE_PADDING)
+
+    def _render_underlay(self, is_damaged):
+        """Render the static parts drawn beneath the engine glow (aura and thrusters).
 
         Args:
-            screen: Pygame surface to draw on
-            current_time: Current tick time (cached for performance)
-        """
-        # Flickering effect when invulnerable
-        if self.invulnerable and current_time % 200 < 100:
-            return
+            is_damaged: Whether to use the damage flash colors
 
-        # Choose ship color (red flash when damaged)
-        is_damaged = self.damage_flash_timer > 0
+        Returns:
+            SRCALPHA surface anchored at _sprite_origin()
+        """
+        size = (self.width * 2 + SHIP_SPRITE_PADDING * 2, self.height * 2 + SHIP_SPRITE_PADDING * 2)
+        x, y = self._sprite_origin()
         base_color = SHIP_DAMAGE_COLOR if is_damaged else SHIP_COLOR
 
+        underlay = pygame.Surface(size, pygame.SRCALPHA)
         # Draw ship glow/aura (subtle outer glow)
         glow_surface = pygame.Surface((self.width * 2, self.height * 2), pygame.SRCALPHA)
         glow_radius = max(self.width, self.height) // 2
@@ -331,39 +1305,32 @@ class Ship:
                 (self.width // 2 - glow_radius - i * 3, self.height - glow_radius - i * 3,
                  glow_radius * 2 + i * 6, glow_radius * 2 + i * 6)
             )
-        screen.blit(glow_surface, (int(self.x - self.width // 2), int(self.y - self.height)))
+        underlay.blit(glow_surface, (x - self.width // 2, y - self.height))
 
         # Draw engine thrusters at the back (left side)
         thruster_width = 8
         thruster_height = 5
         # Top thruster
-        pygame.draw.rect(screen, (50, 50, 60),
-                        (self.x - 2, self.y - self.height // 2 - 2, thruster_width, thruster_height))
+        pygame.draw.rect(underlay, (50, 50, 60),
+                        (x - 2, y - self.height // 2 - 2, thruster_width, thruster_height))
         # Bottom thruster
-        pygame.draw.rect(screen, (50, 50, 60),
-                        (self.x - 2, self.y + self.height // 2 - 3, thruster_width, thruster_height))
+        pygame.draw.rect(underlay, (50, 50, 60),
+                        (x - 2, y + self.height // 2 - 3, thruster_width, thruster_height))
+        return underlay
 
-        # Engine glow (animated)
-        glow_pulse = (math.sin(current_time / 100) + 1) / 2
-        engine_glow = int(100 + glow_pulse * 100)
-        engine_color = (100, 150, 255) if not is_damaged else (255, 150, 100)
-
-        # Top engine glow
-        for i in range(ENGINE_GLOW_LAYERS):
-            alpha = engine_glow - i * 30
-            if alpha > 0:
-                glow_surf = pygame.Surface((thruster_width + i * 2, thruster_height + i * 2), pygame.SRCALPHA)
-                glow_surf.fill((*engine_color, alpha))
-                screen.blit(glow_surf, (self.x - 2 - i, self.y - self.height // 2 - 2 - i))
+    def _render_hull(self, is_damaged):
+        """Render the static hull drawn above the engine glow.
 
-        # Bottom engine glow
-        for i in range(ENGINE_GLOW_LAYERS):
-            alpha = engine_glow - i * 30
-            if alpha > 0:
-                glow_surf = pygame.Surface((thruster_width + i * 2, thruster_height + i * 2), pygame.SRCALPHA)
-                glow_surf.fill((*engine_color, alpha))
-                screen.blit(glow_surf, (self.x - 2 - i, self.y + self.height // 2 - 3 - i))
+        Args:
+            is_damaged: Whether to use the damage flash colors
 
+        Returns:
+            SRCALPHA surface anchored at _sprite_origin()
+        """
+        size = (self.width * 2 + SHIP_SPRITE_PADDING * 2, self.height * 2 + SHIP_SPRITE_PADDING * 2)
+        x, y = self._sprite_origin()
+        base_color = SHIP_DAMAGE_COLOR if is_damaged else SHIP_COLOR
+        surface = pygame.Surface(size, pygame.SRCALPHA)
         # Create gradient layers for main ship body with better shading
         for i in range(SHIP_GRADIENT_LAYERS):
             # Calculate gradient color (darker to lighter from bottom to top)
@@ -373,12 +1340,12 @@ class Ship:
             # Offset each layer slightly for gradient effect
             offset_y = -2 + i * 0.7
             pygame.draw.polygon(
-                screen,
+                surface,
                 gradient_color,
                 [
-                    (self.x + self.width, self.y + offset_y),
-                    (self.x, self.y - self.height // 2 + offset_y),
-                    (self.x, self.y + self.height // 2 + offset_y),
+                    (x + self.width, y + offset_y),
+                    (x, y - self.height // 2 + offset_y),
+                    (x, y + self.height // 2 + offset_y),
                 ],
             )
 
@@ -386,22 +1353,22 @@ class Ship:
         panel_color = tuple(int(c * 0.7) for c in base_color)
         # Top panel
         pygame.draw.polygon(
-            screen,
+            surface,
             panel_color,
             [
-                (self.x + self.width * 0.6, self.y - 2),
-                (self.x + self.width * 0.3, self.y - self.height // 4),
-                (self.x + self.width * 0.5, self.y - self.height // 4),
+                (x + self.width * 0.6, y - 2),
+                (x + self.width * 0.3, y - self.height // 4),
+                (x + self.width * 0.5, y - self.height // 4),
             ]
         )
         # Bottom panel
         pygame.draw.polygon(
-            screen,
+            surface,
             panel_color,
             [
-                (self.x + self.width * 0.6, self.y + 2),
-                (self.x + self.width * 0.3, self.y + self.height // 4),
-                (self.x + self.width * 0.5, self.y + self.height // 4),
+                (x + self.width * 0.6, y + 2),
+                (x + self.width * 0.3, y + self.height // 4),
+                (x + self.width * 0.5, y + self.height // 4),
             ]
         )
 
@@ -409,23 +1376,23 @@ class Ship:
         highlight_color = (min(255, base_color[0] + 120), min(255, base_color[1] + 120), min(255, base_color[2] + 120))
         # Top edge
         pygame.draw.aalines(
-            screen,
+            surface,
             highlight_color,
             False,
             [
-                (self.x, self.y - self.height // 2),
-                (self.x + self.width, self.y),
+                (x, y - self.height // 2),
+                (x + self.width, y),
             ]
         )
         # Bottom edge (darker)
         shadow_color = tuple(int(c * 0.6) for c in base_color)
         pygame.draw.aalines(
-            screen,
+            surface,
             shadow_color,
             False,
             [
-                (self.x, self.y + self.height // 2),
-                (self.x + self.width, self.y),
+                (x, y + self.height // 2),
+                (x + self.width, y),
             ]
         )
 
@@ -437,39 +1404,39 @@ class Ship:
 
             # Top wing
             pygame.draw.polygon(
-                screen,
+                surface,
                 wing_gradient,
                 [
-                    (self.x + self.width // 2, self.y - self.height + i),
-                    (self.x, self.y - self.height // 2 + i),
-                    (self.x + self.width // 2, self.y + i),
+                    (x + self.width // 2, y - self.height + i),
+                    (x, y - self.height // 2 + i),
+                    (x + self.width // 2, y + i),
                 ],
             )
             # Wing detail line
             wing_detail_color = tuple(min(255, int(c * 1.2)) for c in wing_gradient)
             pygame.draw.aaline(
-                screen,
+                surface,
                 wing_detail_color,
-                (self.x + self.width // 4, self.y - self.height * 0.75),
-                (self.x + self.width // 2, self.y - self.height // 4)
+                (x + self.width // 4, y - self.height * 0.75),
+                (x + self.width // 2, y - self.height // 4)
             )
 
             # Bottom wing
             pygame.draw.polygon(
-                screen,
+                surface,
                 wing_gradient,
                 [
-                    (self.x + self.width // 2, self.y + self.height - i),
-                    (self.x, self.y + self.height // 2 - i),
-                    (self.x + self.width // 2, self.y - i),
+                    (x + self.width // 2, y + self.height - i),
+                    (x, y + self.height // 2 - i),
+                    (x + self.width // 2, y - i),
                 ],
             )
             # Wing detail line
             pygame.draw.aaline(
-                screen,
+                surface,
                 wing_detail_color,
-                (self.x + self.width // 4, self.y + self.height * 0.75),
-                (self.x + self.width // 2, self.y + self.height // 4)
+                (x + self.width // 4, y + self.height * 0.75),
+                (x + self.width // 2, y + self.height // 4)
             )
 
         # Ship cockpit with better shading
@@ -477,18 +1444,18 @@ class Ship:
 
         # Main cockpit circle
         pygame.draw.circle(
-            screen,
+            surface,
             cockpit_color,
-            (self.x + self.width // 4, self.y),
+            (x + self.width // 4, y),
             self.width // 3,
         )
 
         # Cockpit window/glass effect (lighter circle on top)
         window_color = (min(255, cockpit_color[0] + 100), min(255, cockpit_color[1] + 120), min(255, cockpit_color[2] + 150))
         pygame.draw.circle(
-            screen,
+            surface,
             window_color,
-            (self.x + self.width // 4, self.y - 2),
+            (x + self.width // 4, y - 2),
             self.width // 4,
         )
 
@@ -496,66 +1463,193 @@ class Ship:
         highlight_offset = self.width // 6
         highlight_color = (255, 255, 255)
         pygame.draw.circle(
-            screen,
+            surface,
             highlight_color,
-            (self.x + self.width // 4 - highlight_offset // 2, self.y - highlight_offset),
+            (x + self.width // 4 - highlight_offset // 2, y - highlight_offset),
             self.width // 8,
         )
 
-        # Add small detail lights (blinking navigation lights)
-        blink = current_time % 1000 < 500
-        if blink:
-            # Top light
-            pygame.draw.circle(screen, (100, 255, 100),
-                             (self.x + self.width // 2, self.y - self.height // 3), 2)
-            # Bottom light
-            pygame.draw.circle(screen, (255, 100, 100),
-                             (self.x + self.width // 2, self.y + self.height // 3), 2)
-
         # Weapon ports (where lasers fire from)
         weapon_color = (200, 200, 100) if not is_damaged else (255, 150, 100)
-        pygame.draw.circle(screen, weapon_color, (self.x + self.width, self.y), 3)
+        pygame.draw.circle(surface, weapon_color, (x + self.width, y), 3)
+        return surface
+
+    def _render_engine_glow(self, is_damaged, level):
+        """Render both engine glows for one quantized pulse level.
+
+        Args:
+            is_damaged: Whether to use the damaged engine color
+            level: Pulse level in [0, SHIP_ENGINE_PULSE_LEVELS)
+
+        Returns:
+            SRCALPHA surface anchored at _sprite_origin()
+        """
+        size = (self.width * 2 + SHIP_SPRITE_PADDING * 2, self.height * 2 + SHIP_SPRITE_PADDING * 2)
+        x, y = self._sprite_origin()
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        thruster_width = 8
+        thruster_height = 5
+        glow_pulse = level / (SHIP_ENGINE_PULSE_LEVELS - 1)
+        engine_glow = int(100 + glow_pulse * 100)
+        engine_color = (100, 150, 255) if not is_damaged else (255, 150, 100)
+
+        for thruster_y in (y - self.height // 2 - 2, y + self.height // 2 - 3):
+            for i in range(ENGINE_GLOW_LAYERS):
+                alpha = engine_glow - i * 30
+                if alpha > 0:
+                    glow_surf = pygame.Surface((thruster_width + i * 2, thruster_height + i * 2), pygame.SRCALPHA)
+                    glow_surf.fill((*engine_color, alpha))
+                    surface.blit(glow_surf, (x - 2 - i, thruster_y - i))
+        return surface
+
+    def _render_nav_lights(self):
+        """Render the two navigation lights anchored at _sprite_origin()."""
+        size = (self.width * 2 + SHIP_SPRITE_PADDING * 2, self.height * 2 + SHIP_SPRITE_PADDING * 2)
+        x, y = self._sprite_origin()
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        # Top light
+        pygame.draw.circle(surface, (100, 255, 100),
+                         (x + self.width // 2, y - self.height // 3), 2)
+        # Bottom light
+        pygame.draw.circle(surface, (255, 100, 100),
+                         (x + self.width // 2, y + self.height // 3), 2)
+        return surface
+
+    def draw(self, screen, current_time):
+        """Draw the ship from cached hull sprites plus its animated parts.
+
+        Only the engine pulse, navigation light blink and shield change over
+        time; the hull is baked once per color state.
+
+        Args:
+            screen: Pygame surface to draw on
+            current_time: Current tick time (cached for performance)
+        """
+        # Flickering effect when invulnerable
+        if self.invulnerable and current_time % 200 < 100:
+            return
+
+        # Choose sprite set (red flash when damaged)
+        is_damaged = self.damage_flash_timer > 0
+        size_key = (self.width, self.height)
+        underlay = SHIP_SPRITES.get(
+            ("underlay", size_key, is_damaged), lambda: self._render_underlay(is_damaged)
+        )
+        hull = SHIP_SPRITES.get(("hull", size_key, is_damaged), lambda: self._render_hull(is_damaged))
+        origin_x, origin_y = self._sprite_origin()
+        pos = (int(self.x) - origin_x, int(self.y) - origin_y)
+        screen.blit(underlay, pos)
+
+        # Engine glow (animated)
+        glow_pulse = (math.sin(current_time / 100) + 1) / 2
+        level = round(glow_pulse * (SHIP_ENGINE_PULSE_LEVELS - 1))
+        engine = SHIP_SPRITES.get(
+            ("engine", size_key, is_damaged, level), lambda: self._render_engine_glow(is_damaged, level)
+        )
+        screen.blit(engine, pos)
+
+        screen.blit(hull, pos)
+
+        # Blinking navigation lights
+        if current_time % 1000 < 500:
+            screen.blit(SHIP_SPRITES.get(("nav_lights", size_key), self._render_nav_lights), pos)
 
         # Draw hexagonal shield pattern if active
         if self.has_shield:
             shield_radius = max(self.width, self.height)
-            shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
-            shield_center = (shield_radius, shield_radius)
-
-            # Draw hexagonal pattern with multiple layers
-            for layer in range(HEXAGON_LAYERS):
-                layer_radius = shield_radius - layer * (shield_radius // HEXAGON_LAYERS)
-                num_hexagons = max(1, 6 - layer * 2)  # Fewer hexagons in inner layers
-
-                for hex_idx in range(num_hexagons):
-                    # Position hexagons around the shield
-                    angle = (360 / num_hexagons) * hex_idx + current_time / 20
-                    hex_x = shield_center[0] + layer_radius * 0.7 * math.cos(math.radians(angle))
-                    hex_y = shield_center[1] + layer_radius * 0.7 * math.sin(math.radians(angle))
-
-                    # Draw hexagon
-                    hex_points = []
-                    for i in range(6):
-                        point_angle = angle + i * 60
-                        px = hex_x + HEXAGON_RADIUS * math.cos(math.radians(point_angle))
-                        py = hex_y + HEXAGON_RADIUS * math.sin(math.radians(point_angle))
-                        hex_points.append((int(px), int(py)))
-
-                    # Pulsing alpha effect
-                    pulse = (math.sin(current_time / 200.0) + 1) / 2
-                    alpha = int((60 + pulse * 40) * (1.0 - layer * 0.2))
-                    hex_color = (*SHIELD_COLOR, alpha)
-
-                    pygame.draw.polygon(shield_surface, hex_color, hex_points, 2)
+            rotation = (current_time / 20) % SHIELD_ROTATION_PERIOD
+            frame_index = int(rotation / SHIELD_ROTATION_PERIOD * SHIELD_ROTATION_FRAMES)
+            frame = SHIELD_FRAMES.get(
+                (shield_radius, frame_index), lambda: self._render_shield_frame(shield_radius, frame_index)
+            )
 
+            # Pulse and remaining time modulate the whole frame's alpha
+            pulse = (math.sin(current_time / 200.0) + 1) / 2
+            remaining = min(1.0, self.shield_timer / SHIELD_FADE_FRAMES)
+            fade = SHIELD_MIN_FADE + (1.0 - SHIELD_MIN_FADE) * remaining
+            frame.set_alpha(int(255 * (60 + pulse * 40) / 100 * fade))
             screen.blit(
-                shield_surface,
+                frame,
                 (
                     int(self.x - shield_radius + self.width // 2),
                     int(self.y - shield_radius),
                 ),
             )
 
+    def _render_shield_frame(self, shield_radius, frame_index):
+        """Render one rotation frame of the hexagonal shield at full pulse.
+
+        The pattern repeats every SHIELD_ROTATION_PERIOD degrees, so a loop of
+        SHIELD_ROTATION_FRAMES frames covers the whole animation.
+
+        Args:
+            shield_radius: Outer shield radius in pixels
+            frame_index: Rotation frame in [0, SHIELD_ROTATION_FRAMES)
+
+        Returns:
+            SRCALPHA surface of size (2 * shield_radius, 2 * shield_radius)
+        """
+        shield_surface = pygame.Surface((shield_radius * 2, shield_radius * 2), pygame.SRCALPHA)
+        shield_center = (shield_radius, shield_radius)
+        rotation = frame_index * SHIELD_ROTATION_PERIOD / SHIELD_ROTATION_FRAMES
+
+        # Draw hexagonal pattern with multiple layers
+        for layer in range(HEXAGON_LAYERS):
+            layer_radius = shield_radius - layer * (shield_radius // HEXAGON_LAYERS)
+            num_hexagons = max(1, 6 - layer * 2)  # Fewer hexagons in inner layers
+            alpha = int(100 * (1.0 - layer * 0.2))
+            hex_color = (*SHIELD_COLOR, alpha)
+
+            for hex_idx in range(num_hexagons):
+                # Position hexagons around the shield
+                angle = (360 / num_hexagons) * hex_idx + rotation
+                hex_x = shield_center[0] + layer_radius * 0.7 * math.cos(math.radians(angle))
+                hex_y = shield_center[1] + layer_radius * 0.7 * math.sin(math.radians(angle))
+
+                # Draw hexagon
+                hex_points = []
+                for i in range(6):
+                    point_angle = angle + i * 60
+                    px = hex_x + HEXAGON_RADIUS * math.cos(math.radians(point_angle))
+                    py = hex_y + HEXAGON_RADIUS * math.sin(math.radians(point_angle))
+                    hex_points.append((int(px), int(py)))
+
+                pygame.draw.polygon(shield_surface, hex_color, hex_points, 2)
+        return shield_surface
+
+    def _collision_shape(self):
+        """Return the cached (mask, bounding radius) of the hull and thrusters."""
+        size_key = (self.width, self.height)
+        shape = SHIP_MASKS.get(size_key)
+        if shape is None:
+            underlay = SHIP_SPRITES.get(("underlay", size_key, False), lambda: self._render_underlay(False))
+            hull = SHIP_SPRITES.get(("hull", size_key, False), lambda: self._render_hull(False))
+            # The faint aura falls below the mask threshold; thrusters and hull are solid
+            mask = pygame.mask.from_surface(underlay)
+            mask.draw(pygame.mask.from_surface(hull), (0, 0))
+            origin_x, origin_y = self._sprite_origin()
+            center_x, center_y = origin_x + self.width // 2, origin_y
+            bounding_radius = max(
+                math.hypot(px - center_x, py - center_y) for px, py in mask.outline()
+            ) + 1
+            shape = (mask, bounding_radius)
+            SHIP_MASKS[size_key] = shape
+        return shape
+
+    def get_mask(self):
+        """Return the ship collision mask and its screen position.
+
+        Returns:
+            Tuple of (mask, left, top) matching where draw() blits the hull
+        """
+        mask, _ = self._collision_shape()
+        origin_x, origin_y = self._sprite_origin()
+        return mask, int(self.x) - origin_x, int(self.y) - origin_y
+
+    def get_bounding_radius(self):
+        """Return the distance from get_center() to the farthest hull pixel."""
+        return self._collision_shape()[1]
+
     def get_center(self):
         """Return the center point of the ship.
 
@@ -621,8 +1715,18 @@ class Asteroid:
         mineral_points: Pre-calculated mineral sparkle positions
         texture_patches: Pre-calculated texture variation patches
         previous_positions: Recent positions for motion blur trail effect
+        rim_light: Pre-rendered rim lighting arcs (not rotated)
+        shape_id: Unique id of this procedural look, keys ASTEROID_FRAMES
+        bounding_radius: Distance from the center to the farthest body pixel
     """
 
+    __slots__ = (
+        "x", "y", "radius", "base_speed", "velocity_x", "velocity_y", "points", "size_category",
+        "angle", "rotation_speed", "previous_positions", "colors", "shape_points", "cracks",
+        "craters", "has_minerals", "mineral_points", "texture_patches", "rim_light",
+        "shape_id", "bounding_radius",
+    )
+
     def __init__(
         self, x, y, radius, speed_multiplier=1.0, velocity_x=None, velocity_y=None
     ):
@@ -636,6 +1740,25 @@ class Asteroid:
             velocity_x: Custom horizontal velocity (default: -base_speed)
             velocity_y: Custom vertical velocity (default: 0)
         """
+        # Feature containers are created once and refilled by reset()
+        self.previous_positions = []  # List of (x, y) positions for motion blur
+        self.shape_points = []
+        self.cracks = []
+        self.craters = []
+        self.mineral_points = []
+        self.texture_patches = []
+        self.reset(x, y, radius, speed_multiplier, velocity_x, velocity_y)
+
+    def reset(
+        self, x, y, radius, speed_multiplier=1.0, velocity_x=None, velocity_y=None
+    ):
+        """Re-initialize this asteroid in place with a new procedural look.
+
+        Takes the same arguments as the constructor. Feature lists are cleared
+        and refilled rather than reallocated, and a new shape id keeps the old
+        look's rotated frames and masks from being reused, so pooled asteroids
+        can be reused.
+        """
         self.x = x
         self.y = y
         self.radius = radius
@@ -658,7 +1781,7 @@ class Asteroid:
         self.rotation_speed = random.uniform(-2, 2)  # degrees per frame
 
         # Motion blur tracking
-        self.previous_positions = []  # List of (x, y) positions for motion blur
+        self.previous_positions.clear()
 
         # Rock type determines color scheme
         rock_types = [
@@ -670,7 +1793,7 @@ class Asteroid:
         self.colors = random.choice(rock_types)
 
         # Generate irregular shape (polygon instead of perfect circle)
-        self.shape_points = []
+        self.shape_points.clear()
         num_points = random.randint(8, 12)
         for i in range(num_points):
             angle_deg = (360 / num_points) * i + random.uniform(-15, 15)
@@ -678,7 +1801,7 @@ class Asteroid:
             self.shape_points.append((angle_deg, distance))
 
         # Generate random crack patterns for visual variety
-        self.cracks = []
+        self.cracks.clear()
         num_cracks = random.randint(3, 6)
         for _ in range(num_cracks):
             # Random crack from center to edge
@@ -689,7 +1812,7 @@ class Asteroid:
             self.cracks.append((angle_offset, start_dist, end_dist, width))
 
         # Generate surface features (craters, ridges)
-        self.craters = []
+        self.craters.clear()
         num_craters = random.randint(3, 6)
         for _ in range(num_craters):
             crater_angle = random.uniform(0, 360)
@@ -699,7 +1822,7 @@ class Asteroid:
 
         # Some asteroids have mineral sparkles
         self.has_minerals = random.random() < 0.3  # 30% chance
-        self.mineral_points = []
+        self.mineral_points.clear()
         if self.has_minerals:
             num_minerals = random.randint(3, 8)
             for _ in range(num_minerals):
@@ -709,7 +1832,7 @@ class Asteroid:
                 self.mineral_points.append((mineral_angle, mineral_dist, mineral_brightness))
 
         # Generate texture patches (pre-calculated to prevent flickering)
-        self.texture_patches = []
+        self.texture_patches.clear()
         num_patches = random.randint(2, 4) if self.radius > 30 else random.randint(1, 2)
         for _ in range(num_patches):
             patch_angle = random.uniform(0, 360)
@@ -717,6 +1840,12 @@ class Asteroid:
             patch_size = random.uniform(self.radius * 0.2, self.radius * 0.4)
             self.texture_patches.append((patch_angle, patch_dist, patch_size))
 
+        # Pre-render the rim light; body frames are rendered lazily per rotation bucket
+        self.shape_id = next(ASTEROID_SHAPE_IDS)
+        self.rim_light = self._render_rim_light()
+        # Farthest polygon vertex plus outline width and rotation rounding
+        self.bounding_radius = max(distance for _, distance in self.shape_points) + 3
+
     def update(self, time_scale=1.0):
         """Move asteroid with custom velocity.
 
@@ -736,103 +1865,86 @@ class Asteroid:
         elif self.angle < 0:
             self.angle += 360
 
-    def _rotate_point(self, offset_x, offset_y):
-        """Rotate a point around the asteroid center based on current angle."""
-        angle_rad = math.radians(self.angle)
-        rotated_x = offset_x * math.cos(angle_rad) - offset_y * math.sin(angle_rad)
-        rotated_y = offset_x * math.sin(angle_rad) + offset_y * math.cos(angle_rad)
-        return self.x + rotated_x, self.y + rotated_y
+    def _render_body(self, bucket):
+        """Render the static asteroid body at one rotation bucket.
 
-    def draw(self, screen, current_time):
-        """Draw the asteroid with irregular shape, realistic texturing, and details.
+        The polygon, texture patches, craters and cracks never change after
+        construction, so each bucket is drawn once at its angle instead of
+        resampling a single sprite with pygame.transform.rotate. Crater rim
+        highlights keep their fixed upper-left offset on screen. The outline is
+        drawn over the rim light and minerals in draw().
 
         Args:
-            screen: Pygame surface to draw on
-            current_time: Current tick time (cached for performance)
+            bucket: Rotation bucket index
+
+        Returns:
+            SRCALPHA surface with the asteroid centered in it
         """
-        # Draw motion blur ghost images
-        num_ghosts = len(self.previous_positions)
-        for i, (ghost_x, ghost_y) in enumerate(self.previous_positions):
-            # Calculate fade for ghost (older = more transparent)
-            alpha = int(40 * (i + 1) / (num_ghosts + 1))
-            ghost_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-            ghost_color = (*self.colors[0], alpha)
-            pygame.draw.circle(ghost_surface, ghost_color, (self.radius, self.radius), self.radius)
-            screen.blit(ghost_surface, (int(ghost_x - self.radius), int(ghost_y - self.radius)))
+        angle = bucket * ASTEROID_ROTATION_STEP
+        half_size = int(self.radius * 1.1) + 2
+        sprite = pygame.Surface((half_size * 2, half_size * 2), pygame.SRCALPHA)
+        center = half_size
+
+        def offset(angle_deg, distance):
+            return (
+                center + distance * math.cos(math.radians(angle + angle_deg)),
+                center + distance * math.sin(math.radians(angle + angle_deg)),
+            )
 
-        # Calculate rotated polygon points for irregular shape
-        rotated_points = []
-        for angle_deg, distance in self.shape_points:
-            total_angle = self.angle + angle_deg
-            px = self.x + distance * math.cos(math.radians(total_angle))
-            py = self.y + distance * math.sin(math.radians(total_angle))
-            rotated_points.append((int(px), int(py)))
+        # Irregular polygon outline
+        points = [
+            (int(px), int(py))
+            for px, py in (offset(angle_deg, distance) for angle_deg, distance in self.shape_points)
+        ]
 
         # Draw shadow/dark base layer first
         shadow_color = tuple(int(c * 0.6) for c in self.colors[0])
-        pygame.draw.polygon(screen, shadow_color, rotated_points)
+        pygame.draw.polygon(sprite, shadow_color, points)
 
         # Draw main irregular asteroid body with custom colors
-        pygame.draw.polygon(screen, self.colors[0], rotated_points)
+        pygame.draw.polygon(sprite, self.colors[0], points)
 
         # Add texture with varied-color patches (simulate rock surface variation)
         for patch_angle, patch_dist, patch_size in self.texture_patches:
-            patch_x, patch_y = self._rotate_point(
-                math.cos(math.radians(patch_angle)) * patch_dist,
-                math.sin(math.radians(patch_angle)) * patch_dist
-            )
+            patch_x, patch_y = offset(patch_angle, patch_dist)
             # Use middle color for patches
-            pygame.draw.circle(
-                screen,
-                self.colors[1],
-                (int(patch_x), int(patch_y)),
-                int(patch_size)
-            )
+            pygame.draw.circle(sprite, self.colors[1], (int(patch_x), int(patch_y)), int(patch_size))
 
         # Draw craters with depth
         for crater_angle, crater_dist, crater_size in self.craters:
-            crater_x, crater_y = self._rotate_point(
-                math.cos(math.radians(crater_angle)) * crater_dist,
-                math.sin(math.radians(crater_angle)) * crater_dist
-            )
+            crater_x, crater_y = offset(crater_angle, crater_dist)
             # Dark crater base
-            pygame.draw.circle(
-                screen,
-                self.colors[2],
-                (int(crater_x), int(crater_y)),
-                int(crater_size)
-            )
+            pygame.draw.circle(sprite, self.colors[2], (int(crater_x), int(crater_y)), int(crater_size))
             # Lighter crater rim for depth
-            rim_offset_x = crater_size * 0.2
-            rim_offset_y = crater_size * 0.2
+            rim_offset = crater_size * 0.2
             pygame.draw.circle(
-                screen,
+                sprite,
                 self.colors[1],
-                (int(crater_x - rim_offset_x), int(crater_y - rim_offset_y)),
+                (int(crater_x - rim_offset), int(crater_y - rim_offset)),
                 int(crater_size * 0.7)
             )
 
-        # Draw cracks with varying width
+        # Draw cracks as very dark lines with varying width
+        crack_color = tuple(int(c * 0.4) for c in self.colors[0])
         for crack_angle, start_dist, end_dist, width in self.cracks:
-            start_x, start_y = self._rotate_point(
-                math.cos(math.radians(crack_angle)) * start_dist,
-                math.sin(math.radians(crack_angle)) * start_dist
-            )
-            end_x, end_y = self._rotate_point(
-                math.cos(math.radians(crack_angle)) * end_dist,
-                math.sin(math.radians(crack_angle)) * end_dist
-            )
-            # Draw crack as very dark line
-            crack_color = tuple(int(c * 0.4) for c in self.colors[0])
+            start_x, start_y = offset(crack_angle, start_dist)
+            end_x, end_y = offset(crack_angle, end_dist)
             pygame.draw.line(
-                screen,
+                sprite,
                 crack_color,
                 (int(start_x), int(start_y)),
                 (int(end_x), int(end_y)),
                 width
             )
 
-        # Add rim lighting effect (as if lit from top-right)
+        return sprite
+
+    def _render_rim_light(self):
+        """Render the rim lighting arcs (lit from top-right, independent of rotation).
+
+        Returns:
+            SRCALPHA surface sized radius * 2 + 10 on each side
+        """
         rim_surface = pygame.Surface((self.radius * 2 + 10, self.radius * 2 + 10), pygame.SRCALPHA)
 
         # Draw multiple arcs with decreasing alpha for soft glow
@@ -857,7 +1969,72 @@ class Asteroid:
                 thickness
             )
 
-        screen.blit(rim_surface, (int(self.x - self.radius - 5), int(self.y - self.radius - 5)))
+        return rim_surface
+
+    def _rotation_bucket(self):
+        """Return the index of the pre-rotated frame closest to the current angle."""
+        return int(self.angle / ASTEROID_ROTATION_STEP + 0.5) % ASTEROID_ROTATION_BUCKETS
+
+    def get_rotated_sprite(self):
+        """Return the body sprite rendered at the current angle bucket.
+
+        Frames are rendered lazily on first use and shared through the bounded
+        ASTEROID_FRAMES cache.
+
+        Returns:
+            Tuple of (surface, bucket_angle) where bucket_angle is the quantized
+            rotation in degrees that the surface was rendered at
+        """
+        bucket = self._rotation_bucket()
+        frame = ASTEROID_FRAMES.get(
+            (self.shape_id, self.radius, bucket), lambda: self._render_body(bucket)
+        )
+        return frame, bucket * ASTEROID_ROTATION_STEP
+
+    def _outline_points(self, center_x, center_y, angle):
+        """Return the integer polygon outline rotated by angle around a center."""
+        points = []
+        for angle_deg, distance in self.shape_points:
+            total_angle = angle + angle_deg
+            px = center_x + distance * math.cos(math.radians(total_angle))
+            py = center_y + distance * math.sin(math.radians(total_angle))
+            points.append((int(px), int(py)))
+        return points
+
+    def _rotate_point(self, offset_x, offset_y, angle):
+        """Rotate a point around the asteroid center by the given angle in degrees."""
+        angle_rad = math.radians(angle)
+        rotated_x = offset_x * math.cos(angle_rad) - offset_y * math.sin(angle_rad)
+        rotated_y = offset_x * math.sin(angle_rad) + offset_y * math.cos(angle_rad)
+        return self.x + rotated_x, self.y + rotated_y
+
+    def draw(self, screen, current_time):
+        """Draw the asteroid from its pre-rendered sprite plus animated details.
+
+        Args:
+            screen: Pygame surface to draw on
+            current_time: Current tick time (cached for performance)
+        """
+        # Draw motion blur ghost images
+        num_ghosts = len(self.previous_positions)
+        for i, (ghost_x, ghost_y) in enumerate(self.previous_positions):
+            # Calculate fade for ghost (older = more transparent)
+            alpha = int(40 * (i + 1) / (num_ghosts + 1))
+            ghost_surface = GHOST_SPRITES.get(
+                (self.radius, self.colors[0], alpha),
+                lambda: _render_disc(self.radius, self.colors[0], alpha)
+            )
+            screen.blit(ghost_surface, (int(ghost_x - self.radius), int(ghost_y - self.radius)))
+
+        # Blit the pre-rotated body (polygon, patches, craters, cracks)
+        body, sprite_angle = self.get_rotated_sprite()
+        screen.blit(
+            body,
+            (int(self.x) - body.get_width() // 2, int(self.y) - body.get_height() // 2)
+        )
+
+        # Add rim lighting effect (as if lit from top-right)
+        screen.blit(self.rim_light, (int(self.x - self.radius - 5), int(self.y - self.radius - 5)))
 
         # Draw mineral sparkles if present
         if self.has_minerals:
@@ -868,7 +2045,8 @@ class Asteroid:
 
                 mineral_x, mineral_y = self._rotate_point(
                     math.cos(math.radians(mineral_angle)) * mineral_dist,
-                    math.sin(math.radians(mineral_angle)) * mineral_dist
+                    math.sin(math.radians(mineral_angle)) * mineral_dist,
+                    sprite_angle
                 )
 
                 # Draw sparkle with glow
@@ -879,8 +2057,13 @@ class Asteroid:
                     pygame.draw.circle(sparkle_surf, (*sparkle_color, alpha), (size, size), size)
                     screen.blit(sparkle_surf, (int(mineral_x - size), int(mineral_y - size)))
 
-        # Add outline to irregular shape for definition
-        pygame.draw.polygon(screen, tuple(int(c * 0.7) for c in self.colors[0]), rotated_points, 1)
+        # Add outline to irregular shape for definition (on top, at the sprite's angle)
+        pygame.draw.polygon(
+            screen,
+            tuple(int(c * 0.7) for c in self.colors[0]),
+            self._outline_points(self.x, self.y, sprite_angle),
+            1
+        )
 
     def is_off_screen(self):
         """Check if asteroid has moved completely off the left side of screen.
@@ -890,21 +2073,71 @@ class Asteroid:
         """
         return self.x < -self.radius
 
+    def get_mask(self):
+        """Return the collision mask for the current rotation bucket.
+
+        Masks are built from the rotated body sprite plus the outline drawn over
+        it on first use and shared through ASTEROID_MASKS under the same key as
+        the frame.
+
+        Returns:
+            Tuple of (mask, left, top) with the mask's screen position
+        """
+        mask = ASTEROID_MASKS.get(
+            (self.shape_id, self.radius, self._rotation_bucket()), self._render_mask
+        )
+        width, height = mask.get_size()
+        return mask, int(self.x) - width // 2, int(self.y) - height // 2
+
+    def _render_mask(self):
+        """Build the collision mask of the current rotated frame and its outline."""
+        frame, sprite_angle = self.get_rotated_sprite()
+        mask = pygame.mask.from_surface(frame)
+        width, height = frame.get_size()
+        outline = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.polygon(
+            outline, (255, 255, 255), self._outline_points(width // 2, height // 2, sprite_angle), 1
+        )
+        mask.draw(pygame.mask.from_surface(outline), (0, 0))
+        return mask
+
+    def mask_overlaps(self, mask, left, top):
+        """Check whether another mask placed at (left, top) touches the asteroid's pixels.
+
+        Args:
+            mask: pygame.mask.Mask of the other object
+            left: Screen x of the other mask's top-left corner
+            top: Screen y of the other mask's top-left corner
+
+        Returns:
+            True if any set pixels overlap, False otherwise
+        """
+        own_mask, own_left, own_top = self.get_mask()
+        return own_mask.overlap(mask, (left - own_left, top - own_top)) is not None
+
     def collides_with_ship(self, ship):
-        """Check collision with ship using circular collision detection.
+        """Check pixel-accurate collision with ship.
+
+        A bounding-circle test runs first; the masks are only compared when
+        the circles overlap. Game.check_collisions batches the same test;
+        this per-object form is the reference tests/test_collisions.py
+        checks it against.
 
         Args:
             ship: Ship object to check collision against
 
         Returns:
-            True if asteroid and ship are overlapping, False otherwise
+            True if asteroid and ship pixels are overlapping, False otherwise
         """
         ship_center = ship.get_center()
         distance_squared = (ship_center[0] - self.x) ** 2 + (
             ship_center[1] - self.y
         ) ** 2
-        collision_radius = self.radius + ship.width // 2
-        return distance_squared < collision_radius**2
+        collision_radius = self.bounding_radius + ship.get_bounding_radius()
+        if distance_squared >= collision_radius**2:
+            return False
+        ship_mask, ship_left, ship_top = ship.get_mask()
+        return self.mask_overlaps(ship_mask, ship_left, ship_top)
 
     def can_break(self):
         """Check if asteroid can break into smaller pieces.
@@ -914,7 +2147,7 @@ class Asteroid:
         """
         return self.size_category in ["large", "medium"]
 
-    def create_children(self, difficulty_multiplier=1.0):
+    def create_children(self, difficulty_multiplier=1.0, pool=None):
         """Create smaller child asteroids when this one is destroyed.
 
         Large asteroids spawn 3 medium children, medium spawn 2 small.
@@ -922,6 +2155,7 @@ class Asteroid:
 
         Args:
             difficulty_multiplier: Speed multiplier based on current difficulty
+            pool: Optional ObjectPool to draw the children from
 
         Returns:
             List of 2-3 new Asteroid objects, or empty list if already small
@@ -954,7 +2188,8 @@ class Asteroid:
             child_x = self.x + math.cos(math.radians(offset_angle)) * offset_dist
             child_y = self.y + math.sin(math.radians(offset_angle)) * offset_dist
 
-            child = Asteroid(
+            spawn = pool.acquire if pool is not None else Asteroid
+            child = spawn(
                 child_x, child_y, child_radius, difficulty_multiplier, vx, vy
             )
             children.append(child)
@@ -985,6 +2220,11 @@ class Boss:
         glow_pulse: Pulsing glow animation counter
     """
 
+    __slots__ = (
+        "center_x", "center_y", "x", "y", "radius", "max_health", "health", "speed", "points",
+        "pattern", "time", "angle", "glow_pulse",
+    )
+
     def __init__(self, pattern="sine", difficulty_level=1.0):
         """Initialize a boss with the specified movement pattern and difficulty.
 
@@ -1067,56 +2307,82 @@ class Boss:
         self.x = max(self.radius, min(WIDTH - self.radius, self.x))
         self.y = max(self.radius, min(HEIGHT - self.radius, self.y))
 
-    def draw(self, screen):
-        """Draw the boss with special effects."""
-        # Pulsing glow effect
-        glow_intensity = int(50 + 30 * math.sin(math.radians(self.glow_pulse)))
-        glow_color = (
-            min(255, BOSS_GLOW_COLOR[0] + glow_intensity),
-            min(255, BOSS_GLOW_COLOR[1] + glow_intensity // 2),
-            min(255, BOSS_GLOW_COLOR[2] + glow_intensity // 2),
-        )
+    def _render_body(self, step):
+        """Render the body, rotating details and outer ring for one rotation step.
 
-        # Draw glow rings
-        for i in range(3):
-            glow_radius = self.radius + 10 + i * 8
-            alpha = 80 - i * 25
-            s = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(
-                s, (*glow_color, alpha), (glow_radius, glow_radius), glow_radius, 3
-            )
-            screen.blit(s, (int(self.x - glow_radius), int(self.y - glow_radius)))
+        The eight details repeat every 45 degrees, so BOSS_ROTATION_FRAMES
+        one-degree steps cover the full rotation.
+
+        Args:
+            step: Rotation step in [0, BOSS_ROTATION_FRAMES)
+
+        Returns:
+            SRCALPHA surface of size (2 * radius, 2 * radius)
+        """
+        surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
+        center = (self.radius, self.radius)
 
         # Main boss body (darker red)
-        pygame.draw.circle(screen, BOSS_COLOR, (int(self.x), int(self.y)), self.radius)
+        pygame.draw.circle(surface, BOSS_COLOR, center, self.radius)
 
         # Rotating details
         for i in range(8):
-            detail_angle = self.angle + (i * 45)
+            detail_angle = step + (i * 45)
             detail_dist = self.radius * 0.7
-            detail_x = self.x + detail_dist * math.cos(math.radians(detail_angle))
-            detail_y = self.y + detail_dist * math.sin(math.radians(detail_angle))
+            detail_x = center[0] + detail_dist * math.cos(math.radians(detail_angle))
+            detail_y = center[1] + detail_dist * math.sin(math.radians(detail_angle))
             pygame.draw.circle(
-                screen,
+                surface,
                 BOSS_DETAIL_COLOR,
                 (int(detail_x), int(detail_y)),
                 self.radius // 4,
             )
 
-        # Center core (pulsing)
-        core_size = int(self.radius // 3 + 5 * math.sin(math.radians(self.glow_pulse)))
-        pygame.draw.circle(screen, glow_color, (int(self.x), int(self.y)), core_size)
+        # Outer ring (never overlapped by the core or veins drawn later)
+        pygame.draw.circle(surface, BOSS_DETAIL_COLOR, center, self.radius, 4)
+        return surface
 
-        # Energy veins animation - pulsing lines from center to edges
-        vein_surface = pygame.Surface((self.radius * 2, self.radius * 2), pygame.SRCALPHA)
-        vein_pulse = (math.sin(self.time * 0.1) + 1) / 2  # 0 to 1
+    def _render_glow_rings(self, glow_color):
+        """Render the three glow rings for one pulse color.
+
+        Args:
+            glow_color: RGB ring color
+
+        Returns:
+            SRCALPHA surface centered on the boss, of size 2 * BOSS_GLOW_EXTENT
+        """
+        extent = self.radius + BOSS_GLOW_EXTENT
+        surface = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        # The rings do not overlap, so they can share one surface
+        for i in range(3):
+            glow_radius = self.radius + 10 + i * 8
+            alpha = 80 - i * 25
+            pygame.draw.circle(surface, (*glow_color, alpha), (extent, extent), glow_radius, 3)
+        return surface
+
+    def _vein_extent(self):
+        """Return the half-size of the vein sprites (longest vein plus line width)."""
+        return int(self.radius * 0.8) + 2
+
+    def _render_veins(self, phase):
+        """Render the energy veins for one phase of their animation loop.
+
+        Args:
+            phase: Frame in [0, BOSS_VEIN_CYCLE)
+
+        Returns:
+            SRCALPHA surface centered on the boss, of size 2 * _vein_extent()
+        """
+        extent = self._vein_extent()
+        vein_surface = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        vein_pulse = (math.sin(phase * 2 * math.pi / BOSS_VEIN_CYCLE) + 1) / 2  # 0 to 1
         for i in range(6):  # 6 veins
-            vein_angle = (self.time * 2 + i * 60) % 360
+            vein_angle = (phase * 2 + i * 60) % 360
             vein_length = self.radius * (0.5 + vein_pulse * 0.3)
-            start_x = self.radius
-            start_y = self.radius
-            end_x = self.radius + vein_length * math.cos(math.radians(vein_angle))
-            end_y = self.radius + vein_length * math.sin(math.radians(vein_angle))
+            start_x = extent
+            start_y = extent
+            end_x = extent + vein_length * math.cos(math.radians(vein_angle))
+            end_y = extent + vein_length * math.sin(math.radians(vein_angle))
 
             vein_alpha = int(120 + vein_pulse * 80)
             vein_color = (255, 100 + int(vein_pulse * 100), 100, vein_alpha)
@@ -1128,13 +2394,43 @@ class Boss:
                 (int(end_x), int(end_y)),
                 2
             )
+        return vein_surface
 
-        screen.blit(vein_surface, (int(self.x - self.radius), int(self.y - self.radius)))
+    def draw(self, screen):
+        """Draw the boss from cached body, glow ring and vein sprites."""
+        x = int(self.x)
+        y = int(self.y)
 
-        # Outer ring
-        pygame.draw.circle(
-            screen, BOSS_DETAIL_COLOR, (int(self.x), int(self.y)), self.radius, 4
+        # Pulsing glow effect
+        pulse = math.sin(math.radians(self.glow_pulse))
+        glow_intensity = int(50 + 30 * pulse)
+        glow_color = (
+            min(255, BOSS_GLOW_COLOR[0] + glow_intensity),
+            min(255, BOSS_GLOW_COLOR[1] + glow_intensity // 2),
+            min(255, BOSS_GLOW_COLOR[2] + glow_intensity // 2),
+        )
+
+        # Draw glow rings
+        glow_rings = BOSS_SPRITES.get(
+            ("glow", self.radius, glow_color), lambda: self._render_glow_rings(glow_color)
         )
+        extent = self.radius + BOSS_GLOW_EXTENT
+        screen.blit(glow_rings, (x - extent, y - extent))
+
+        # Body with rotating details and outer ring
+        step = self.angle % BOSS_ROTATION_FRAMES
+        body = BOSS_SPRITES.get(("body", self.radius, step), lambda: self._render_body(step))
+        screen.blit(body, (x - self.radius, y - self.radius))
+
+        # Center core (pulsing)
+        core_size = int(self.radius // 3 + 5 * pulse)
+        pygame.draw.circle(screen, glow_color, (x, y), core_size)
+
+        # Energy veins animation - pulsing lines from center to edges
+        phase = self.time % BOSS_VEIN_CYCLE
+        veins = BOSS_SPRITES.get(("veins", self.radius, phase), lambda: self._render_veins(phase))
+        extent = self._vein_extent()
+        screen.blit(veins, (x - extent, y - extent))
 
     def take_damage(self, damage=1):
         """Boss takes damage from laser hit."""
@@ -1146,7 +2442,7 @@ class Boss:
         return self.x < -self.radius
 
     def collides_with_ship(self, ship):
-        """Check collision with ship."""
+        """Check collision with ship (reference for the batched ship-boss test)."""
         ship_center = ship.get_center()
         distance_squared = (ship_center[0] - self.x) ** 2 + (
             ship_center[1] - self.y
@@ -1158,7 +2454,17 @@ class Boss:
 class Laser:
     """Laser projectile fired by the ship."""
 
+    __slots__ = (
+        "x", "y", "width", "height", "speed", "angle", "vx", "vy", "trail_segments",
+    )
+
     def __init__(self, x, y, angle=0):
+        # Trail segments for fading trail effect (ring buffer, oldest first)
+        self.trail_segments = deque(maxlen=LASER_TRAIL_LENGTH)  # (x, y) positions
+        self.reset(x, y, angle)
+
+    def reset(self, x, y, angle=0):
+        """Re-initialize this laser in place (used by the laser pool)."""
         self.x = x
         self.y = y
         self.width = LASER_WIDTH
@@ -1168,136 +2474,199 @@ class Laser:
         # Calculate velocity based on angle
         self.vx = self.speed * math.cos(math.radians(angle))
         self.vy = self.speed * math.sin(math.radians(angle))
-        # Trail segments for fading trail effect
-        self.trail_segments = []  # List of (x, y) positions
+        self.trail_segments.clear()
 
     def update(self):
         """Move laser."""
-        # Store current position for trail
+        # Store current position for trail; the deque drops the oldest segment
         self.trail_segments.append((self.x, self.y))
-        # Keep only last N segments
-        if len(self.trail_segments) > LASER_TRAIL_LENGTH:
-            self.trail_segments.pop(0)
 
         self.x += self.vx
         self.y += self.vy
 
-    def draw(self, screen):
-        """Draw the laser with glow effect and fading trail."""
-        # Draw fading trail segments
-        num_segments = len(self.trail_segments)
-        for i, (trail_x, trail_y) in enumerate(self.trail_segments):
-            # Calculate fade factor (older segments are more faded)
-            fade_factor = (i + 1) / (num_segments + 1)
-            trail_alpha = int(255 * fade_factor * 0.6)  # Max 60% opacity for trails
-
-            # Create semi-transparent surface for trail segment
-            trail_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            trail_color = (*LASER_COLOR, trail_alpha)
-            pygame.draw.rect(trail_surface, trail_color, (0, 0, self.width, self.height))
-            screen.blit(trail_surface, (int(trail_x), int(trail_y - 3)))
-
-        # Draw main laser body with glow effect
-        pygame.draw.rect(
-            screen, LASER_COLOR, (int(self.x), int(self.y - 3), self.width, self.height)
-        )
-        pygame.draw.rect(
-            screen, LASER_GLOW_COLOR, (int(self.x), int(self.y - 2), self.width, 4)
-        )
+    def add_blits(self, sequence):
+        """Append the trail and body sprites of this laser to a blit sequence.
+
+        Args:
+            sequence: List of (surface, position) pairs for Surface.fblits
+        """
+        # Fading trail segments (older segments are more faded)
+        trail_alphas = LASER_TRAIL_ALPHAS[len(self.trail_segments)]
+        for trail_alpha, (trail_x, trail_y) in zip(trail_alphas, self.trail_segments):
+            trail_sprite = LASER_SPRITES.get(
+                ("trail", trail_alpha), lambda: _render_laser_trail(trail_alpha)
+            )
+            sequence.append((trail_sprite, (int(trail_x), int(trail_y - 3))))
+
+        # Main laser body with glow effect
+        sequence.append((LASER_SPRITES.get(("body",), _render_laser_body), (int(self.x), int(self.y - 3))))
 
     def is_off_screen(self):
         """Check if laser is off-screen."""
         return self.x > WIDTH or self.x < 0 or self.y > HEIGHT or self.y < 0
 
+    def get_rect(self):
+        """Return the (left, top, right, bottom) of the laser body as drawn."""
+        left = int(self.x)
+        top = int(self.y - 3)
+        return left, top, left + self.width, top + self.height
+
     def collides_with_asteroid(self, asteroid):
-        """Check collision with asteroid using rectangle-circle collision."""
-        return (
-            self.x < asteroid.x + asteroid.radius
-            and self.x + self.width > asteroid.x - asteroid.radius
-            and self.y < asteroid.y + asteroid.radius
-            and self.y + self.height > asteroid.y - asteroid.radius
-        )
+        """Check pixel-accurate collision with asteroid.
+
+        The laser body is first tested against the box around the asteroid's
+        bounding circle; the masks are only compared when that passes.
+        Game.check_collisions batches this test; this per-object form is the
+        reference tests/test_collisions.py checks it against.
+        """
+        left, top, right, bottom = self.get_rect()
+        reach = asteroid.bounding_radius
+        if not (
+            asteroid.x - reach < right
+            and asteroid.x + reach > left
+            and asteroid.y - reach < bottom
+            and asteroid.y + reach > top
+        ):
+            return False
+        return asteroid.mask_overlaps(LASER_MASK, left, top)
 
     def collides_with_boss(self, boss):
-        """Check collision with boss using rectangle-circle collision."""
+        """Check collision with boss using rectangle-circle collision.
+
+        Reference for the batched boss-laser test in Game.check_collisions.
+        """
+        left, top, right, bottom = self.get_rect()
         return (
-            self.x < boss.x + boss.radius
-            and self.x + self.width > boss.x - boss.radius
-            and self.y < boss.y + boss.radius
-            and self.y + self.height > boss.y - boss.radius
+            left < boss.x + boss.radius
+            and right > boss.x - boss.radius
+            and top < boss.y + boss.radius
+            and bottom > boss.y - boss.radius
         )
 
 
 class PowerUp:
     """Power-up collectible."""
 
+    __slots__ = (
+        "x", "y", "size", "speed", "type", "color", "letter_text",
+    )
+
     def __init__(self, x, y, powerup_type):
+        self.type = None
+        self.reset(x, y, powerup_type)
+
+    def reset(self, x, y, powerup_type):
+        """Re-initialize this power-up in place (used by the power-up pool)."""
         self.x = x
         self.y = y
         self.size = POWERUP_SIZE
         self.speed = POWERUP_SPEED
-        self.type = powerup_type
-        self.color = POWERUP_COLORS.get(powerup_type, (255, 255, 255))
+        if powerup_type != self.type:
+            self.type = powerup_type
+            self.color = POWERUP_COLORS.get(powerup_type, (255, 255, 255))
 
-        # Pre-render text for performance
-        font = pygame.font.SysFont(None, 20)
-        letter = self.type[0].upper()
-        self.letter_text = font.render(letter, True, (0, 0, 0))
+            # Pre-render text for performance
+            font = FONTS.get(20)
+            letter = self.type[0].upper()
+            self.letter_text = font.render(letter, True, (0, 0, 0))
 
     def update(self):
         """Move power-up to the left."""
         self.x -= self.speed
 
-    def draw(self, screen, current_time):
-        """Draw the power-up with pulsing glow halo.
+    def _glow_extent(self):
+        """Return the half-size of glow frames (largest halo plus margin)."""
+        return self.size * 2 + 10
+
+    def _render_glow(self, level):
+        """Render the pulsing glow halo for one pulse level.
 
         Args:
-            screen: Pygame surface to draw on
-            current_time: Current tick time (cached for performance)
+            level: Pulse level in [0, POWERUP_PULSE_LEVELS)
+
+        Returns:
+            SRCALPHA surface centered on the power-up
         """
-        # Calculate pulsing glow effect
-        pulse = (math.sin(current_time / 200.0) + 1) / 2  # 0 to 1
+        pulse = level / (POWERUP_PULSE_LEVELS - 1)  # 0 to 1
         glow_radius = self.size * (1.5 + pulse * 0.5)  # Pulsing between 1.5x and 2x
-
-        # Draw pulsing glow halos
-        glow_surface = pygame.Surface((int(glow_radius * 2 + 20), int(glow_radius * 2 + 20)), pygame.SRCALPHA)
-        glow_center = (int(glow_radius + 10), int(glow_radius + 10))
+        extent = self._glow_extent()
+        glow_surface = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
 
         # Multiple layers for soft glow
         for i in range(3):
             alpha = int((60 - i * 20) * (0.5 + pulse * 0.5))
             current_radius = glow_radius - i * 5
             glow_color = (*self.color, alpha)
-            pygame.draw.circle(glow_surface, glow_color, glow_center, int(current_radius))
+            pygame.draw.circle(glow_surface, glow_color, (extent, extent), int(current_radius))
+        return glow_surface
+
+    def _render_diamond(self, step):
+        """Render the rotating square with the icon letter for one rotation step.
 
-        screen.blit(glow_surface, (int(self.x - glow_radius - 10), int(self.y - glow_radius - 10)))
+        The square repeats every 90 degrees, so POWERUP_ROTATION_FRAMES steps
+        cover a full turn.
 
-        # Draw rotating square
-        angle = current_time / 10
+        Args:
+            step: Rotation step in [0, POWERUP_ROTATION_FRAMES)
+
+        Returns:
+            SRCALPHA surface centered on the power-up
+        """
+        extent = self.size + 2
+        surface = pygame.Surface((extent * 2, extent * 2), pygame.SRCALPHA)
+        angle = step * 90 / POWERUP_ROTATION_FRAMES
         points = []
         for i in range(4):
             rad = math.radians(angle + i * 90)
-            px = self.x + math.cos(rad) * self.size
-            py = self.y + math.sin(rad) * self.size
+            px = extent + math.cos(rad) * self.size
+            py = extent + math.sin(rad) * self.size
             points.append((px, py))
-        pygame.draw.polygon(screen, self.color, points)
-        pygame.draw.polygon(screen, (255, 255, 255), points, 2)
+        pygame.draw.polygon(surface, self.color, points)
+        pygame.draw.polygon(surface, (255, 255, 255), points, 2)
 
-        # Draw icon letter (using pre-rendered text)
-        screen.blit(
+        # Composite the icon letter once
+        surface.blit(
             self.letter_text,
             (
-                self.x - self.letter_text.get_width() // 2,
-                self.y - self.letter_text.get_height() // 2,
+                extent - self.letter_text.get_width() // 2,
+                extent - self.letter_text.get_height() // 2,
             ),
         )
+        return surface
+
+    def draw(self, screen, current_time):
+        """Draw the power-up with pulsing glow halo from cached frames.
+
+        Args:
+            screen: Pygame surface to draw on
+            current_time: Current tick time (cached for performance)
+        """
+        x = int(self.x)
+        y = int(self.y)
+
+        # Pulsing glow halo
+        pulse = (math.sin(current_time / 200.0) + 1) / 2  # 0 to 1
+        pulse_level = round(pulse * (POWERUP_PULSE_LEVELS - 1))
+        glow = POWERUP_SPRITES.get(
+            ("glow", self.type, pulse_level), lambda: self._render_glow(pulse_level)
+        )
+        extent = self._glow_extent()
+        screen.blit(glow, (x - extent, y - extent))
+
+        # Rotating square with icon letter
+        rotation_step = int((current_time / 10) % 90 / 90 * POWERUP_ROTATION_FRAMES)
+        diamond = POWERUP_SPRITES.get(
+            ("diamond", self.type, rotation_step), lambda: self._render_diamond(rotation_step)
+        )
+        extent = self.size + 2
+        screen.blit(diamond, (x - extent, y - extent))
 
     def is_off_screen(self):
         """Check if power-up is off-screen."""
         return self.x < -self.size
 
     def collides_with_ship(self, ship):
-        """Check collision with ship."""
+        """Check collision with ship (reference for the batched pickup test)."""
         ship_center = ship.get_center()
         distance_squared = (ship_center[0] - self.x) ** 2 + (
             ship_center[1] - self.y
@@ -1400,232 +2769,347 @@ class PowerUpManager:
 
 
 class Explosion:
-    """Enhanced explosion animation with smooth gradients and particles."""
+    """Enhanced explosion animation with smooth gradients and particles.
+
+    The 8-12 sparks are stored as parallel lists (like ParticleSystem) that
+    are cleared and refilled by reset(), so pooled explosions reuse them.
+    """
+
+    __slots__ = (
+        "x", "y", "size", "max_size", "lifetime",
+        "particle_xs", "particle_ys", "particle_vxs", "particle_vys",
+        "particle_sizes", "particle_lifetimes", "particle_colors",
+    )
 
     def __init__(self, x, y):
+        self.particle_xs = []
+        self.particle_ys = []
+        self.particle_vxs = []
+        self.particle_vys = []
+        self.particle_sizes = []
+        self.particle_lifetimes = []
+        self.particle_colors = []
+        self.reset(x, y)
+
+    def reset(self, x, y):
+        """Re-initialize this explosion in place, reusing its particle lists."""
         self.x = x
         self.y = y
         self.size = EXPLOSION_INITIAL_SIZE
         self.max_size = EXPLOSION_MAX_SIZE
         self.lifetime = 0
-        self.max_lifetime = EXPLOSION_MAX_SIZE - EXPLOSION_INITIAL_SIZE
 
         # Create explosion particles for organic feel
-        self.particles = []
+        xs, ys = self.particle_xs, self.particle_ys
+        vxs, vys = self.particle_vxs, self.particle_vys
+        sizes, lifetimes, colors = self.particle_sizes, self.particle_lifetimes, self.particle_colors
+        for column in (xs, ys, vxs, vys, sizes, lifetimes, colors):
+            column.clear()
         num_particles = random.randint(8, 12)
         for _ in range(num_particles):
             angle = random.uniform(0, 360)
             speed = random.uniform(1.5, 3.5)
-            particle = {
-                'x': x,
-                'y': y,
-                'vx': speed * math.cos(math.radians(angle)),
-                'vy': speed * math.sin(math.radians(angle)),
-                'size': random.randint(2, 4),
-                'lifetime': random.randint(10, 20),
-                'max_lifetime': 20,
-                'color': random.choice(EXPLOSION_COLORS)
-            }
-            self.particles.append(particle)
+            xs.append(x)
+            ys.append(y)
+            vxs.append(speed * math.cos(math.radians(angle)))
+            vys.append(speed * math.sin(math.radians(angle)))
+            sizes.append(random.randint(2, 4))
+            lifetimes.append(random.randint(10, 20))
+            colors.append(random.choice(EXPLOSION_COLORS))
 
     def update(self):
         """Grow the explosion and update particles."""
-        self.size += 1.5  # Slightly faster growth
+        self.size += EXPLOSION_GROWTH_RATE  # Slightly faster growth
         self.lifetime += 1
 
         # Update particles
-        for particle in self.particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['lifetime'] -= 1
+        xs, ys = self.particle_xs, self.particle_ys
+        vxs, vys = self.particle_vxs, self.particle_vys
+        lifetimes = self.particle_lifetimes
+        for i in range(len(xs)):
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            lifetimes[i] -= 1
             # Slow down particles over time
-            particle['vx'] *= 0.95
-            particle['vy'] *= 0.95
+            vxs[i] *= 0.95
+            vys[i] *= 0.95
 
     def draw(self, screen):
-        """Draw explosion with smooth gradients and particles."""
-        progress = self.lifetime / self.max_lifetime
-
-        # Draw main explosion with smooth radial gradient
-        # Multiple layers with decreasing opacity for smooth gradient
-        for i in range(EXPLOSION_GRADIENT_LAYERS):
-            layer_progress = (EXPLOSION_GRADIENT_LAYERS - i) / EXPLOSION_GRADIENT_LAYERS
-            radius = int(self.size * layer_progress)
-
-            if radius > 0:
-                # Calculate color based on progress and layer
-                # Start bright white/yellow, transition to orange/red
-                if progress < 0.3:
-                    # Early explosion: bright white/yellow core
-                    color_idx = 1 if i < 3 else 0
-                elif progress < 0.6:
-                    # Mid explosion: orange
-                    color_idx = 0
-                else:
-                    # Late explosion: dark red
-                    color_idx = 2
-
-                base_color = EXPLOSION_COLORS[color_idx]
-
-                # Add brightness to inner layers
-                brightness_boost = int((1.0 - layer_progress) * 100) if i < 4 else 0
-                color = tuple(min(255, c + brightness_boost) for c in base_color)
-
-                # Calculate alpha with smooth falloff
-                alpha = int(255 * (1.0 - progress) * layer_progress * 0.8)
-
-                if alpha > 0:
-                    # Create surface for this layer
-                    surf_size = radius * 2 + 4
-                    s = pygame.Surface((surf_size, surf_size), pygame.SRCALPHA)
-
-                    # Draw filled circle with alpha
-                    color_with_alpha = (*color, alpha)
-                    pygame.draw.circle(s, color_with_alpha, (surf_size // 2, surf_size // 2), radius)
-
-                    # Blit to screen
-                    screen.blit(s, (int(self.x - surf_size // 2), int(self.y - surf_size // 2)))
-
-        # Draw bright flash at the center for first few frames
-        if progress < 0.2:
-            flash_alpha = int(255 * (1.0 - progress / 0.2))
-            flash_size = max(3, int(self.size * 0.3))
-            s = pygame.Surface((flash_size * 2, flash_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(s, (255, 255, 255, flash_alpha), (flash_size, flash_size), flash_size)
-            screen.blit(s, (int(self.x - flash_size), int(self.y - flash_size)))
+        """Draw the pre-rendered fireball frame and the explosion particles."""
+        # Fireball is a single blit from the shared flipbook
+        frame = EXPLOSION_FRAMES.get(self.lifetime, lambda: _render_explosion_frame(self.lifetime))
+        screen.blit(
+            frame,
+            (int(self.x) - frame.get_width() // 2, int(self.y) - frame.get_height() // 2)
+        )
 
         # Draw explosion particles
-        for particle in self.particles:
-            if particle['lifetime'] > 0:
-                alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
+        for x, y, size, lifetime, color in zip(
+            self.particle_xs, self.particle_ys, self.particle_sizes,
+            self.particle_lifetimes, self.particle_colors,
+        ):
+            if lifetime > 0:
+                alpha = int(255 * (lifetime / EXPLOSION_PARTICLE_LIFETIME))
                 if alpha > 0:
-                    size = particle['size']
-                    s = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-                    color_with_alpha = (*particle['color'], alpha)
-                    pygame.draw.circle(s, color_with_alpha, (size, size), size)
-                    screen.blit(s, (int(particle['x'] - size), int(particle['y'] - size)))
+                    s = DISC_SPRITES.get((size, color, alpha), lambda: _render_disc(size, color, alpha))
+                    screen.blit(s, (int(x - size), int(y - size)))
 
     def is_finished(self):
         """Check if explosion animation is complete."""
         return self.size >= self.max_size
 
 
-class Star:
-    """Background star for parallax effect."""
-
-    def __init__(self, x, y, size, speed, brightness, color):
-        self.x = x
-        self.y = y
-        self.size = size
-        self.speed = speed
-        self.brightness = brightness
-        self.base_brightness = brightness
-        self.color = color
-        # Twinkling effect
-        self.twinkle_offset = random.uniform(0, 360)
-        self.twinkle_speed = random.uniform(0.5, 2.0)
+class Starfield:
+    """Background starfield for parallax effect, stored as parallel lists.
 
-    def update(self, paused=False):
-        """Move star to create parallax effect."""
-        if not paused:
-            self.x -= self.speed
-            if self.x < -5:
-                self.x = WIDTH + 5
-                self.y = random.randint(0, HEIGHT)
+    Each star keeps its position, scroll speed, twinkle phase and base color in
+    flat columns so the whole field is updated in one loop. Twinkle uses a
+    precomputed sine table, and stars are drawn from cached dot sprites per
+    (size, color, twinkle level) with a single batched blit call.
 
-        # Update twinkling animation
-        self.twinkle_offset += self.twinkle_speed
-        if self.twinkle_offset >= 360:
-            self.twinkle_offset -= 360
+    Attributes:
+        xs, ys: Star positions
+        speeds: Scroll speed in pixels per frame
+        sizes: Star radius in pixels
+        base_brightness: Brightness the twinkle is relative to
+        colors: Base RGB color per star
+        twinkle_offsets: Twinkle phase in degrees
+        twinkle_speeds: Twinkle phase increment per frame
+        twinkle_levels: Quantized twinkle brightness level used for drawing
+    """
 
-        # Calculate brightness variation for twinkling
-        twinkle_factor = (math.sin(math.radians(self.twinkle_offset)) + 1) / 2  # 0 to 1
-        brightness_variation = int(50 * twinkle_factor)
-        self.brightness = min(255, self.base_brightness + brightness_variation)
+    __slots__ = (
+        "xs", "ys", "speeds", "sizes", "base_brightness", "colors", "twinkle_offsets",
+        "twinkle_speeds", "twinkle_levels",
+    )
 
-    def draw(self, screen):
-        """Draw the star with twinkling effect."""
-        # Update color brightness for twinkling
-        twinkle_color = tuple(min(255, int(c * self.brightness / self.base_brightness)) for c in self.color)
-        pygame.draw.circle(screen, twinkle_color, (int(self.x), int(self.y)), self.size)
+    def __init__(self):
+        """Initialize an empty starfield."""
+        self.xs = []
+        self.ys = []
+        self.speeds = []
+        self.sizes = []
+        self.base_brightness = []
+        self.colors = []
+        self.twinkle_offsets = []
+        self.twinkle_speeds = []
+        self.twinkle_levels = []
+
+    def __len__(self):
+        return len(self.xs)
+
+    def add(self, x, y, size, speed, brightness, color):
+        """Add a star to the field.
 
+        Args:
+            x: Horizontal position
+            y: Vertical position
+            size: Radius in pixels
+            speed: Scroll speed in pixels per frame
+            brightness: Base brightness (STAR_MIN_BRIGHTNESS-STAR_MAX_BRIGHTNESS)
+            color: Base RGB color
+        """
+        self.xs.append(x)
+        self.ys.append(y)
+        self.sizes.append(size)
+        self.speeds.append(speed)
+        self.base_brightness.append(brightness)
+        self.colors.append(color)
+        self.twinkle_offsets.append(random.uniform(0, 360))
+        self.twinkle_speeds.append(random.uniform(0.5, 2.0))
+        self.twinkle_levels.append(0)
 
-class Particle:
-    """Visual particle effect with multiple shapes."""
+    def update(self, paused=False):
+        """Scroll stars for the parallax effect and advance twinkling."""
+        xs, ys, speeds = self.xs, self.ys, self.speeds
+        offsets, twinkle_speeds = self.twinkle_offsets, self.twinkle_speeds
+        base_brightness, levels = self.base_brightness, self.twinkle_levels
+        scale = STAR_TWINKLE_LEVELS - 1
+
+        for i in range(len(xs)):
+            if not paused:
+                x = xs[i] - speeds[i]
+                if x < -5:
+                    x = WIDTH + 5
+                    ys[i] = random.randint(0, HEIGHT)
+                xs[i] = x
+
+            # Update twinkling animation
+            offset = offsets[i] + twinkle_speeds[i]
+            if offset >= 360:
+                offset -= 360
+            offsets[i] = offset
+
+            # Brightness variation (0-50) relative to base brightness
+            base = base_brightness[i]
+            brightness = min(255, base + int(50 * TWINKLE_TABLE[int(offset)]))
+            levels[i] = int((brightness / base - 1.0) / STAR_TWINKLE_MAX_RATIO * scale + 0.5)
 
-    def __init__(
-        self, x, y, color, velocity_x=0, velocity_y=0, size=None, lifetime=None, shape="circle"
-    ):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.vx = velocity_x
-        self.vy = velocity_y
-        self.size = (
-            size if size else random.randint(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE)
-        )
-        self.lifetime = lifetime if lifetime else PARTICLE_LIFETIME
-        self.max_lifetime = self.lifetime
-        self.alpha = 255
-        self.shape = shape  # "circle", "star", "square"
+    def draw(self, screen):
+        """Draw all stars with their twinkle level in one batched blit call."""
+        blit_list = []
+        xs, ys, sizes, colors, levels = self.xs, self.ys, self.sizes, self.colors, self.twinkle_levels
+        for i in range(len(xs)):
+            size = sizes[i]
+            key = (size, colors[i], levels[i])
+            sprite = STAR_SPRITES.get(key, lambda: _render_star_dot(*key))
+            blit_list.append((sprite, (int(xs[i]) - size, int(ys[i]) - size)))
+        screen.fblits(blit_list)
+
+
+class ParticleSystem:
+    """Array-backed particle engine for sparks, debris and engine thrust.
+
+    Particles are stored as parallel lists (struct-of-arrays) instead of one
+    object per spark: a single update loop advances every particle, dead
+    particles are swap-removed in place, and drawing is one batched blit call.
+    Slots past `count` are kept allocated and reused by later emits. Sprites
+    come from PARTICLE_ATLAS with alpha quantized to PARTICLE_ALPHA_BUCKETS.
 
-    def update(self):
-        """Update particle position and fade."""
-        self.x += self.vx
-        self.y += self.vy
-        self.lifetime -= 1
-        # Fade out over lifetime
-        self.alpha = int(255 * (self.lifetime / self.max_lifetime))
+    Attributes:
+        count: Number of live particles
+        xs, ys: Particle positions
+        vxs, vys: Particle velocities in pixels per frame
+        lifetimes: Frames of life remaining
+        max_lifetimes: Initial lifetime (used for fading)
+        sizes: Particle radius in pixels
+        colors: RGB color per particle
+        shapes: "circle", "star" or "square" per particle
+    """
 
-    def draw_star(self, surface, center, radius, color_with_alpha):
-        """Draw a star shape."""
-        points = []
-        for i in range(10):  # 5-pointed star = 10 points (5 outer, 5 inner)
-            angle = math.radians(i * 36 - 90)  # -90 to start pointing up
-            if i % 2 == 0:
-                # Outer point
-                r = radius
-            else:
-                # Inner point
-                r = radius * 0.4
-            px = center[0] + r * math.cos(angle)
-            py = center[1] + r * math.sin(angle)
-            points.append((px, py))
-        pygame.draw.polygon(surface, color_with_alpha, points)
+    __slots__ = (
+        "count", "xs", "ys", "vxs", "vys", "lifetimes", "max_lifetimes", "sizes", "colors",
+        "shapes",
+    )
 
-    def draw_square(self, surface, center, size, color_with_alpha):
-        """Draw a square shape."""
-        half_size = size
-        rect = pygame.Rect(
-            center[0] - half_size, center[1] - half_size, size * 2, size * 2
-        )
-        pygame.draw.rect(surface, color_with_alpha, rect)
+    def __init__(self):
+        """Initialize an empty particle system."""
+        self.count = 0
+        self.xs = []
+        self.ys = []
+        self.vxs = []
+        self.vys = []
+        self.lifetimes = []
+        self.max_lifetimes = []
+        self.sizes = []
+        self.colors = []
+        self.shapes = []
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        """Remove all particles (allocated slots are kept for reuse)."""
+        self.count = 0
+
+    def emit(
+        self, x, y, color, velocity_x=0, velocity_y=0, size=None, lifetime=None, shape="circle"
+    ):
+        """Add a particle.
 
-    def draw(self, screen):
-        """Draw particle with transparency based on shape."""
-        if self.alpha > 0:
-            s = pygame.Surface((self.size * 3, self.size * 3), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], self.alpha)
-            center = (self.size * 1.5, self.size * 1.5)
+        Args:
+            x: Starting horizontal position
+            y: Starting vertical position
+            color: RGB color tuple
+            velocity_x: Horizontal velocity (default 0)
+            velocity_y: Vertical velocity (default 0)
+            size: Radius in pixels (default: random PARTICLE_MIN_SIZE-PARTICLE_MAX_SIZE)
+            lifetime: Frames to live (default PARTICLE_LIFETIME)
+            shape: "circle", "star" or "square" (default "circle")
+        """
+        size = size if size else random.randint(PARTICLE_MIN_SIZE, PARTICLE_MAX_SIZE)
+        lifetime = lifetime if lifetime else PARTICLE_LIFETIME
+        i = self.count
+        if i == len(self.xs):
+            # Grow every column by one slot
+            self.xs.append(x)
+            self.ys.append(y)
+            self.vxs.append(velocity_x)
+            self.vys.append(velocity_y)
+            self.lifetimes.append(lifetime)
+            self.max_lifetimes.append(lifetime)
+            self.sizes.append(size)
+            self.colors.append(color[:3])
+            self.shapes.append(shape)
+        else:
+            # Reuse a slot freed by a dead particle
+            self.xs[i] = x
+            self.ys[i] = y
+            self.vxs[i] = velocity_x
+            self.vys[i] = velocity_y
+            self.lifetimes[i] = lifetime
+            self.max_lifetimes[i] = lifetime
+            self.sizes[i] = size
+            self.colors[i] = color[:3]
+            self.shapes[i] = shape
+        self.count = i + 1
+
+    def _move(self, src, dst):
+        """Copy particle slot src into slot dst."""
+        self.xs[dst] = self.xs[src]
+        self.ys[dst] = self.ys[src]
+        self.vxs[dst] = self.vxs[src]
+        self.vys[dst] = self.vys[src]
+        self.lifetimes[dst] = self.lifetimes[src]
+        self.max_lifetimes[dst] = self.max_lifetimes[src]
+        self.sizes[dst] = self.sizes[src]
+        self.colors[dst] = self.colors[src]
+        self.shapes[dst] = self.shapes[src]
 
-            if self.shape == "star":
-                self.draw_star(s, center, self.size, color_with_alpha)
-            elif self.shape == "square":
-                self.draw_square(s, center, self.size, color_with_alpha)
-            else:  # circle
-                pygame.draw.circle(s, color_with_alpha, (int(center[0]), int(center[1])), self.size)
+    def update(self):
+        """Advance all particles one frame and swap-remove the dead ones."""
+        xs, ys, vxs, vys, lifetimes = self.xs, self.ys, self.vxs, self.vys, self.lifetimes
+        count = self.count
+        i = 0
+        while i < count:
+            lifetime = lifetimes[i] - 1
+            if lifetime <= 0:
+                # Fill the hole with the last live particle and re-check this slot
+                count -= 1
+                if i != count:
+                    self._move(count, i)
+                continue
+            lifetimes[i] = lifetime
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            i += 1
+        self.count = count
 
-            screen.blit(s, (int(self.x - self.size * 1.5), int(self.y - self.size * 1.5)))
+    def draw(self, screen):
+        """Draw all live particles with a single batched blit call.
 
-    def is_dead(self):
-        """Check if particle should be removed."""
-        return self.lifetime <= 0
+        Args:
+            screen: Pygame surface to draw on
+        """
+        blit_list = []
+        for i in range(self.count):
+            # Fade out over lifetime
+            alpha = int(255 * (self.lifetimes[i] / self.max_lifetimes[i]))
+            if alpha <= 0:
+                continue
+            size = self.sizes[i]
+            key = (self.shapes[i], size, self.colors[i], particle_alpha_bucket(alpha))
+            sprite = PARTICLE_ATLAS.get(key, lambda: _render_particle_bucket(*key))
+            blit_list.append((
+                sprite,
+                (int(self.xs[i] - size * 1.5), int(self.ys[i] - size * 1.5))
+            ))
+        screen.fblits(blit_list)
 
 
 class ScorePopup:
     """Floating score text that rises and fades out with smooth rendering."""
 
+    __slots__ = (
+        "x", "y", "score", "lifetime", "max_lifetime", "velocity_y", "scale", "font_size",
+        "text",
+    )
+
     def __init__(self, x, y, score):
+        self.reset(x, y, score)
+
+    def reset(self, x, y, score):
+        """Re-initialize this popup in place (used by the popup pool)."""
         self.x = x
         self.y = y
         self.score = score
@@ -1636,7 +3120,6 @@ class ScorePopup:
 
         # Choose font size based on score magnitude
         self.font_size = 28 if score < 100 else 34 if score < 500 else 40
-        self.font = pygame.font.SysFont(None, self.font_size, bold=True)
         self.text = f"+{score}"
 
     def update(self):
@@ -1653,7 +3136,7 @@ class ScorePopup:
             self.scale = 1.0
 
     def draw(self, screen):
-        """Draw the score popup with outline and smooth fading (no background)."""
+        """Draw the cached outlined text, faded by surface alpha (no background)."""
         if self.lifetime > 0:
             # Calculate alpha based on lifetime
             alpha = int(255 * (self.lifetime / self.max_lifetime))
@@ -1663,43 +3146,16 @@ class ScorePopup:
             if current_size < 10:
                 return  # Don't render if too small
 
-            # Create font at current scale
-            scaled_font = pygame.font.SysFont(None, current_size, bold=True)
-
-            # Create a transparent surface to draw on
-            # First, render text to get size
-            temp_text = scaled_font.render(self.text, True, COMBO_COLOR)
-            text_width, text_height = temp_text.get_size()
-
-            # Create transparent surface large enough for text + outline
-            surf_width = text_width + 4
-            surf_height = text_height + 4
-            transparent_surface = pygame.Surface((surf_width, surf_height), pygame.SRCALPHA)
-            transparent_surface.fill((0, 0, 0, 0))  # Fully transparent background
-
-            # Render outline (dark shadow for contrast)
-            outline_color = (0, 0, 0, alpha)  # Include alpha in color
-            for dx, dy in [(-1, -1), (-1, 1), (1, -1), (1, 1), (0, -1), (-1, 0), (1, 0), (0, 1)]:
-                outline_surface = scaled_font.render(self.text, True, (0, 0, 0))
-                # Create a copy with alpha
-                outline_alpha_surf = pygame.Surface(outline_surface.get_size(), pygame.SRCALPHA)
-                outline_alpha_surf.fill((0, 0, 0, 0))
-                outline_alpha_surf.blit(outline_surface, (0, 0))
-                outline_alpha_surf.set_alpha(alpha)
-                transparent_surface.blit(outline_alpha_surf, (2 + dx, 2 + dy))
-
-            # Render main text with alpha
-            text_surface = scaled_font.render(self.text, True, COMBO_COLOR)
-            text_alpha_surf = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            text_alpha_surf.fill((0, 0, 0, 0))
-            text_alpha_surf.blit(text_surface, (0, 0))
-            text_alpha_surf.set_alpha(alpha)
-            transparent_surface.blit(text_alpha_surf, (2, 2))
-
-            # Blit the final transparent surface to screen
-            final_x = int(self.x - surf_width // 2)
-            final_y = int(self.y - surf_height // 2)
-            screen.blit(transparent_surface, (final_x, final_y))
+            # Outlined text is rendered once per (text, size) and shared by all popups
+            text_surface = POPUP_TEXT_SPRITES.get(
+                (self.text, current_size),
+                lambda: _render_outlined_text(self.text, current_size)
+            )
+            text_surface.set_alpha(alpha)
+
+            final_x = int(self.x - text_surface.get_width() // 2)
+            final_y = int(self.y - text_surface.get_height() // 2)
+            screen.blit(text_surface, (final_x, final_y))
 
     def is_dead(self):
         """Check if popup should be removed."""
@@ -1707,60 +3163,132 @@ class ScorePopup:
 
 
 class NebulaCloud:
-    """Procedural background nebula cloud for visual depth."""
+    """Procedural background nebula cloud for visual depth.
 
-    def __init__(self):
-        self.x = random.randint(0, WIDTH)
+    The cloud never changes shape, so its translucent layers are composited
+    once into `surface` at creation and only blitted afterwards.
+
+    Attributes:
+        x: Horizontal center within the background tile
+        y: Vertical center
+        size: Radius of the outermost layer
+        color: RGBA base color
+        layers: Tuple of (size, offset_x, offset_y, alpha) layer tuples
+        surface: Pre-rendered SRCALPHA image of all layers
+    """
+
+    __slots__ = (
+        "x", "y", "size", "color", "layers", "extent", "surface",
+    )
+
+    def __init__(self, x=None):
+        """Create a cloud with random size, color and layers.
+
+        Args:
+            x: Horizontal center (default: random position within the screen)
+        """
+        self.x = x if x is not None else random.randint(0, WIDTH)
         self.y = random.randint(0, HEIGHT)
         self.size = random.randint(NEBULA_MIN_SIZE, NEBULA_MAX_SIZE)
         self.color = random.choice(NEBULA_COLORS)
-        self.drift_speed = random.uniform(0.05, 0.15)
 
         # Create multiple layers for depth
-        self.layers = []
+        layers = []
         num_layers = random.randint(3, 5)
         for i in range(num_layers):
             layer_size = self.size * (1.0 - i * 0.15)
             layer_offset_x = random.uniform(-self.size * 0.3, self.size * 0.3)
             layer_offset_y = random.uniform(-self.size * 0.3, self.size * 0.3)
             layer_alpha = int(self.color[3] * (0.8 - i * 0.15))
-            self.layers.append({
-                'size': layer_size,
-                'offset_x': layer_offset_x,
-                'offset_y': layer_offset_y,
-                'alpha': layer_alpha
-            })
-
-    def update(self):
-        """Move nebula slowly to create parallax effect."""
-        self.x -= self.drift_speed
-        if self.x < -self.size:
-            self.x = WIDTH + self.size
-            self.y = random.randint(0, HEIGHT)
-
-    def draw(self, screen):
-        """Draw the nebula cloud with multiple layers."""
-        for layer in self.layers:
-            s = pygame.Surface((int(layer['size'] * 2), int(layer['size'] * 2)), pygame.SRCALPHA)
-            color_with_alpha = (*self.color[:3], layer['alpha'])
+            layers.append((layer_size, layer_offset_x, layer_offset_y, layer_alpha))
+        self.layers = tuple(layers)
+
+        # Half the side of the square that holds every layer
+        self.extent = int(self.size * 1.3) + 2
+        self.surface = self._render()
+
+    def _render(self):
+        """Composite all layers into one surface centered on the cloud."""
+        surface = pygame.Surface((self.extent * 2, self.extent * 2), pygame.SRCALPHA)
+        for layer_size, offset_x, offset_y, alpha in self.layers:
+            s = pygame.Surface((int(layer_size * 2), int(layer_size * 2)), pygame.SRCALPHA)
+            color_with_alpha = (*self.color[:3], alpha)
             pygame.draw.circle(
                 s,
                 color_with_alpha,
-                (int(layer['size']), int(layer['size'])),
-                int(layer['size'])
+                (int(layer_size), int(layer_size)),
+                int(layer_size)
             )
-            screen.blit(
+            surface.blit(
                 s,
                 (
-                    int(self.x + layer['offset_x'] - layer['size']),
-                    int(self.y + layer['offset_y'] - layer['size'])
+                    int(self.extent + offset_x - layer_size),
+                    int(self.extent + offset_y - layer_size)
                 )
             )
+        return surface
+
+    def draw(self, screen, offset_x=0):
+        """Blit the pre-rendered cloud.
+
+        Args:
+            screen: Pygame surface to draw on
+            offset_x: Horizontal shift applied to the cloud position
+        """
+        screen.blit(self.surface, (int(self.x + offset_x) - self.extent, int(self.y) - self.extent))
+
+
+class BackgroundLayer:
+    """Scrolling background with all static content composited into one tile.
+
+    The background color and nebula clouds are drawn once into an opaque tile
+    wider than the screen. Each frame the tile is scrolled left and re-blitted
+    (one or two plain copies), wrapping around seamlessly.
+
+    Attributes:
+        clouds: NebulaCloud objects baked into the tile
+        scroll_x: Current horizontal scroll position within the tile
+        surface: Opaque pre-composited background tile
+    """
+
+    def __init__(self, clouds):
+        """Build the background tile from the given clouds.
+
+        Args:
+            clouds: List of NebulaCloud objects positioned within the tile width
+        """
+        self.clouds = clouds
+        self.scroll_x = 0.0
+        self.surface = pygame.Surface((BACKGROUND_TILE_WIDTH, HEIGHT))
+        self.rebuild()
+
+    def rebuild(self):
+        """Re-composite the background tile (only needed when clouds change)."""
+        self.surface.fill(BACKGROUND)
+        for cloud in self.clouds:
+            # Draw wrapped copies so clouds crossing the tile seam stay continuous
+            for wrap in (-BACKGROUND_TILE_WIDTH, 0, BACKGROUND_TILE_WIDTH):
+                cloud.draw(self.surface, wrap)
+
+    def update(self):
+        """Scroll the background slowly to create a parallax effect."""
+        self.scroll_x = (self.scroll_x + NEBULA_DRIFT_SPEED) % BACKGROUND_TILE_WIDTH
+
+    def draw(self, screen):
+        """Blit the background tile, wrapping around at its right edge."""
+        x = -int(self.scroll_x)
+        screen.blit(self.surface, (x, 0))
+        if x + BACKGROUND_TILE_WIDTH < WIDTH:
+            screen.blit(self.surface, (x + BACKGROUND_TILE_WIDTH, 0))
 
 
 class DistortionWave:
     """Screen-wide ripple effect for dramatic events."""
 
+    __slots__ = (
+        "x", "y", "radius", "max_radius", "lifetime", "max_lifetime",
+    )
+
     def __init__(self, x, y, max_radius=DISTORTION_MAX_RADIUS):
         self.x = x
         self.y = y
@@ -1776,34 +3304,232 @@ class DistortionWave:
         progress = 1.0 - (self.lifetime / self.max_lifetime)
         self.radius = self.max_radius * (progress ** 0.7)
 
-    def draw(self, screen):
-        """Draw concentric rings with varying alpha."""
+    def draw(self, screen, scratch):
+        """Draw concentric rings with varying alpha.
+
+        Rings are drawn into a persistent transparent scratch surface, and only
+        the horizontal bands around each ring are blitted and cleared again, so
+        a 600 pixel nuke ring never allocates or blends its empty interior.
+
+        Args:
+            screen: Pygame surface to draw on
+            scratch: Fully transparent SRCALPHA surface the size of screen;
+                left transparent on return
+        """
         if self.lifetime > 0:
+            bounds = scratch.get_rect()
             # Draw 3 rings at different offsets
             for i in range(3):
                 ring_radius = int(self.radius - i * 20)
                 if ring_radius > 0:
                     alpha = int(100 * (self.lifetime / self.max_lifetime) * (1.0 - i * 0.3))
                     if alpha > 0:
-                        s = pygame.Surface((ring_radius * 2, ring_radius * 2), pygame.SRCALPHA)
-                        color_with_alpha = (150, 200, 255, alpha)
-                        pygame.draw.circle(
-                            s,
-                            color_with_alpha,
-                            (ring_radius, ring_radius),
-                            ring_radius,
-                            3
-                        )
-                        screen.blit(
-                            s,
-                            (int(self.x - ring_radius), int(self.y - ring_radius))
+                        # Derive the center from the truncated top-left corner, as a
+                        # per-ring surface blitted there would place it (int() rounds
+                        # toward zero, so this differs from int(self.x) off-screen)
+                        center = (
+                            int(self.x - ring_radius) + ring_radius,
+                            int(self.y - ring_radius) + ring_radius,
                         )
+                        color_with_alpha = (150, 200, 255, alpha)
+                        pygame.draw.circle(scratch, color_with_alpha, center, ring_radius, 3)
+                        bands = self._ring_bands(center, ring_radius, 3, bounds)
+                        screen.blits([(scratch, band, band) for band in bands], doreturn=False)
+                        # Redrawing the ring transparent is cheaper than clearing the bands
+                        pygame.draw.circle(scratch, (0, 0, 0, 0), center, ring_radius, 3)
+
+    @staticmethod
+    def _ring_bands(center, radius, width, bounds):
+        """Return disjoint rects that together cover every pixel of a ring.
+
+        Each DISTORTION_BAND_HEIGHT row band gets one rect, or two when the
+        ring's hole splits it into a left and right segment.
+
+        Args:
+            center: (x, y) ring center
+            radius: Outer ring radius
+            width: Ring line width
+            bounds: Rect to clip the bands to
+
+        Returns:
+            List of non-empty pygame.Rect objects inside bounds
+        """
+        cx, cy = center
+        hole_radius = radius - width - 1  # Pixels closer than this are never drawn
+        bands = []
+        top = max(cy - radius - 1, bounds.top)
+        bottom = min(cy + radius + 2, bounds.bottom)
+        for y0 in range(top, bottom, DISTORTION_BAND_HEIGHT):
+            y1 = min(y0 + DISTORTION_BAND_HEIGHT, bottom)
+            # Nearest and farthest band rows from the center row
+            near = 0 if y0 <= cy < y1 else min(abs(y0 - cy), abs(y1 - 1 - cy))
+            far = max(abs(y0 - cy), abs(y1 - 1 - cy))
+            outer = int(math.sqrt(max(0, (radius + 1) ** 2 - near ** 2))) + 2
+            hole = int(math.sqrt(hole_radius ** 2 - far ** 2)) - 1 if far < hole_radius else 0
+            if hole > 0:
+                segments = (
+                    pygame.Rect(cx - outer, y0, outer - hole, y1 - y0),
+                    pygame.Rect(cx + hole, y0, outer - hole, y1 - y0),
+                )
+            else:
+                segments = (pygame.Rect(cx - outer, y0, outer * 2, y1 - y0),)
+            for segment in segments:
+                segment = segment.clip(bounds)
+                if segment.width > 0 and segment.height > 0:
+                    bands.append(segment)
+        return bands
 
     def is_finished(self):
         """Check if wave animation is complete."""
         return self.lifetime <= 0
 
 
+class Hud:
+    """Cache of HUD widget surfaces that re-render only when their value changes.
+
+    Each widget is identified by name and remembers the key (backing value) it
+    was rendered for. Asking for a widget with the same key returns the cached
+    surface; a different key re-renders it.
+
+    Attributes:
+        widgets: Dict mapping widget name to (key, surface)
+        frame_rerenders: Widgets re-rendered since the last begin_frame()
+        total_rerenders: Widgets re-rendered since creation
+    """
+
+    def __init__(self):
+        """Initialize an empty HUD."""
+        self.widgets = {}
+        self.frame_rerenders = 0
+        self.total_rerenders = 0
+
+    def begin_frame(self):
+        """Reset the per-frame re-render counter."""
+        self.frame_rerenders = 0
+
+    def widget(self, name, key, render):
+        """Return the widget surface, re-rendering it only if key changed.
+
+        Args:
+            name: Widget name
+            key: Hashable value the widget displays
+            render: Zero-argument callable that renders the widget surface
+
+        Returns:
+            Pygame surface for the widget
+        """
+        cached = self.widgets.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        surface = render()
+        self.widgets[name] = (key, surface)
+        self.frame_rerenders += 1
+        self.total_rerenders += 1
+        return surface
+
+
+class ObjectPool:
+    """Free list of reusable instances of one short-lived entity class.
+
+    acquire() re-initializes a released instance through its reset() method
+    and only constructs a new one when the free list is empty. Live lists are
+    compacted in place and their dead entries released back to the pool, so
+    steady-state play allocates no new entities.
+
+    Attributes:
+        name: Human-readable pool name (used in stats output)
+        cls: Entity class; must provide reset() taking the constructor arguments
+        free: Released instances waiting to be reused
+        live: Number of acquired instances not yet released
+        high_water: Largest value live has reached
+        created: Number of instances constructed
+        reused: Number of acquisitions served from the free list
+    """
+
+    def __init__(self, name, cls):
+        """Initialize an empty pool.
+
+        Args:
+            name: Human-readable pool name
+            cls: Entity class to pool
+        """
+        self.name = name
+        self.cls = cls
+        self.free = []
+        self.live = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, *args):
+        """Return an instance initialized with args, reusing a free one if possible."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            self.created += 1
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Return an instance to the free list; it must no longer be referenced."""
+        self.live -= 1
+        self.free.append(obj)
+
+    def release_all(self, items):
+        """Release every instance in items and empty the list in place."""
+        for obj in items:
+            self.release(obj)
+        items.clear()
+
+    def compact(self, items, is_dead):
+        """Drop dead instances from items in place, preserving order.
+
+        Args:
+            items: Live list to compact
+            is_dead: Predicate called with each instance
+        """
+        write = 0
+        for obj in items:
+            if is_dead(obj):
+                self.release(obj)
+            else:
+                items[write] = obj
+                write += 1
+        del items[write:]
+
+    def remove_indices(self, items, indices):
+        """Drop the instances at the given indices from items in place.
+
+        Args:
+            items: Live list to compact
+            indices: Set of indices into items to release
+        """
+        write = 0
+        for i, obj in enumerate(items):
+            if i in indices:
+                self.release(obj)
+            else:
+                items[write] = obj
+                write += 1
+        del items[write:]
+
+    def stats(self):
+        """Return a dict of pool counters for debugging/profiling output."""
+        return {
+            "name": self.name,
+            "live": self.live,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "created": self.created,
+            "reused": self.reused,
+        }
+
+
 class Game:
     """Main game controller managing all game systems and state.
 
@@ -1827,18 +3553,17 @@ class Game:
         pygame.display.set_caption("Ship Obstacle Avoidance - Enhanced")
         self.clock = pygame.time.Clock()
 
-        # Fonts
-        self.font = pygame.font.SysFont(None, 36)
-        self.small_font = pygame.font.SysFont(None, 24)
-        self.title_font = pygame.font.SysFont(None, 72)
-        self.large_font = pygame.font.SysFont(None, 48)
-        # Cached fonts for combo display (to avoid recreating every frame)
-        self.combo_font_cache = {}
+        # Fonts (resolved once through the shared registry)
+        FONTS.preload(FONT_PRELOAD_SPECS)
+        print(f"✅ Loaded {FONTS.loads} fonts in {FONTS.load_time * 1000:.1f} ms")
+        self.font = FONTS.get(36)
+        self.small_font = FONTS.get(24)
+        self.title_font = FONTS.get(72)
+        self.large_font = FONTS.get(48)
 
-        # Text rendering cache: stores (text, font, color) -> (surface, timestamp)
+        # Text rendering cache: (font key, text, color) -> surface, bounded LRU
         # Helps avoid re-rendering the same text every frame
-        self.text_cache = {}
-        self.text_cache_ttl = 300  # Cache for 5 seconds (300 frames at 60 FPS)
+        self.text_cache = LRUSpriteCache("text", TEXT_CACHE_MAX_ENTRIES, TEXT_CACHE_MAX_BYTES)
 
         # Game state
         self.running = True
@@ -1875,14 +3600,21 @@ class Game:
         self.options_selected = 0  # For options menu navigation
         self.previous_state = None  # Track where we came from
 
+        # Free-list pools for short-lived entities (see pool_stats())
+        self.laser_pool = ObjectPool("lasers", Laser)
+        self.asteroid_pool = ObjectPool("asteroids", Asteroid)
+        self.explosion_pool = ObjectPool("explosions", Explosion)
+        self.powerup_pool = ObjectPool("powerups", PowerUp)
+        self.score_popup_pool = ObjectPool("score_popups", ScorePopup)
+
         # Game objects
         self.ship = Ship(SHIP_START_X, SHIP_START_Y)
         self.asteroids = []
         self.lasers = []
         self.explosions = []
-        self.stars = []
+        self.stars = Starfield()
         self.powerups = []
-        self.particles = []
+        self.particles = ParticleSystem()
         self.boss = None
         self.boss_warning = False
         self.boss_warning_timer = 0
@@ -1908,6 +3640,7 @@ class Game:
         # New visual systems
         self.score_popups = []
         self.nebula_clouds = []
+        self.background = None  # Built by create_nebula_clouds()
         self.distortion_waves = []
 
         # UI animation tracking
@@ -1918,9 +3651,25 @@ class Game:
         # Color theme based on score
         self.theme_color = (100, 200, 255)  # Default blue
 
+        # Cached HUD widgets
+        self.hud = Hud()
+
+        # Back buffer and full-screen effect surfaces (reused every frame)
+        self.render_targets = RenderTargets((WIDTH, HEIGHT))
+
+        # Collision broadphase grids, rebuilt once per frame
+        self.asteroid_grid = SpatialHash(WIDTH, HEIGHT, SPATIAL_HASH_CELL_SIZE)
+        self.powerup_grid = SpatialHash(WIDTH, HEIGHT, SPATIAL_HASH_CELL_SIZE)
+        # Per-frame asteroid collision counters (bounding tests vs pixel-mask tests)
+        self.collision_counters = {"candidates": 0, "precise_tests": 0, "precise_hits": 0}
+
         # Pre-render vignette surface for performance
         self.vignette_surface = self._create_vignette()
 
+        # Pre-render particle sprite atlas so particles are pure blits
+        atlas_size = prewarm_particle_atlas()
+        print(f"✅ Particle atlas: {atlas_size} sprites ({PARTICLE_ATLAS.resident_bytes() // 1024} KB)")
+
         # Sound effects
         self.sounds_enabled = False
         self.sounds = {}
@@ -1956,9 +3705,10 @@ class Game:
         return vignette
 
     def create_nebula_clouds(self):
-        """Create background nebula clouds."""
+        """Create background nebula clouds and composite the background layer."""
         for _ in range(NEBULA_COUNT):
-            self.nebula_clouds.append(NebulaCloud())
+            self.nebula_clouds.append(NebulaCloud(random.randint(0, BACKGROUND_TILE_WIDTH)))
+        self.background = BackgroundLayer(self.nebula_clouds)
 
     def ensure_data_directory(self):
         """Ensure the data directory exists."""
@@ -2111,7 +3861,7 @@ class Game:
             speed = random.uniform(STAR_MIN_SPEED, STAR_MAX_SPEED)
             brightness = random.randint(STAR_MIN_BRIGHTNESS, STAR_MAX_BRIGHTNESS)
             color = random.choice(STAR_COLORS)
-            self.stars.append(Star(x, y, size, speed, brightness, color))
+            self.stars.add(x, y, size, speed, brightness, color)
 
     def create_initial_asteroids(self):
         """Create initial set of asteroids."""
@@ -2119,16 +3869,16 @@ class Game:
             x = WIDTH + i * 300
             y = random.randint(0, HEIGHT - 100)
             radius = random.randint(ASTEROID_MIN_RADIUS, ASTEROID_MAX_RADIUS)
-            self.asteroids.append(Asteroid(x, y, radius, self.difficulty_level))
+            self.asteroids.append(self.asteroid_pool.acquire(x, y, radius, self.difficulty_level))
 
     def reset(self):
         """Reset game state for new game."""
         self.ship = Ship(SHIP_START_X, SHIP_START_Y)
-        self.asteroids = []
-        self.lasers = []
-        self.explosions = []
-        self.powerups = []
-        self.particles = []
+        self.asteroid_pool.release_all(self.asteroids)
+        self.laser_pool.release_all(self.lasers)
+        self.explosion_pool.release_all(self.explosions)
+        self.powerup_pool.release_all(self.powerups)
+        self.particles.clear()
         self.boss = None
         self.boss_warning = False
         self.boss_warning_timer = 0
@@ -2146,7 +3896,7 @@ class Game:
         self.powerup_manager = PowerUpManager(self.ship)  # Reset power-up manager
         self.screen_shake = 0
         # Reset new visual systems
-        self.score_popups = []
+        self.score_popup_pool.release_all(self.score_popups)
         self.distortion_waves = []
         self.previous_combo = 0
         self.previous_lives = MAX_LIVES
@@ -2416,11 +4166,11 @@ class Game:
         if self.powerup_manager.is_active("spread_shot"):
             # Shoot 3 lasers in a spread
             for angle in [-SPREAD_SHOT_ANGLE, 0, SPREAD_SHOT_ANGLE]:
-                laser = Laser(self.ship.x + self.ship.width, self.ship.y, angle)
+                laser = self.laser_pool.acquire(self.ship.x + self.ship.width, self.ship.y, angle)
                 self.lasers.append(laser)
         else:
             # Shoot single laser
-            laser = Laser(self.ship.x + self.ship.width, self.ship.y)
+            laser = self.laser_pool.acquire(self.ship.x + self.ship.width, self.ship.y)
             self.lasers.append(laser)
 
         self.laser_cooldown = cooldown
@@ -2432,7 +4182,20 @@ class Game:
             # Weight the power-ups (nuke is rarer)
             weights = [1.5, 1.5, 1.5, 1.2, 1.2, 1.0, 0.3]
             powerup_type = random.choices(POWERUP_TYPES_ALL, weights=weights)[0]
-            self.powerups.append(PowerUp(x, y, powerup_type))
+            self.powerups.append(self.powerup_pool.acquire(x, y, powerup_type))
+
+    def pool_stats(self):
+        """Return the counters of every entity pool for debugging/profiling output."""
+        return [
+            pool.stats()
+            for pool in (
+                self.laser_pool,
+                self.asteroid_pool,
+                self.explosion_pool,
+                self.powerup_pool,
+                self.score_popup_pool,
+            )
+        ]
 
     def get_combo_multiplier(self):
         """Calculate and return the current combo multiplier."""
@@ -2450,20 +4213,10 @@ class Game:
         Returns:
             Pygame surface containing the rendered text
         """
-        # Create cache key from font ID, text, and color
-        cache_key = (id(font), text, color)
-
-        # Check if we have a cached version
-        if cache_key in self.text_cache:
-            surface, timestamp = self.text_cache[cache_key]
-            # Check if cache is still valid
-            if self.current_time - timestamp < self.text_cache_ttl:
-                return surface
-
-        # Render and cache the text
-        surface = font.render(text, True, color)
-        self.text_cache[cache_key] = (surface, self.current_time)
-        return surface
+        # Registry fonts have a stable key; fall back to the object for any other font
+        font_key = FONTS.key_for(font) or font
+        cache_key = (font_key, text, tuple(color))
+        return self.text_cache.get(cache_key, lambda: font.render(text, True, color))
 
     def activate_powerup(self, powerup_type):
         """Activate a power-up effect. Stacks duration if already active."""
@@ -2474,14 +4227,14 @@ class Game:
 
             # Instant effect - destroy all asteroids with combo multiplier
             for asteroid in self.asteroids:
-                self.explosions.append(Explosion(asteroid.x, asteroid.y))
+                self.explosions.append(self.explosion_pool.acquire(asteroid.x, asteroid.y))
                 self.create_debris_particles(
                     asteroid.x, asteroid.y, count=int(asteroid.radius / 2)
                 )
                 # Apply combo multiplier to nuke points
                 multiplier = self.get_combo_multiplier() if self.combo > 0 else 1
                 self.score += asteroid.points * multiplier
-            self.asteroids = []
+            self.asteroid_pool.release_all(self.asteroids)
             # Damage boss heavily if present
             if self.boss:
                 nuke_damage = NUKE_BOSS_DAMAGE
@@ -2494,13 +4247,13 @@ class Game:
                         offset_x = random.uniform(-30, 30)
                         offset_y = random.uniform(-30, 30)
                         self.explosions.append(
-                            Explosion(self.boss.x + offset_x, self.boss.y + offset_y)
+                            self.explosion_pool.acquire(self.boss.x + offset_x, self.boss.y + offset_y)
                         )
                     self.score += self.boss.points
                     # Drop guaranteed power-up
                     powerup_type = random.choice(POWERUP_TYPES_DROPABLE)
                     self.powerups.append(
-                        PowerUp(self.boss.x, self.boss.y, powerup_type)
+                        self.powerup_pool.acquire(self.boss.x, self.boss.y, powerup_type)
                     )
                     self.play_sound("explosion_big")
                     self.boss = None
@@ -2521,7 +4274,7 @@ class Game:
             color = random.choice(PARTICLE_COLORS["laser"])
             vx = random.uniform(-1, 1)
             vy = random.uniform(-1, 1)
-            self.particles.append(Particle(x, y, color, vx, vy, size=2, lifetime=15))
+            self.particles.emit(x, y, color, vx, vy, size=2, lifetime=15)
 
     def create_debris_particles(self, x, y, count=10):
         """Create debris particles when asteroid breaks."""
@@ -2532,7 +4285,7 @@ class Game:
             vx = speed * math.cos(math.radians(angle))
             vy = speed * math.sin(math.radians(angle))
             size = random.randint(2, 4)
-            self.particles.append(Particle(x, y, color, vx, vy, size, lifetime=40))
+            self.particles.emit(x, y, color, vx, vy, size, lifetime=40)
 
     def create_engine_particles(self, x, y):
         """Create engine thrust particles behind ship."""
@@ -2541,7 +4294,7 @@ class Game:
             vx = random.uniform(-3, -1)
             vy = random.uniform(-0.5, 0.5)
             size = random.randint(2, 3)
-            self.particles.append(Particle(x, y, color, vx, vy, size, lifetime=10))
+            self.particles.emit(x, y, color, vx, vy, size, lifetime=10)
 
     def create_powerup_particles(self, x, y):
         """Create sparkle particles around power-ups."""
@@ -2550,7 +4303,7 @@ class Game:
         vx = speed * math.cos(math.radians(angle))
         vy = speed * math.sin(math.radians(angle))
         color = random.choice(PARTICLE_COLORS["powerup"])
-        self.particles.append(Particle(x, y, color, vx, vy, size=2, lifetime=20))
+        self.particles.emit(x, y, color, vx, vy, size=2, lifetime=20)
 
     def create_impact_particles(self, x, y):
         """Create impact particles when laser hits asteroid."""
@@ -2560,20 +4313,10 @@ class Game:
             speed = random.uniform(2, 5)
             vx = speed * math.cos(math.radians(angle))
             vy = speed * math.sin(math.radians(angle))
-            self.particles.append(Particle(x, y, color, vx, vy, size=3, lifetime=15))
+            self.particles.emit(x, y, color, vx, vy, size=3, lifetime=15)
 
     def update(self):
         """Update all game objects."""
-        # Clean up text cache periodically (every 2 seconds)
-        if self.current_time % 120 == 0:  # Every 120 frames = 2 seconds at 60 FPS
-            # Remove expired entries from text cache
-            expired_keys = [
-                key for key, (_, timestamp) in self.text_cache.items()
-                if self.current_time - timestamp >= self.text_cache_ttl
-            ]
-            for key in expired_keys:
-                del self.text_cache[key]
-
         # Only update if in playing state
         if self.game_state != "playing":
             return
@@ -2668,15 +4411,13 @@ class Game:
             # Create laser trail particles (50% chance to reduce particle count)
             if random.random() < 0.5:
                 self.create_laser_particles(laser.x, laser.y)
-        self.lasers = [laser for laser in self.lasers if not laser.is_off_screen()]
+        self.laser_pool.compact(self.lasers, Laser.is_off_screen)
 
         # Update asteroids
         time_scale = TIME_SLOW_MULTIPLIER if self.powerup_manager.is_active("time_slow") else 1.0
         for asteroid in self.asteroids:
             asteroid.update(time_scale)
-        self.asteroids = [
-            asteroid for asteroid in self.asteroids if not asteroid.is_off_screen()
-        ]
+        self.asteroid_pool.compact(self.asteroids, Asteroid.is_off_screen)
 
         # Update boss
         if self.boss:
@@ -2699,9 +4440,7 @@ class Game:
             # Create sparkle particles around power-ups
             if random.random() < 0.3:  # 30% chance each frame
                 self.create_powerup_particles(powerup.x, powerup.y)
-        self.powerups = [
-            powerup for powerup in self.powerups if not powerup.is_off_screen()
-        ]
+        self.powerup_pool.compact(self.powerups, PowerUp.is_off_screen)
 
         # Spawn new asteroids
         self.asteroid_spawn_timer += 1
@@ -2712,26 +4451,19 @@ class Game:
         ):
             y = random.randint(0, HEIGHT - 100)
             radius = random.randint(ASTEROID_MIN_RADIUS, ASTEROID_MAX_RADIUS)
-            self.asteroids.append(Asteroid(WIDTH, y, radius, self.difficulty_level))
+            self.asteroids.append(self.asteroid_pool.acquire(WIDTH, y, radius, self.difficulty_level))
             self.asteroid_spawn_timer = 0
 
         # Update explosions
         for explosion in self.explosions:
             explosion.update()
-        self.explosions = [
-            explosion for explosion in self.explosions if not explosion.is_finished()
-        ]
+        self.explosion_pool.compact(self.explosions, Explosion.is_finished)
 
         # Update stars
-        for star in self.stars:
-            star.update(self.paused)
+        self.stars.update(self.paused)
 
         # Update particles
-        for particle in self.particles:
-            particle.update()
-        self.particles = [
-            particle for particle in self.particles if not particle.is_dead()
-        ]
+        self.particles.update()
 
         # Update screen shake
         if self.screen_shake > 0:
@@ -2749,10 +4481,9 @@ class Game:
         # Update new visual systems
         for popup in self.score_popups:
             popup.update()
-        self.score_popups = [p for p in self.score_popups if not p.is_dead()]
+        self.score_popup_pool.compact(self.score_popups, ScorePopup.is_dead)
 
-        for cloud in self.nebula_clouds:
-            cloud.update()
+        self.background.update()
 
         for wave in self.distortion_waves:
             wave.update()
@@ -2773,164 +4504,233 @@ class Game:
         self.check_collisions()
 
     def check_collisions(self):
-        """Check all collision scenarios."""
+        """Check all collision scenarios.
+
+        Asteroids and power-ups are snapshotted into column lists and hashed
+        into uniform grids once per frame. Each query runs a batched
+        box_overlaps/circle_overlaps test over its grid candidates and the
+        resulting hit indices are consumed in list order, matching the
+        collides_with_* methods exactly (see tests/test_collisions.py). Asteroid pairs that pass the bounding
+        test are confirmed with pixel masks; collision_counters records how
+        often that happens each frame.
+        """
+        counters = self.collision_counters
+        counters["candidates"] = 0  # Asteroid pairs reaching the bounding test
+        counters["precise_tests"] = 0  # Pairs that passed it and compared masks
+        counters["precise_hits"] = 0  # Mask comparisons that found an overlap
+
+        # Column snapshots of this frame's asteroids and power-ups for the batched tests
+        asteroids = list(self.asteroids)
+        ast_x = [asteroid.x for asteroid in asteroids]
+        ast_y = [asteroid.y for asteroid in asteroids]
+        ast_r = [asteroid.bounding_radius for asteroid in asteroids]
+        ast_left = [x - r for x, r in zip(ast_x, ast_r)]
+        ast_right = [x + r for x, r in zip(ast_x, ast_r)]
+        ast_top = [y - r for y, r in zip(ast_y, ast_r)]
+        ast_bottom = [y + r for y, r in zip(ast_y, ast_r)]
+        powerups = list(self.powerups)
+        pu_x = [powerup.x for powerup in powerups]
+        pu_y = [powerup.y for powerup in powerups]
+        pu_size = [powerup.size for powerup in powerups]
+
+        # Build the broadphase grids from the same snapshot
+        asteroid_grid = self.asteroid_grid
+        asteroid_grid.clear()
+        for j in range(len(asteroids)):
+            asteroid_grid.insert(j, ast_left[j], ast_top[j], ast_right[j], ast_bottom[j])
+        powerup_grid = self.powerup_grid
+        powerup_grid.clear()
+        for k in range(len(powerups)):
+            powerup_grid.insert(
+                k, pu_x[k] - pu_size[k], pu_y[k] - pu_size[k], pu_x[k] + pu_size[k], pu_y[k] + pu_size[k]
+            )
+
         # Laser-asteroid collisions
-        lasers_to_remove = []
-        asteroids_to_remove = []
+        lasers_to_remove = set()
+        asteroids_to_remove = set()
 
         asteroids_to_add = []  # For child asteroids
 
         for i, laser in enumerate(self.lasers):
-            # Early exit: skip lasers already marked for removal (performance optimization)
-            if i in lasers_to_remove:
-                continue
-
-            for j, asteroid in enumerate(self.asteroids):
-                if laser.collides_with_asteroid(asteroid):
-                    if i not in lasers_to_remove:
-                        lasers_to_remove.append(i)
-                    if j not in asteroids_to_remove:
-                        asteroids_to_remove.append(j)
-                        # Create explosion
-                        self.explosions.append(Explosion(asteroid.x, asteroid.y))
-                        # Create impact and debris particles
-                        self.create_impact_particles(asteroid.x, asteroid.y)
-                        self.create_debris_particles(
-                            asteroid.x, asteroid.y, count=int(asteroid.radius / 3)
-                        )
-                        # Update combo
-                        self.combo += 1
-                        self.combo_timer = COMBO_TIMEOUT
-                        # Calculate score with combo multiplier
-                        multiplier = self.get_combo_multiplier()
-                        points = asteroid.points * multiplier
-                        # Double damage doubles the points
-                        if self.powerup_manager.is_active("double_damage"):
-                            points *= 2
-                        self.score += points
-                        # Create score popup
-                        self.score_popups.append(ScorePopup(asteroid.x, asteroid.y, int(points)))
-                        # Break asteroid into smaller pieces if applicable
-                        if asteroid.can_break():
-                            children = asteroid.create_children(self.difficulty_level)
-                            asteroids_to_add.extend(children)
-                        # Spawn power-up chance
-                        self.spawn_powerup(asteroid.x, asteroid.y)
-                        self.play_sound("explosion")
+            left, top, right, bottom = laser.get_rect()
+            candidates = asteroid_grid.query(left, top, right, bottom)
+            counters["candidates"] += len(candidates)
+            hits = box_overlaps(ast_left, ast_top, ast_right, ast_bottom, left, top, right, bottom, candidates)
+            for j in hits:
+                asteroid = asteroids[j]
+                counters["precise_tests"] += 1
+                if not asteroid.mask_overlaps(LASER_MASK, left, top):
+                    continue
+                counters["precise_hits"] += 1
+                lasers_to_remove.add(i)
+                if j not in asteroids_to_remove:
+                    asteroids_to_remove.add(j)
+                    # Create explosion
+                    self.explosions.append(self.explosion_pool.acquire(asteroid.x, asteroid.y))
+                    # Create impact and debris particles
+                    self.create_impact_particles(asteroid.x, asteroid.y)
+                    self.create_debris_particles(
+                        asteroid.x, asteroid.y, count=int(asteroid.radius / 3)
+                    )
+                    # Update combo
+                    self.combo += 1
+                    self.combo_timer = COMBO_TIMEOUT
+                    # Calculate score with combo multiplier
+                    multiplier = self.get_combo_multiplier()
+                    points = asteroid.points * multiplier
+                    # Double damage doubles the points
+                    if self.powerup_manager.is_active("double_damage"):
+                        points *= 2
+                    self.score += points
+                    # Create score popup
+                    self.score_popups.append(self.score_popup_pool.acquire(asteroid.x, asteroid.y, int(points)))
+                    # Break asteroid into smaller pieces if applicable
+                    if asteroid.can_break():
+                        children = asteroid.create_children(self.difficulty_level, self.asteroid_pool)
+                        asteroids_to_add.extend(children)
+                    # Spawn power-up chance
+                    self.spawn_powerup(asteroid.x, asteroid.y)
+                    self.play_sound("explosion")
 
         # Remove collided objects
-        self.lasers = [
-            laser for i, laser in enumerate(self.lasers) if i not in lasers_to_remove
-        ]
-        self.asteroids = [
-            asteroid
-            for i, asteroid in enumerate(self.asteroids)
-            if i not in asteroids_to_remove
-        ]
+        if lasers_to_remove:
+            self.laser_pool.remove_indices(self.lasers, lasers_to_remove)
+        if asteroids_to_remove:
+            self.asteroid_pool.remove_indices(self.asteroids, asteroids_to_remove)
 
         # Add child asteroids from breaking (respect MAX_ASTEROIDS limit)
-        available_slots = MAX_ASTEROIDS - len(self.asteroids)
-        if available_slots > 0:
-            self.asteroids.extend(asteroids_to_add[:available_slots])
+        available_slots = max(0, MAX_ASTEROIDS - len(self.asteroids))
+        children_added = asteroids_to_add[:available_slots]
+        self.asteroids.extend(children_added)
+        for child in asteroids_to_add[available_slots:]:
+            self.asteroid_pool.release(child)
 
         # Boss-laser collisions
         if self.boss:
-            lasers_to_remove_boss = []
-            for i, laser in enumerate(self.lasers):
-                # Early exit: skip lasers already marked for removal
-                if i in lasers_to_remove_boss:
-                    continue
-
-                if laser.collides_with_boss(self.boss):
-                    if i not in lasers_to_remove_boss:
-                        lasers_to_remove_boss.append(i)
-                        # Update combo
-                        self.combo += 1
-                        self.combo_timer = COMBO_TIMEOUT
-                        # Boss takes damage (double if power-up active)
-                        damage = 2 if self.powerup_manager.is_active("double_damage") else 1
-                        if self.boss.take_damage(damage):
-                            # Boss defeated!
-                            self.create_impact_particles(self.boss.x, self.boss.y)
-                            self.create_debris_particles(
-                                self.boss.x, self.boss.y, count=50
-                            )
-                            # Big explosion
-                            for _ in range(5):
-                                offset_x = random.uniform(-30, 30)
-                                offset_y = random.uniform(-30, 30)
-                                self.explosions.append(
-                                    Explosion(
-                                        self.boss.x + offset_x, self.boss.y + offset_y
-                                    )
-                                )
-                            # Score points with combo multiplier
-                            multiplier = self.get_combo_multiplier()
-                            self.score += self.boss.points * multiplier
-                            # Drop guaranteed power-up
-                            powerup_type = random.choice(POWERUP_TYPES_DROPABLE)
-                            self.powerups.append(
-                                PowerUp(self.boss.x, self.boss.y, powerup_type)
+            lasers_to_remove_boss = set()
+            lasers = self.lasers
+            boss = self.boss
+            laser_rects = [laser.get_rect() for laser in lasers]
+            boss_hits = box_overlaps(
+                [rect[0] for rect in laser_rects],
+                [rect[1] for rect in laser_rects],
+                [rect[2] for rect in laser_rects],
+                [rect[3] for rect in laser_rects],
+                boss.x - boss.radius, boss.y - boss.radius, boss.x + boss.radius, boss.y + boss.radius,
+                range(len(lasers)),
+            )
+            for i in boss_hits:
+                lasers_to_remove_boss.add(i)
+                # Update combo
+                self.combo += 1
+                self.combo_timer = COMBO_TIMEOUT
+                # Boss takes damage (double if power-up active)
+                damage = 2 if self.powerup_manager.is_active("double_damage") else 1
+                if self.boss.take_damage(damage):
+                    # Boss defeated!
+                    self.create_impact_particles(self.boss.x, self.boss.y)
+                    self.create_debris_particles(
+                        self.boss.x, self.boss.y, count=50
+                    )
+                    # Big explosion
+                    for _ in range(5):
+                        offset_x = random.uniform(-30, 30)
+                        offset_y = random.uniform(-30, 30)
+                        self.explosions.append(
+                            self.explosion_pool.acquire(
+                                self.boss.x + offset_x, self.boss.y + offset_y
                             )
-                            # Huge screen shake
-                            self.screen_shake = SCREEN_SHAKE_DURATION * 3
-                            # Play big explosion sound
-                            self.play_sound("explosion_big")
-                            self.boss = None
-                            # Update last boss spawn score to prevent immediate re-spawn
-                            self.last_boss_spawn_score = self.score
-                            # Exit loop - no more boss to hit
-                            break
-                        else:
-                            # Just hit, create impact
-                            self.create_impact_particles(self.boss.x, self.boss.y)
-                            self.screen_shake = SCREEN_SHAKE_DURATION // 2
+                        )
+                    # Score points with combo multiplier
+                    multiplier = self.get_combo_multiplier()
+                    self.score += self.boss.points * multiplier
+                    # Drop guaranteed power-up
+                    powerup_type = random.choice(POWERUP_TYPES_DROPABLE)
+                    self.powerups.append(
+                        self.powerup_pool.acquire(self.boss.x, self.boss.y, powerup_type)
+                    )
+                    # Huge screen shake
+                    self.screen_shake = SCREEN_SHAKE_DURATION * 3
+                    # Play big explosion sound
+                    self.play_sound("explosion_big")
+                    self.boss = None
+                    # Update last boss spawn score to prevent immediate re-spawn
+                    self.last_boss_spawn_score = self.score
+                    # Exit loop - no more boss to hit
+                    break
+                else:
+                    # Just hit, create impact
+                    self.create_impact_particles(self.boss.x, self.boss.y)
+                    self.screen_shake = SCREEN_SHAKE_DURATION // 2
             # Remove lasers that hit boss
-            self.lasers = [
-                laser for i, laser in enumerate(self.lasers) if i not in lasers_to_remove_boss
-            ]
-
-        # Ship-asteroid collisions
+            if lasers_to_remove_boss:
+                self.laser_pool.remove_indices(self.lasers, lasers_to_remove_boss)
+
+        # Ship-asteroid collisions: surviving grid candidates, then this frame's children
+        ship_x, ship_y = self.ship.get_center()
+        ship_reach = self.ship.get_bounding_radius()
+        ship_mask, ship_left, ship_top = self.ship.get_mask()
+        ship_candidates = [
+            j for j in asteroid_grid.query(
+                ship_x - ship_reach, ship_y - ship_reach, ship_x + ship_reach, ship_y + ship_reach
+            )
+            if j not in asteroids_to_remove
+        ]
+        for child in children_added:
+            ship_candidates.append(len(asteroids))
+            asteroids.append(child)
+            ast_x.append(child.x)
+            ast_y.append(child.y)
+            ast_r.append(child.bounding_radius)
+        counters["candidates"] += len(ship_candidates)
         asteroid_to_remove = None
-        for asteroid in self.asteroids:
-            if asteroid.collides_with_ship(self.ship):
-                # Take damage and check if shield absorbed it
-                game_over, shield_absorbed = self.ship.take_damage()
-                if game_over:
-                    self.game_over = True
+        for j in circle_overlaps(ast_x, ast_y, ast_r, ship_x, ship_y, ship_reach, ship_candidates):
+            asteroid = asteroids[j]
+            counters["precise_tests"] += 1
+            if not asteroid.mask_overlaps(ship_mask, ship_left, ship_top):
+                continue
+            counters["precise_hits"] += 1
+            # Take damage and check if shield absorbed it
+            game_over, shield_absorbed = self.ship.take_damage()
+            if game_over:
+                self.game_over = True
+            else:
+                # Screen shake on hit
+                self.screen_shake = SCREEN_SHAKE_DURATION
+                # Play appropriate sound (shield break or hit)
+                if shield_absorbed:
+                    self.play_sound("shield")
                 else:
-                    # Screen shake on hit
-                    self.screen_shake = SCREEN_SHAKE_DURATION
-                    # Play appropriate sound (shield break or hit)
-                    if shield_absorbed:
-                        self.play_sound("shield")
-                    else:
-                        self.play_sound("hit")
-                    # Create explosion and debris particles
-                    self.explosions.append(Explosion(asteroid.x, asteroid.y))
-                    self.create_debris_particles(
-                        asteroid.x, asteroid.y, count=int(asteroid.radius / 2)
-                    )
-                    # Break asteroid if applicable (even on ship collision)
-                    if asteroid.can_break():
-                        children = asteroid.create_children(self.difficulty_level)
-                        # Add children after removing parent (respect MAX_ASTEROIDS limit)
-                        available_slots = MAX_ASTEROIDS - len(self.asteroids)
-                        for child in children[:available_slots]:
-                            self.asteroids.append(child)
-                    # Mark asteroid for removal (don't remove during iteration)
-                    asteroid_to_remove = asteroid
-                    # Reset combo
-                    self.combo = 0
-                    self.combo_timer = 0
-                break
+                    self.play_sound("hit")
+                # Create explosion and debris particles
+                self.explosions.append(self.explosion_pool.acquire(asteroid.x, asteroid.y))
+                self.create_debris_particles(
+                    asteroid.x, asteroid.y, count=int(asteroid.radius / 2)
+                )
+                # Break asteroid if applicable (even on ship collision)
+                if asteroid.can_break():
+                    children = asteroid.create_children(self.difficulty_level, self.asteroid_pool)
+                    # Add children after removing parent (respect MAX_ASTEROIDS limit)
+                    available_slots = max(0, MAX_ASTEROIDS - len(self.asteroids))
+                    self.asteroids.extend(children[:available_slots])
+                    for child in children[available_slots:]:
+                        self.asteroid_pool.release(child)
+                # Mark asteroid for removal (don't remove during iteration)
+                asteroid_to_remove = asteroid
+                # Reset combo
+                self.combo = 0
+                self.combo_timer = 0
+            break
 
         # Remove asteroid after iteration
         if asteroid_to_remove:
             self.asteroids.remove(asteroid_to_remove)
+            self.asteroid_pool.release(asteroid_to_remove)
 
-        # Ship-boss collisions
-        if self.boss and self.boss.collides_with_ship(self.ship):
+        # Ship-boss collisions (the boss body is a true circle)
+        ship_radius = self.ship.width // 2
+        boss = self.boss
+        if boss and circle_overlaps((boss.x,), (boss.y,), (boss.radius,), ship_x, ship_y, ship_radius, (0,)):
             game_over, shield_absorbed = self.ship.take_damage()
             if game_over:
                 self.game_over = True
@@ -2946,19 +4746,28 @@ class Game:
                 self.combo = 0
                 self.combo_timer = 0
 
-        # Ship-powerup collisions
-        powerups_to_remove = []
-        for i, powerup in enumerate(self.powerups):
-            if powerup.collides_with_ship(self.ship):
-                self.activate_powerup(powerup.type)
-                powerups_to_remove.append(i)
+        # Ship-powerup collisions: grid candidates, then power-ups dropped this frame
+        powerups_to_remove = set()
+        powerup_candidates = powerup_grid.query(
+            ship_x - ship_radius, ship_y - ship_radius, ship_x + ship_radius, ship_y + ship_radius
+        )
+        for i in range(len(powerups), len(self.powerups)):
+            powerup = self.powerups[i]
+            powerup_candidates.append(i)
+            pu_x.append(powerup.x)
+            pu_y.append(powerup.y)
+            pu_size.append(powerup.size)
+        for i in circle_overlaps(pu_x, pu_y, pu_size, ship_x, ship_y, ship_radius, powerup_candidates):
+            self.activate_powerup(self.powerups[i].type)
+            powerups_to_remove.add(i)
         # Remove collected power-ups
-        self.powerups = [
-            powerup for i, powerup in enumerate(self.powerups) if i not in powerups_to_remove
-        ]
+        if powerups_to_remove:
+            self.powerup_pool.remove_indices(self.powerups, powerups_to_remove)
 
     def draw(self):
         """Draw all game objects and UI based on game state."""
+        self.render_targets.begin_frame()
+
         if self.game_state == "menu":
             self.draw_menu()
         elif self.game_state == "highscores":
@@ -2976,21 +4785,17 @@ class Game:
 
     def draw_game(self):
         """Draw the actual game (playing state)."""
-        # Create offset surface for screen shake
-        offset_screen = pygame.Surface((WIDTH, HEIGHT))
-        offset_screen.fill(BACKGROUND)
+        # Persistent back buffer, blitted with an offset for screen shake
+        offset_screen = self.render_targets.buffer("back")
 
-        # Draw nebula clouds in background
-        for cloud in self.nebula_clouds:
-            cloud.draw(offset_screen)
+        # Draw pre-composited background (fill color and nebula clouds)
+        self.background.draw(offset_screen)
 
         # Draw stars
-        for star in self.stars:
-            star.draw(offset_screen)
+        self.stars.draw(offset_screen)
 
         # Draw particles
-        for particle in self.particles:
-            particle.draw(offset_screen)
+        self.particles.draw(offset_screen)
 
         # Draw explosions
         for explosion in self.explosions:
@@ -3008,9 +4813,11 @@ class Game:
         for powerup in self.powerups:
             powerup.draw(offset_screen, self.current_time)
 
-        # Draw lasers
+        # Draw lasers with one batched blit
+        laser_blits = []
         for laser in self.lasers:
-            laser.draw(offset_screen)
+            laser.add_blits(laser_blits)
+        offset_screen.fblits(laser_blits)
 
         # Draw ship
         self.ship.draw(offset_screen, self.current_time)
@@ -3020,8 +4827,10 @@ class Game:
             popup.draw(offset_screen)
 
         # Draw distortion waves
-        for wave in self.distortion_waves:
-            wave.draw(offset_screen)
+        if self.distortion_waves:
+            wave_scratch = self.render_targets.buffer("distortion", alpha=True)
+            for wave in self.distortion_waves:
+                wave.draw(offset_screen, wave_scratch)
 
         # Draw UI
         self.draw_ui(offset_screen, self.current_time)
@@ -3035,30 +4844,18 @@ class Game:
 
         # Apply chromatic aberration during screen shake
         if self.screen_shake > 0:
-            # Create chromatic aberration by offsetting RGB channels
+            # Create chromatic aberration by adding a horizontally offset copy
             aberration_intensity = CHROMATIC_ABERRATION_INTENSITY
-            # Create separate surfaces for each channel
-            red_surface = pygame.Surface((WIDTH, HEIGHT))
+            red_surface = self.render_targets.buffer("aberration")
             red_surface.fill((0, 0, 0))
             red_surface.blit(offset_screen, (aberration_intensity, 0))
 
-            green_surface = pygame.Surface((WIDTH, HEIGHT))
-            green_surface.fill((0, 0, 0))
-            green_surface.blit(offset_screen, (0, 0))
-
-            blue_surface = pygame.Surface((WIDTH, HEIGHT))
-            blue_surface.fill((0, 0, 0))
-            blue_surface.blit(offset_screen, (-aberration_intensity, 0))
-
-            # Extract and combine channels (simplified chromatic effect)
-            # Just use additive blending for the effect
+            # Simplified chromatic effect using additive blending
             offset_screen.blit(red_surface, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
 
         # Add boss fight red tint overlay
         if self.boss is not None:
-            tint_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            tint_alpha = BOSS_TINT_ALPHA  # Subtle red tint
-            tint_surface.fill((255, 50, 50, tint_alpha))
+            tint_surface = self.render_targets.overlay((255, 50, 50, BOSS_TINT_ALPHA))  # Subtle red tint
             offset_screen.blit(tint_surface, (0, 0))
 
         # Blit offset screen with shake
@@ -3069,19 +4866,18 @@ class Game:
         self.screen.fill(BACKGROUND)
 
         # Draw animated stars in background
-        for star in self.stars:
-            star.update(paused=False)
-            star.draw(self.screen)
+        self.stars.update(paused=False)
+        self.stars.draw(self.screen)
 
         # Draw title
-        title_text = self.title_font.render("SPACE SHOOTER", True, TEXT_COLOR)
+        title_text = self.render_text_cached(self.title_font, "SPACE SHOOTER", TEXT_COLOR)
         self.screen.blit(
             title_text, (WIDTH // 2 - title_text.get_width() // 2, HEIGHT // 4)
         )
 
         # Draw subtitle
-        subtitle_text = self.small_font.render(
-            "Blast Asteroids • Collect Power-Ups • Battle Bosses", True, TEXT_COLOR
+        subtitle_text = self.render_text_cached(
+            self.small_font, "Blast Asteroids • Collect Power-Ups • Battle Bosses", TEXT_COLOR
         )
         self.screen.blit(
             subtitle_text, (WIDTH // 2 - subtitle_text.get_width() // 2, HEIGHT // 4 + 80)
@@ -3093,18 +4889,18 @@ class Game:
             # Highlight selected option
             if i == self.menu_selected:
                 color = COMBO_COLOR
-                text = self.large_font.render(f"> {option} <", True, color)
+                text = self.render_text_cached(self.large_font, f"> {option} <", color)
             else:
                 color = TEXT_COLOR
-                text = self.font.render(option, True, color)
+                text = self.render_text_cached(self.font, option, color)
 
             text_x = WIDTH // 2 - text.get_width() // 2
             text_y = menu_start_y + i * 60
             self.screen.blit(text, (text_x, text_y))
 
         # Draw controls hint
-        controls_text = self.small_font.render(
-            "W/S or Up/Down Arrow Keys to navigate • ENTER to select", True, TEXT_COLOR
+        controls_text = self.render_text_cached(
+            self.small_font, "W/S or Up/Down Arrow Keys to navigate • ENTER to select", TEXT_COLOR
         )
         self.screen.blit(
             controls_text,
@@ -3116,12 +4912,11 @@ class Game:
         self.screen.fill(BACKGROUND)
 
         # Draw animated stars in background
-        for star in self.stars:
-            star.update(paused=False)
-            star.draw(self.screen)
+        self.stars.update(paused=False)
+        self.stars.draw(self.screen)
 
         # Draw title
-        title_text = self.title_font.render("HIGH SCORES", True, COMBO_COLOR)
+        title_text = self.render_text_cached(self.title_font, "HIGH SCORES", COMBO_COLOR)
         self.screen.blit(
             title_text, (WIDTH // 2 - title_text.get_width() // 2, 50)
         )
@@ -3129,8 +4924,8 @@ class Game:
         # Draw high scores
         start_y = 150
         if len(self.high_scores) == 0:
-            no_scores_text = self.font.render(
-                "No high scores yet!", True, TEXT_COLOR
+            no_scores_text = self.render_text_cached(
+                self.font, "No high scores yet!", TEXT_COLOR
             )
             self.screen.blit(
                 no_scores_text,
@@ -3139,11 +4934,11 @@ class Game:
         else:
             for i, (score, name) in enumerate(self.high_scores):
                 # Rank
-                rank_text = self.font.render(f"{i + 1}.", True, TEXT_COLOR)
+                rank_text = self.render_text_cached(self.font, f"{i + 1}.", TEXT_COLOR)
                 # Name
-                name_text = self.font.render(name, True, TEXT_COLOR)
+                name_text = self.render_text_cached(self.font, name, TEXT_COLOR)
                 # Score
-                score_text = self.font.render(str(score), True, COMBO_COLOR)
+                score_text = self.render_text_cached(self.font, str(score), COMBO_COLOR)
 
                 y_pos = start_y + i * 40
                 self.screen.blit(rank_text, (WIDTH // 4 - 30, y_pos))
@@ -3151,8 +4946,8 @@ class Game:
                 self.screen.blit(score_text, (WIDTH // 2 + 100, y_pos))
 
         # Draw back hint
-        back_text = self.small_font.render(
-            "Press ENTER or ESC to return", True, TEXT_COLOR
+        back_text = self.render_text_cached(
+            self.small_font, "Press ENTER or ESC to return", TEXT_COLOR
         )
         self.screen.blit(
             back_text, (WIDTH // 2 - back_text.get_width() // 2, HEIGHT - 60)
@@ -3163,12 +4958,11 @@ class Game:
         self.screen.fill(BACKGROUND)
 
         # Draw animated stars in background
-        for star in self.stars:
-            star.update(paused=False)
-            star.draw(self.screen)
+        self.stars.update(paused=False)
+        self.stars.draw(self.screen)
 
         # Draw title
-        title_text = self.title_font.render("OPTIONS", True, TEXT_COLOR)
+        title_text = self.render_text_cached(self.title_font, "OPTIONS", TEXT_COLOR)
         self.screen.blit(
             title_text, (WIDTH // 2 - title_text.get_width() // 2, 50)
         )
@@ -3177,9 +4971,9 @@ class Game:
         start_y = 200
 
         # Volume slider
-        volume_label = self.font.render("Volume", True, TEXT_COLOR)
+        volume_label = self.render_text_cached(self.font, "Volume", TEXT_COLOR)
         if self.options_selected == 0:
-            volume_label = self.large_font.render("> Volume <", True, COMBO_COLOR)
+            volume_label = self.render_text_cached(self.large_font, "> Volume <", COMBO_COLOR)
         self.screen.blit(
             volume_label, (WIDTH // 2 - volume_label.get_width() // 2, start_y)
         )
@@ -3208,7 +5002,7 @@ class Game:
 
         # Volume percentage
         volume_percent = int(self.volume * 100)
-        volume_text = self.font.render(f"{volume_percent}%", True, TEXT_COLOR)
+        volume_text = self.render_text_cached(self.font, f"{volume_percent}%", TEXT_COLOR)
         self.screen.blit(
             volume_text, (WIDTH // 2 - volume_text.get_width() // 2, slider_y + 30)
         )
@@ -3219,24 +5013,24 @@ class Game:
         mute_color = GAME_OVER_COLOR if self.muted else POWERUP_COLORS["shield"]
 
         if self.options_selected == 1:
-            mute_label = self.large_font.render(f"> Mute: {mute_status} <", True, COMBO_COLOR)
+            mute_label = self.render_text_cached(self.large_font, f"> Mute: {mute_status} <", COMBO_COLOR)
         else:
-            mute_label = self.font.render(f"Mute: {mute_status}", True, mute_color)
+            mute_label = self.render_text_cached(self.font, f"Mute: {mute_status}", mute_color)
 
         self.screen.blit(
             mute_label, (WIDTH // 2 - mute_label.get_width() // 2, mute_y)
         )
 
         # Instructions
-        controls_text = self.small_font.render(
-            "W/S or Up/Down Arrow Keys: Navigate • A/D or Left/Right Arrow Keys: Adjust • ENTER: Toggle Mute", True, TEXT_COLOR
+        controls_text = self.render_text_cached(
+            self.small_font, "W/S or Up/Down Arrow Keys: Navigate • A/D or Left/Right Arrow Keys: Adjust • ENTER: Toggle Mute", TEXT_COLOR
         )
         self.screen.blit(
             controls_text, (WIDTH // 2 - controls_text.get_width() // 2, HEIGHT - 100)
         )
 
-        back_text = self.small_font.render(
-            "Press ESC to return", True, TEXT_COLOR
+        back_text = self.render_text_cached(
+            self.small_font, "Press ESC to return", TEXT_COLOR
         )
         self.screen.blit(
             back_text, (WIDTH // 2 - back_text.get_width() // 2, HEIGHT - 60)
@@ -3245,20 +5039,19 @@ class Game:
     def draw_game_over_screen(self):
         """Draw game over overlay on top of game."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = self.render_targets.overlay((0, 0, 0, 180))
         self.screen.blit(overlay, (0, 0))
 
         # Game over message
-        game_over_text = self.font.render("GAME OVER!", True, GAME_OVER_COLOR)
+        game_over_text = self.render_text_cached(self.font, "GAME OVER!", GAME_OVER_COLOR)
         self.screen.blit(
             game_over_text,
             (WIDTH // 2 - game_over_text.get_width() // 2, HEIGHT // 2 - 80),
         )
 
         # Final score
-        final_score_text = self.font.render(
-            f"Final Score: {self.score}", True, TEXT_COLOR
+        final_score_text = self.render_text_cached(
+            self.font, f"Final Score: {self.score}", TEXT_COLOR
         )
         self.screen.blit(
             final_score_text,
@@ -3267,8 +5060,8 @@ class Game:
 
         # Name input for new high score
         if self.name_input_active:
-            prompt_text = self.font.render(
-                "New High Score! Enter your name:", True, TEXT_COLOR
+            prompt_text = self.render_text_cached(
+                self.font, "New High Score! Enter your name:", TEXT_COLOR
             )
             self.screen.blit(
                 prompt_text,
@@ -3279,7 +5072,7 @@ class Game:
             pygame.draw.rect(
                 self.screen, (50, 50, 100), (WIDTH // 2 - 100, HEIGHT // 2 + 60, 200, 40)
             )
-            name_display = self.small_font.render(self.player_name, True, TEXT_COLOR)
+            name_display = self.render_text_cached(self.small_font, self.player_name, TEXT_COLOR)
             self.screen.blit(name_display, (WIDTH // 2 - 100 + 10, HEIGHT // 2 + 65))
 
             # Blinking cursor
@@ -3294,21 +5087,21 @@ class Game:
                 )
 
             # Instructions
-            enter_text = self.small_font.render("Press ENTER to save", True, TEXT_COLOR)
+            enter_text = self.render_text_cached(self.small_font, "Press ENTER to save", TEXT_COLOR)
             self.screen.blit(
                 enter_text,
                 (WIDTH // 2 - enter_text.get_width() // 2, HEIGHT // 2 + 110),
             )
         else:
             # Instructions
-            restart_text = self.font.render("Press R to restart", True, TEXT_COLOR)
+            restart_text = self.render_text_cached(self.font, "Press R to restart", TEXT_COLOR)
             self.screen.blit(
                 restart_text,
                 (WIDTH // 2 - restart_text.get_width() // 2, HEIGHT // 2 + 20),
             )
 
             # Exit to menu hint
-            menu_text = self.small_font.render("Press ESC for menu", True, TEXT_COLOR)
+            menu_text = self.render_text_cached(self.small_font, "Press ESC for menu", TEXT_COLOR)
             self.screen.blit(
                 menu_text, (WIDTH // 2 - menu_text.get_width() // 2, HEIGHT // 2 + 60)
             )
@@ -3321,29 +5114,30 @@ class Game:
             current_time: Current tick time (cached for performance)
         """
         # Draw holographic scan lines
-        scan_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        for i in range(0, HEIGHT, 4):
-            scan_y = (i + self.scan_line_offset) % HEIGHT
-            alpha = 20
-            pygame.draw.line(scan_surface, (self.theme_color[0], self.theme_color[1], self.theme_color[2], alpha),
-                           (0, scan_y), (WIDTH, scan_y), 1)
-        screen.blit(scan_surface, (0, 0))
-
-        # Draw score with theme color
-        score_text = self.font.render(f"Score: {self.score}", True, self.theme_color)
-        screen.blit(score_text, (20, 20))
+        theme_color = self.theme_color
+        scan_strip = SCAN_LINE_SPRITES.get(theme_color, lambda: _render_scan_lines(theme_color))
+        screen.blit(scan_strip, (0, self.scan_line_offset % SCAN_LINE_SPACING - SCAN_LINE_SPACING))
+
+        # HUD widgets below are cached and only re-rendered when their value changes
+        hud = self.hud
+        hud.begin_frame()
+
+        # Draw score with theme color, composed from cached glyphs
+        glyph_atlas(self.font, self.theme_color).draw(screen, (20, 20), "Score: ", self.score)
 
         # Draw high score (top score from leaderboard)
         if self.high_scores:
             high_score, high_score_player = self.high_scores[0]
-            high_score_text = self.font.render(
-                f"High Score: {high_score}", True, TEXT_COLOR
+            high_score_text = hud.widget(
+                "high_score", high_score,
+                lambda: self.render_text_cached(self.font, f"High Score: {high_score}", TEXT_COLOR)
             )
             screen.blit(high_score_text, (WIDTH - high_score_text.get_width() - 20, 20))
 
             # Draw high score player name
-            player_text = self.small_font.render(
-                f"By: {high_score_player}", True, TEXT_COLOR
+            player_text = hud.widget(
+                "high_score_player", high_score_player,
+                lambda: self.render_text_cached(self.small_font, f"By: {high_score_player}", TEXT_COLOR)
             )
             screen.blit(player_text, (WIDTH - player_text.get_width() - 20, 50))
 
@@ -3352,13 +5146,15 @@ class Game:
         if self.ship.lives == 1:
             # Pulse health bar when low
             pulse = (math.sin(current_time / 100.0) + 1) / 2
+            pulse = round(pulse * (HUD_LIVES_PULSE_LEVELS - 1)) / (HUD_LIVES_PULSE_LEVELS - 1)
             lives_color = (255, int(100 + pulse * 155), int(100 + pulse * 155))
-        lives_text = self.font.render(f"Lives: {self.ship.lives}", True, lives_color)
-        screen.blit(lives_text, (20, 60))
+        glyph_atlas(self.font, lives_color).draw(screen, (20, 60), "Lives: ", self.ship.lives)
 
         # Draw difficulty multiplier
-        difficulty_text = self.small_font.render(
-            f"Speed: {self.difficulty_level:.1f}x", True, (255, 200, 100)
+        difficulty_label = f"Speed: {self.difficulty_level:.1f}x"
+        difficulty_text = hud.widget(
+            "difficulty", difficulty_label,
+            lambda: self.render_text_cached(self.small_font, difficulty_label, (255, 200, 100))
         )
         screen.blit(difficulty_text, (20, 90))
 
@@ -3374,178 +5170,160 @@ class Game:
                 self.previous_combo = self.combo
 
             combo_font_size = int(36 * scale_factor)
-            # Use cached font if available, otherwise create and cache it
-            if combo_font_size not in self.combo_font_cache:
-                self.combo_font_cache[combo_font_size] = pygame.font.SysFont(None, combo_font_size)
-            combo_font = self.combo_font_cache[combo_font_size]
-            combo_text = combo_font.render(f"COMBO x{multiplier}!", True, COMBO_COLOR)
+            combo_text = hud.widget(
+                "combo", (multiplier, combo_font_size),
+                lambda: self.render_text_cached(FONTS.get(combo_font_size), f"COMBO x{multiplier}!", COMBO_COLOR)
+            )
             screen.blit(combo_text, (WIDTH // 2 - combo_text.get_width() // 2, 20))
 
             # Screen edge glow for high combos
             if self.combo >= 3:
                 edge_alpha = int(50 + 30 * (self.combo / len(COMBO_MULTIPLIERS)))
-                edge_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+                # Snap to one of a few pre-rendered intensity levels
+                row_alphas = edge_glow_row_alphas(edge_glow_level(edge_alpha))
                 # Top and bottom edges
-                for i in range(COMBO_EDGE_GLOW_STEPS):
-                    alpha = max(0, min(255, int(edge_alpha * (1.0 - i / 10.0))))
-                    pygame.draw.rect(edge_surface, (255, 255, 100, alpha), (0, i * 2, WIDTH, 2))
-                    pygame.draw.rect(edge_surface, (255, 255, 100, alpha), (0, HEIGHT - i * 2, WIDTH, 2))
-                screen.blit(edge_surface, (0, 0))
+                top_band = EDGE_GLOW_SPRITES.get(
+                    ("top", row_alphas), lambda: _render_edge_glow("top", row_alphas)
+                )
+                bottom_band = EDGE_GLOW_SPRITES.get(
+                    ("bottom", row_alphas), lambda: _render_edge_glow("bottom", row_alphas)
+                )
+                screen.blit(top_band, (0, 0))
+                screen.blit(bottom_band, (0, HEIGHT - bottom_band.get_height()))
 
         # Draw active power-ups with progress bars
         y_offset = 120
-        powerup_bar_width = 150
-        powerup_bar_height = 8
-
-        # Helper function to draw power-up with progress bar
-        def draw_powerup_with_bar(name, timer, max_timer, color, y_pos):
-            # Text
-            text = self.small_font.render(
-                f"{name}: {timer // FPS}s", True, color
-            )
-            screen.blit(text, (20, y_pos))
-
-            # Progress bar background
-            bar_x = 20
-            bar_y = y_pos + 20
-            pygame.draw.rect(screen, (50, 50, 50), (bar_x, bar_y, powerup_bar_width, powerup_bar_height))
-
-            # Progress bar fill
-            progress = timer / max_timer
-            fill_width = int(powerup_bar_width * progress)
-            pygame.draw.rect(screen, color, (bar_x, bar_y, fill_width, powerup_bar_height))
-
-            # Progress bar border
-            pygame.draw.rect(screen, (200, 200, 200), (bar_x, bar_y, powerup_bar_width, powerup_bar_height), 1)
-
-            return y_pos + 35
-
-        if self.powerup_manager.is_active("rapid_fire"):
-            y_offset = draw_powerup_with_bar(
-                "Rapid Fire",
-                self.powerup_manager.get_timer('rapid_fire'),
-                POWERUP_DURATION * 2,
-                POWERUP_COLORS["rapid_fire"],
-                y_offset
-            )
-
-        if self.powerup_manager.is_active("spread_shot"):
-            y_offset = draw_powerup_with_bar(
-                "Spread Shot",
-                self.powerup_manager.get_timer('spread_shot'),
-                POWERUP_DURATION * 2,
-                POWERUP_COLORS["spread_shot"],
-                y_offset
-            )
-
-        if self.powerup_manager.is_active("shield"):
-            y_offset = draw_powerup_with_bar(
-                "Shield",
-                self.powerup_manager.get_timer('shield'),
-                SHIELD_DURATION * 2,
-                POWERUP_COLORS["shield"],
-                y_offset
-            )
-
-        if self.powerup_manager.is_active("double_damage"):
-            y_offset = draw_powerup_with_bar(
-                "Double Damage",
-                self.powerup_manager.get_timer('double_damage'),
-                POWERUP_DURATION * 2,
-                POWERUP_COLORS["double_damage"],
-                y_offset
-            )
-
-        if self.powerup_manager.is_active("magnet"):
-            y_offset = draw_powerup_with_bar(
-                "Magnet",
-                self.powerup_manager.get_timer('magnet'),
-                POWERUP_DURATION * 2,
-                POWERUP_COLORS["magnet"],
-                y_offset
-            )
-
-        if self.powerup_manager.is_active("time_slow"):
-            y_offset = draw_powerup_with_bar(
-                "Time Slow",
-                self.powerup_manager.get_timer('time_slow'),
-                POWERUP_DURATION * 2,
-                POWERUP_COLORS["time_slow"],
-                y_offset
+        for powerup_type, label, max_timer in HUD_POWERUP_BARS:
+            if not self.powerup_manager.is_active(powerup_type):
+                continue
+            timer = self.powerup_manager.get_timer(powerup_type)
+            fill_width = int(HUD_POWERUP_BAR_WIDTH * timer / max_timer)
+            powerup_widget = hud.widget(
+                powerup_type, (timer // FPS, fill_width),
+                lambda: self._render_powerup_widget(label, timer, fill_width, POWERUP_COLORS[powerup_type])
             )
+            screen.blit(powerup_widget, (20, y_offset))
+            y_offset += 35
 
         # Draw boss health bar
         if self.boss:
-            # Health bar background
             bar_x = (WIDTH - BOSS_HEALTHBAR_WIDTH) // 2
             bar_y = 60
-            pygame.draw.rect(
-                screen,
-                (50, 50, 50),
-                (bar_x, bar_y, BOSS_HEALTHBAR_WIDTH, BOSS_HEALTHBAR_HEIGHT),
-            )
-
-            # Health bar fill
-            health_ratio = self.boss.health / self.boss.max_health
-            health_width = int(BOSS_HEALTHBAR_WIDTH * health_ratio)
-            health_color = (255, int(255 * health_ratio), int(255 * health_ratio))
-            pygame.draw.rect(
-                screen,
-                health_color,
-                (bar_x, bar_y, health_width, BOSS_HEALTHBAR_HEIGHT),
-            )
-
-            # Health bar border
-            pygame.draw.rect(
-                screen,
-                (255, 255, 255),
-                (bar_x, bar_y, BOSS_HEALTHBAR_WIDTH, BOSS_HEALTHBAR_HEIGHT),
-                2,
-            )
-
-            # Boss label
-            boss_label = self.font.render("BOSS", True, BOSS_COLOR)
-            screen.blit(boss_label, (bar_x - boss_label.get_width() - 10, bar_y - 5))
-
-            # Health text
-            health_text = self.small_font.render(
-                f"{self.boss.health}/{self.boss.max_health}", True, TEXT_COLOR
+            boss_widget = hud.widget(
+                "boss_health", (self.boss.health, self.boss.max_health),
+                lambda: self._render_boss_health_widget(self.boss.health, self.boss.max_health)
             )
+            # Widget includes the "BOSS" label to the left of the bar
             screen.blit(
-                health_text,
-                (
-                    bar_x + BOSS_HEALTHBAR_WIDTH // 2 - health_text.get_width() // 2,
-                    bar_y + 2,
-                ),
+                boss_widget,
+                (bar_x + BOSS_HEALTHBAR_WIDTH - boss_widget.get_width(), bar_y - 5)
             )
 
         # Draw boss warning
         if self.boss_warning:
-            warning_alpha = int(200 * abs(math.sin(self.boss_warning_timer / 10)))
-            warning_surface = pygame.Surface((WIDTH, 100), pygame.SRCALPHA)
-            warning_text = self.font.render(
-                "WARNING! BOSS APPROACHING!", True, (255, 0, 0, warning_alpha)
+            # Font rendering ignores color alpha, so the text is drawn solid
+            warning_text = self.render_text_cached(
+                self.font, "WARNING! BOSS APPROACHING!", (255, 0, 0)
             )
-            warning_surface.blit(
-                warning_text, (WIDTH // 2 - warning_text.get_width() // 2, 40)
+            screen.blit(
+                warning_text, (WIDTH // 2 - warning_text.get_width() // 2, HEIGHT // 2 - 10)
             )
-            screen.blit(warning_surface, (0, HEIGHT // 2 - 50))
 
         # Draw controls
-        controls_text = self.small_font.render(
-            "WASD/Arrows: Move | SPACE: Shoot | ESC: Pause", True, TEXT_COLOR
+        controls_text = hud.widget(
+            "controls", None,
+            lambda: self.render_text_cached(
+                self.small_font, "WASD/Arrows: Move | SPACE: Shoot | ESC: Pause", TEXT_COLOR
+            )
         )
         screen.blit(controls_text, (20, HEIGHT - 40))
 
+    def _render_powerup_widget(self, label, timer, fill_width, color):
+        """Render a power-up HUD widget: remaining seconds and a progress bar.
+
+        Args:
+            label: Display name of the power-up
+            timer: Remaining frames
+            fill_width: Filled width of the progress bar in pixels
+            color: RGB power-up color
+
+        Returns:
+            SRCALPHA surface with the text at the top and the bar below it
+        """
+        text = glyph_atlas(self.small_font, color).render(f"{label}: ", timer // FPS, "s")
+        widget = pygame.Surface(
+            (max(text.get_width(), HUD_POWERUP_BAR_WIDTH), 20 + HUD_POWERUP_BAR_HEIGHT),
+            pygame.SRCALPHA
+        )
+        widget.blit(text, (0, 0))
+
+        # Progress bar background, fill and border
+        bar_rect = (0, 20, HUD_POWERUP_BAR_WIDTH, HUD_POWERUP_BAR_HEIGHT)
+        pygame.draw.rect(widget, (50, 50, 50), bar_rect)
+        pygame.draw.rect(widget, color, (0, 20, fill_width, HUD_POWERUP_BAR_HEIGHT))
+        pygame.draw.rect(widget, (200, 200, 200), bar_rect, 1)
+        return widget
+
+    def _render_boss_health_widget(self, health, max_health):
+        """Render the boss health bar with its "BOSS" label and health text.
+
+        Args:
+            health: Current boss health
+            max_health: Maximum boss health
+
+        Returns:
+            SRCALPHA surface with the label on the left and the bar on the right
+        """
+        boss_label = self.render_text_cached(self.font, "BOSS", BOSS_COLOR)
+        bar_x = boss_label.get_width() + 10
+        bar_y = 5
+        widget = pygame.Surface(
+            (bar_x + BOSS_HEALTHBAR_WIDTH, max(boss_label.get_height(), bar_y + BOSS_HEALTHBAR_HEIGHT)),
+            pygame.SRCALPHA
+        )
+        widget.blit(boss_label, (0, 0))
+
+        # Health bar background
+        pygame.draw.rect(
+            widget,
+            (50, 50, 50),
+            (bar_x, bar_y, BOSS_HEALTHBAR_WIDTH, BOSS_HEALTHBAR_HEIGHT),
+        )
+
+        # Health bar fill
+        health_ratio = health / max_health
+        health_width = int(BOSS_HEALTHBAR_WIDTH * health_ratio)
+        health_color = (255, int(255 * health_ratio), int(255 * health_ratio))
+        pygame.draw.rect(
+            widget,
+            health_color,
+            (bar_x, bar_y, health_width, BOSS_HEALTHBAR_HEIGHT),
+        )
+
+        # Health bar border
+        pygame.draw.rect(
+            widget,
+            (255, 255, 255),
+            (bar_x, bar_y, BOSS_HEALTHBAR_WIDTH, BOSS_HEALTHBAR_HEIGHT),
+            2,
+        )
+
+        # Health text
+        health_text = glyph_atlas(self.small_font, TEXT_COLOR).render(health, "/", max_health)
+        widget.blit(
+            health_text,
+            (bar_x + BOSS_HEALTHBAR_WIDTH // 2 - health_text.get_width() // 2, bar_y + 2),
+        )
+        return widget
+
     def draw_pause(self, screen):
         """Draw pause overlay with menu."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 180))
+        overlay = self.render_targets.overlay((0, 0, 0, 180))
         screen.blit(overlay, (0, 0))
 
         # Pause text
-        pause_text = self.large_font.render("PAUSED", True, PAUSE_COLOR)
+        pause_text = self.render_text_cached(self.large_font, "PAUSED", PAUSE_COLOR)
         screen.blit(
             pause_text, (WIDTH // 2 - pause_text.get_width() // 2, HEIGHT // 2 - 100)
         )
@@ -3556,18 +5334,18 @@ class Game:
             # Highlight selected option
             if i == self.pause_selected:
                 color = COMBO_COLOR
-                text = self.large_font.render(f"> {option} <", True, color)
+                text = self.render_text_cached(self.large_font, f"> {option} <", color)
             else:
                 color = TEXT_COLOR
-                text = self.font.render(option, True, color)
+                text = self.render_text_cached(self.font, option, color)
 
             text_x = WIDTH // 2 - text.get_width() // 2
             text_y = menu_start_y + i * 60
             screen.blit(text, (text_x, text_y))
 
         # Controls hint
-        controls_text = self.small_font.render(
-            "W/S or Up/Down Arrow Keys • ENTER to select • ESC to resume", True, TEXT_COLOR
+        controls_text = self.render_text_cached(
+            self.small_font, "W/S or Up/Down Arrow Keys • ENTER to select • ESC to resume", TEXT_COLOR
         )
         screen.blit(
             controls_text, (WIDTH // 2 - controls_text.get_width() // 2, HEIGHT - 80)
@@ -0,0 +1,196 @@
+"""Randomized equivalence tests for the batched collision path.
+
+Game.check_collisions runs box_overlaps/circle_overlaps over column lists
+and spatial-hash candidates instead of calling the per-object
+collides_with_* methods. These tests check on random scenes that both
+paths agree exactly.
+"""
+
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+
+import pytest  # noqa: E402
+
+import main  # noqa: E402
+
+TRIALS = 400
+
+
+@pytest.fixture
+def game():
+    """A fresh game instance, needed for fonts, sprites, a ship and entity pools."""
+    return main.Game()
+
+
+def random_asteroid(rng, make=main.Asteroid):
+    """Return an asteroid with random size, position and rotation.
+
+    Args:
+        rng: random.Random supplying the asteroid's placement
+        make: Constructor or pool acquire taking (x, y, radius)
+    """
+    asteroid = make(
+        rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT),
+        rng.randint(main.ASTEROID_MIN_RADIUS, main.ASTEROID_MAX_RADIUS)
+    )
+    asteroid.angle = rng.uniform(0, 360)
+    return asteroid
+
+
+def assert_pool_invariants(game):
+    """Check every pool's live count matches its list and no instance is in both."""
+    live_lists = (
+        (game.laser_pool, game.lasers),
+        (game.asteroid_pool, game.asteroids),
+        (game.explosion_pool, game.explosions),
+        (game.powerup_pool, game.powerups),
+        (game.score_popup_pool, game.score_popups),
+    )
+    for pool, live in live_lists:
+        assert pool.live == len(live), pool.name
+        ids = [id(obj) for obj in live] + [id(obj) for obj in pool.free]
+        assert len(ids) == len(set(ids)), pool.name
+
+
+def test_box_overlaps_matches_laser_asteroid():
+    """Bounding boxes plus the mask stage reproduce Laser.collides_with_asteroid."""
+    random.seed(1)
+    rng = random.Random(1)
+    asteroids = [random_asteroid(rng) for _ in range(40)]
+    reach = [asteroid.bounding_radius for asteroid in asteroids]
+    lefts = [asteroid.x - r for asteroid, r in zip(asteroids, reach)]
+    rights = [asteroid.x + r for asteroid, r in zip(asteroids, reach)]
+    tops = [asteroid.y - r for asteroid, r in zip(asteroids, reach)]
+    bottoms = [asteroid.y + r for asteroid, r in zip(asteroids, reach)]
+    for _ in range(TRIALS):
+        laser = main.Laser(rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT))
+        left, top, right, bottom = laser.get_rect()
+        hits = [
+            j for j in main.box_overlaps(
+                lefts, tops, rights, bottoms, left, top, right, bottom, range(len(asteroids))
+            )
+            if asteroids[j].mask_overlaps(main.LASER_MASK, left, top)
+        ]
+        expected = [j for j, asteroid in enumerate(asteroids) if laser.collides_with_asteroid(asteroid)]
+        assert hits == expected
+
+
+def test_box_overlaps_matches_laser_boss():
+    """Laser rects against the boss box reproduce Laser.collides_with_boss."""
+    rng = random.Random(2)
+    boss = main.Boss()
+    for _ in range(TRIALS):
+        boss.x, boss.y = rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT)
+        lasers = [
+            main.Laser(rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT)) for _ in range(30)
+        ]
+        rects = [laser.get_rect() for laser in lasers]
+        hits = main.box_overlaps(
+            [rect[0] for rect in rects], [rect[1] for rect in rects],
+            [rect[2] for rect in rects], [rect[3] for rect in rects],
+            boss.x - boss.radius, boss.y - boss.radius, boss.x + boss.radius, boss.y + boss.radius,
+            range(len(lasers)),
+        )
+        assert hits == [i for i, laser in enumerate(lasers) if laser.collides_with_boss(boss)]
+
+
+def test_circle_overlaps_matches_asteroid_ship(game):
+    """Bounding circles plus the mask stage reproduce Asteroid.collides_with_ship."""
+    random.seed(3)
+    rng = random.Random(3)
+    ship = game.ship
+    asteroids = [random_asteroid(rng) for _ in range(40)]
+    xs = [asteroid.x for asteroid in asteroids]
+    ys = [asteroid.y for asteroid in asteroids]
+    radii = [asteroid.bounding_radius for asteroid in asteroids]
+    for _ in range(TRIALS):
+        ship.x, ship.y = rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT)
+        ship_x, ship_y = ship.get_center()
+        ship_mask, ship_left, ship_top = ship.get_mask()
+        hits = [
+            j for j in main.circle_overlaps(
+                xs, ys, radii, ship_x, ship_y, ship.get_bounding_radius(), range(len(asteroids))
+            )
+            if asteroids[j].mask_overlaps(ship_mask, ship_left, ship_top)
+        ]
+        assert hits == [j for j, asteroid in enumerate(asteroids) if asteroid.collides_with_ship(ship)]
+
+
+def test_circle_overlaps_matches_powerup_and_boss_ship(game):
+    """Circle columns reproduce PowerUp.collides_with_ship and Boss.collides_with_ship."""
+    rng = random.Random(4)
+    ship = game.ship
+    boss = main.Boss()
+    powerups = [
+        main.PowerUp(rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT), rng.choice(main.POWERUP_TYPES_ALL))
+        for _ in range(40)
+    ]
+    xs = [powerup.x for powerup in powerups]
+    ys = [powerup.y for powerup in powerups]
+    sizes = [powerup.size for powerup in powerups]
+    for _ in range(TRIALS):
+        ship.x, ship.y = rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT)
+        boss.x, boss.y = rng.uniform(0, main.WIDTH), rng.uniform(0, main.HEIGHT)
+        ship_x, ship_y = ship.get_center()
+        ship_radius = ship.width // 2
+        hits = main.circle_overlaps(xs, ys, sizes, ship_x, ship_y, ship_radius, range(len(powerups)))
+        assert hits == [i for i, powerup in enumerate(powerups) if powerup.collides_with_ship(ship)]
+        boss_hit = main.circle_overlaps((boss.x,), (boss.y,), (boss.radius,), ship_x, ship_y, ship_radius, (0,))
+        assert bool(boss_hit) == boss.collides_with_ship(ship)
+
+
+def test_spatial_hash_candidates_cover_every_overlap():
+    """Grid queries never drop a box that overlaps the query box."""
+    rng = random.Random(5)
+    grid = main.SpatialHash(main.WIDTH, main.HEIGHT, main.SPATIAL_HASH_CELL_SIZE)
+    boxes = []
+    for index in range(200):
+        # Include boxes hanging off the play field
+        left, top = rng.uniform(-100, main.WIDTH), rng.uniform(-100, main.HEIGHT)
+        box = (left, top, left + rng.uniform(1, 120), top + rng.uniform(1, 120))
+        boxes.append(box)
+        grid.insert(index, *box)
+    for _ in range(TRIALS):
+        left, top = rng.uniform(-50, main.WIDTH), rng.uniform(-50, main.HEIGHT)
+        query = (left, top, left + rng.uniform(1, 80), top + rng.uniform(1, 80))
+        candidates = grid.query(*query)
+        assert candidates == sorted(set(candidates))
+        columns = [list(column) for column in zip(*boxes)]
+        assert main.box_overlaps(*columns, *query, candidates) == main.box_overlaps(
+            *columns, *query, range(len(boxes))
+        )
+
+
+def test_check_collisions_matches_per_object_reference():
+    """A whole laser-asteroid pass removes exactly what the per-object checks hit."""
+    for seed in range(20):
+        game = main.Game()
+        # Start from an empty field; check_collisions releases what it removes
+        game.asteroid_pool.release_all(game.asteroids)
+        random.seed(seed)
+        rng = random.Random(seed)
+        asteroids = [random_asteroid(rng, game.asteroid_pool.acquire) for _ in range(main.MAX_ASTEROIDS)]
+        lasers = [
+            game.laser_pool.acquire(rng.uniform(150, main.WIDTH), rng.uniform(0, main.HEIGHT))
+            for _ in range(60)
+        ]
+        hit_lasers = {id(laser) for laser in lasers if any(laser.collides_with_asteroid(a) for a in asteroids)}
+        hit_asteroids = {id(a) for a in asteroids if any(laser.collides_with_asteroid(a) for laser in lasers)}
+
+        game.asteroids.extend(asteroids)
+        game.lasers.extend(lasers)
+        # Keep the ship clear of the scene so only laser hits remove asteroids
+        game.ship.x, game.ship.y = -400, -400
+        game.check_collisions()
+
+        assert [id(laser) for laser in game.lasers] == [
+            id(laser) for laser in lasers if id(laser) not in hit_lasers
+        ]
+        survivors = [id(a) for a in game.asteroids if any(a is original for original in asteroids)]
+        assert survivors == [id(a) for a in asteroids if id(a) not in hit_asteroids]
+        assert_pool_invariants(game)